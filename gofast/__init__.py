@@ -31,13 +31,6 @@ if not __package__:
     __package__ = 'gofast'
 
 
-# Dynamic import to reduce initial load time
-def lazy_import(module_name, global_name=None):
-    if global_name is None:
-        global_name = module_name
-    import importlib
-    globals()[global_name] = importlib.import_module(module_name)
-
 # Generate version
 try:
     from ._version import version
@@ -45,7 +38,9 @@ try:
 except ImportError:
     __version__ = "0.1.0"
 
-# Check and import main dependencies lazily
+# Check the main dependencies without importing them: they are imported
+# on the first access of ``gofast.<dependency>`` or by the subpackages
+# that need them, see ``__getattr__`` below.
 _main_dependencies = {
     "numpy": None,
     "scipy": None,
@@ -56,21 +51,50 @@ _main_dependencies = {
     "tqdm":None,
 }
 
-_missing_dependencies = []
+def _check_dependencies():
+    from importlib.util import find_spec
+    missing = []
+    for module, import_name in _main_dependencies.items():
+        try:
+            if find_spec(import_name or module) is None:
+                missing.append(f"{module}: No module named {import_name or module!r}")
+        except (ImportError, ValueError) as e:
+            missing.append(f"{module}: {e}")
+    return missing
 
-for module, import_name in _main_dependencies.items():
-    try:
-        lazy_import(module if not import_name else import_name, module)
-    except ImportError as e:
-        _missing_dependencies.append(f"{module}: {e}")
+_missing_dependencies = _check_dependencies()
 
 if _missing_dependencies:
     raise ImportError("Unable to import required dependencies:\n" + "\n".join(
         _missing_dependencies))
 
-
-# Set a default LOG_PATH if it's not already set
-os.environ.setdefault('LOG_PATH', os.path.join(package_dir, 'gflogs'))
+# Subpackages and modules are imported on first access (PEP 562), so that
+# ``import gofast`` does not pull matplotlib, seaborn or scikit-learn in.
+from ._lazyload import attach as _attach
+
+_submodules = [
+    "analysis", "datasets", "geo", "models", "plot", "stats", "tools",
+    "base", "estimators", "metrics", "transformers", "exceptions",
+]
+_getattr_submodule, _dir_submodules = _attach(__name__, _submodules)
+
+def __getattr__(name):
+    if name in _main_dependencies:
+        import importlib
+        module = importlib.import_module(_main_dependencies[name] or name)
+        globals()[name] = module
+        return module
+    return _getattr_submodule(name)
+
+def __dir__():
+    return sorted(set(_dir_submodules()).union(_main_dependencies))
+
+
+# Set a default LOG_PATH if it's not already set. The logs go to the user
+# cache directory since the installed package may be read-only.
+os.environ.setdefault('LOG_PATH', os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'), 'gofast', 'logs'))
 
 # Import the logging setup function from _gofastlog.py
 from ._gofastlog import gofastlog
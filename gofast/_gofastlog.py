@@ -79,8 +79,27 @@ class gofastlog:
             print(f"Loading YAML config from {full_path}")
 
         with open(full_path, "rt") as f:
-            config = yaml.safe_load(f.read())
-            
+            # resolve the ${LOG_PATH} placeholders of the handlers
+            config = yaml.safe_load(
+                Template(f.read()).safe_substitute(os.environ))
+
+        # a log directory that cannot be created (e.g. read-only) must not 
+        # break the import: its file handlers are dropped instead
+        handlers = config.get("handlers", {})
+        for name, handler in list(handlers.items()):
+            if "filename" not in handler:
+                continue
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(
+                    handler["filename"])), exist_ok=True)
+            except OSError:
+                del handlers[name]
+        for logger in [config.get("root", {}), *config.get(
+                "loggers", {}).values()]:
+            if "handlers" in logger:
+                logger["handlers"] = [
+                    name for name in logger["handlers"] if name in handlers]
+
         logging.config.dictConfig(config)
 
     @staticmethod
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""
+Lazy loading of the subpackages and of their public symbols.
+
+The package ``__init__`` files declare which module provides each public
+name, and :func:`attach` returns the module level ``__getattr__`` and
+``__dir__`` (:pep:`562`) that import the providing module on the first
+access of a name. ``import gofast.plot`` is then cheap, and matplotlib or
+seaborn are imported only when a plotting function is actually used.
+"""
+
+import importlib
+
+__all__ = ["attach"]
+
+def attach(package_name, submodules=(), submod_attrs=None):
+    """
+    Build the lazy ``__getattr__`` and ``__dir__`` of a package.
+
+    Parameters
+    ----------
+    package_name : str
+        The ``__name__`` of the package.
+    submodules : iterable of str, optional
+        Submodules exposed as attributes of the package, imported on first
+        access.
+    submod_attrs : dict, optional
+        Maps a submodule name to the public names it provides. A name given
+        as ``'public=source'`` exposes the attribute ``source`` of the
+        submodule under the name ``public``.
+
+    Returns
+    -------
+    __getattr__, __dir__ : callable
+
+    Examples
+    --------
+    >>> __getattr__, __dir__ = attach(
+    ...     __name__, submod_attrs={'utils': ['mean', 'median']})
+    """
+    submodules = list(submodules)
+    attr_to_source = {}
+    for module, names in (submod_attrs or {}).items():
+        for name in names:
+            public, _, source = name.partition("=")
+            attr_to_source[public.strip()] = (module, source.strip() or
+                                              public.strip())
+    public_names = submodules + list(attr_to_source)
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(f"{package_name}.{name}")
+        if name in attr_to_source:
+            module, source = attr_to_source[name]
+            value = getattr(importlib.import_module(
+                f"{package_name}.{module}"), source)
+            # cache the symbol so the next access skips __getattr__
+            setattr(importlib.import_module(package_name), name, value)
+            return value
+        raise AttributeError(
+            f"module {package_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(public_names).union(
+            vars(importlib.import_module(package_name))))
+
+    return __getattr__, __dir__
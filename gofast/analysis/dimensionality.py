@@ -14,7 +14,9 @@ clusters.
 """
 from __future__ import annotations 
 import os
+import tempfile
 import warnings
+import itertools
 import numpy as np
 import pandas as pd 
 from sklearn.decomposition import (
@@ -29,10 +31,12 @@ from .._typing import (
     ArrayLike, 
     NDArray, 
     DataFrame,
+    Iterable, 
     _Sub
     )
 
 from .._gofastlog import gofastlog
+from ..tools._dependency import import_optional_dependency
 
 _logger = gofastlog().get_gofast_logger(__name__)
 
@@ -191,68 +195,44 @@ Examples
 """  
 
 def iPCA(
-    X: NDArray | DataFrame,
+    X: NDArray | DataFrame | str | Iterable[NDArray],
     n_components: float | int =None,
     *, 
     view: bool =False, 
     n_batches: int =None,
+    batch_size: int =None, 
     return_X:bool=True, 
     store_in_binary_file: bool =False,
     filename: Optional[str]=None,
+    dataset: str ='data', 
+    dtype: str ='float32', 
     **ipca_kws
  )-> NDArray| 'iPCA': 
     
     obj = type ('iPCA', (), dict())
-    X0=X.copy()
-    if n_components is None: 
-        n_components= get_most_variance_component(X) 
-        if n_batches is None: 
-            raise TypeError('NoneType can not be a number of batches.')
-        if n_components > (len(X)//n_batches +1): 
-            warnings.warn(f'n_components=`{n_components}` must be less '
-                             'or equal to the batch number of samples='
-                             f'`{len(X0)//n_batches +1}`. n_components is'
-                             f' set to {len(X0)//n_batches}')
-            
-            n_components = len(X)//n_batches
-            _logger.debug(
-                f"n_components is reset to ={len(X0)//n_batches!r}")
-            
-    inc_pcaObj = IncrementalPCA(n_components =n_components, 
-                                **ipca_kws)
-    for X_batch in np.array_split(X0, n_batches):
-        inc_pcaObj.partial_fit(X_batch)
-    
-    X= inc_pcaObj.transform(X0)
-    
-    if store_in_binary_file: 
-        if not (filename or os.path.isfile (filename)): 
-            warnings.warn('Need a binary filename stored in disk of '
-                          'in memory.')
-            _logger.error(
-                'Need a binary filename stored in disk of in memory.')
-            raise FileNotFoundError('None binary filename found.')
-
-        X_mm = np.memmap(filename,
-                         dtype= 'float32',
-                         mode='readonly', 
-                         shape=X0.shape)
-        batch_size = X0.shape[0]//n_batches
-        inc_pcaObj = IncrementalPCA(
-            n_components =n_components,
-            batch_size= batch_size,
-            **ipca_kws)
-        
-        X= inc_pcaObj.fit(X_mm)
+    source, columns, close = _open_ipca_source(X, dataset=dataset)
+    try: 
+        X, inc_pcaObj = _fit_transform_ipca(
+            source, n_components, n_batches=n_batches, 
+            batch_size=batch_size, 
+            return_X=return_X, 
+            # results of out-of-core sources are written to disk too
+            to_disk=(store_in_binary_file or filename is not None 
+                     or not isinstance(source, (np.ndarray, pd.DataFrame))
+                     or isinstance(source, np.memmap)), 
+            filename=filename, dtype=dtype, **ipca_kws
+            )
+    finally: 
+        close() 
         
     obj.X=X # set X attributes 
     make_introspection(obj, inc_pcaObj)
     setattr(obj, 'n_axes', getattr(obj, 'n_components_'))
     # get the features importance and features names
-    if isinstance(X0, pd.DataFrame):
+    if columns is not None:
         pca_components_= getattr(obj, 'components_')
         obj.feature_importances_= find_f_importances(
-                                    np.array(list(X0.columns)), 
+                                    np.array(list(columns)), 
                                     pca_components_, 
                                     obj.n_axes)
     if view : 
@@ -260,6 +240,179 @@ def iPCA(
         
     return X if return_X else obj  
 
+def _open_ipca_source(X, dataset='data'): 
+    """Resolve the training set of :func:`iPCA` without loading it. 
+    
+    Returns the source (an array-like sliced by rows, or an iterable of 
+    chunks), the feature names if any, and a callable closing the 
+    opened file. 
+    """
+    close = lambda: None # noqa 
+    if isinstance(X, (str, os.PathLike)): 
+        path = os.fspath(X)
+        if not os.path.isfile(path): 
+            raise FileNotFoundError(f"No such file: {path!r}")
+        ext = os.path.splitext(path)[1].lower()
+        if ext ==".npy": 
+            # memory-mapped: only the rows of a batch are read
+            return np.load(path, mmap_mode='r'), None, close 
+        if ext in (".h5", ".hdf5", ".hdf"): 
+            h5py = import_optional_dependency(
+                "h5py", extra="h5py is needed to read HDF5 training sets.")
+            f= h5py.File(path, 'r')
+            return f[dataset], None, f.close 
+        raise ValueError(
+            f"Unsupported file {path!r}. Expect a '.npy' file (see"
+            " numpy.save and numpy.lib.format.open_memmap) or an HDF5"
+            " file ('.h5', '.hdf5').")
+        
+    if isinstance(X, pd.DataFrame): 
+        return X, X.columns, close 
+    if hasattr(X, 'shape') and hasattr(X, '__getitem__'): 
+        # ndarray, np.memmap, h5py.Dataset ...
+        return X, None, close 
+    if callable(X) or hasattr(X, '__iter__'): 
+        return X, None, close 
+    
+    raise TypeError("Expect an array, a frame, a '.npy' or HDF5 file path"
+                    f" or an iterable of chunks. Got {type(X).__name__!r}")
+        
+def _iter_ipca_batches(source, batch_size=None, min_size=1): 
+    """Yield the training set by batches of `batch_size` rows. 
+    
+    Array-like sources are sliced, so only one batch is read at a time. 
+    Chunks of an iterable are regrouped to `batch_size` rows, or used as 
+    they come when `batch_size` is ``None``. A last batch smaller than 
+    `min_size` is merged into the previous one since 
+    :meth:`IncrementalPCA.partial_fit` needs at least `n_components` 
+    samples. 
+    """
+    if hasattr(source, 'shape') and hasattr(source, '__getitem__'): 
+        n_samples = source.shape[0]
+        starts = list(range(0, n_samples, batch_size or n_samples or 1))
+        if len(starts) > 1 and n_samples - starts[-1] < min_size: 
+            del starts[-1]
+        for start, stop in zip(starts, starts[1:] + [n_samples]): 
+            batch = (source.iloc[start:stop].to_numpy() 
+                     if isinstance(source, pd.DataFrame) 
+                     else source[start:stop])
+            yield np.asarray(batch)
+        return 
+    
+    chunks = source() if callable(source) else source 
+    pending, buffer, size = None, [], 0 
+    for chunk in chunks: 
+        chunk = np.asarray(chunk)
+        buffer.append(chunk.reshape(1, -1) if chunk.ndim ==1 else chunk)
+        size += len(buffer[-1])
+        while size >= max(batch_size or size, min_size, 1): 
+            block = np.concatenate(buffer) if len(buffer) > 1 else buffer[0]
+            n = batch_size or size 
+            # hold back one batch so that a too small tail can be merged
+            if pending is not None: 
+                yield pending 
+            pending, buffer, size = block[:n], [block[n:]], size - n 
+            if not size: 
+                buffer = []
+                break 
+    if buffer and size: 
+        tail = np.concatenate(buffer)
+        if pending is not None and len(tail) < min_size: 
+            tail = np.concatenate([pending, tail])
+        elif pending is not None: 
+            yield pending 
+        pending = tail 
+    if pending is not None: 
+        yield pending 
+        
+def _fit_transform_ipca(
+    source, n_components, *, n_batches=None, batch_size=None, 
+    return_X=True, to_disk=False, filename=None, dtype='float32', 
+    **ipca_kws
+    ):
+    """Fit an :class:`IncrementalPCA` over the batches of `source` then 
+    transform them one by one. 
+    
+    A one-shot iterator of chunks is spooled to a temporary binary file 
+    during the fit so that it can be transformed afterwards. With 
+    `to_disk`, the result is a memory-mapped ``.npy`` file (`filename`) or 
+    an anonymous temporary file. The memory used is bounded by about two batches. 
+    """
+    n_samples = (source.shape[0] if hasattr(source, 'shape') 
+                 and hasattr(source, '__getitem__') else None)
+    if batch_size is None and n_batches is not None: 
+        if n_samples is None: 
+            raise TypeError(
+                "The number of samples of an iterable of chunks is unknown;"
+                " use 'batch_size' instead of 'n_batches'.")
+        batch_size = -(-n_samples // n_batches)
+    if batch_size is None and n_samples is not None: 
+        # sklearn's default batch size
+        batch_size = 5 * source.shape[1]
+        
+    batches = _iter_ipca_batches(source, batch_size, min_size=(
+        n_components if isinstance(n_components, (int, np.integer)) 
+        else batch_size or 1))
+    first = next(batches, None)
+    if first is None: 
+        raise ValueError("Empty training set.")
+    if n_components is None: 
+        n_components= get_most_variance_component(first) 
+    if n_components > len(first): 
+        warnings.warn(f'n_components=`{n_components}` must be less '
+                      'or equal to the batch number of samples='
+                      f'`{len(first)}`. n_components is set to {len(first)}')
+        n_components = len(first)
+        _logger.debug(f"n_components is reset to ={len(first)!r}")
+        
+    inc_pcaObj = IncrementalPCA(n_components =n_components, **ipca_kws)
+    one_shot = n_samples is None and not callable(source) and iter(
+        source) is source 
+    spool = tempfile.NamedTemporaryFile(
+        prefix='ipca-', suffix='.dat', delete=False) if (
+            one_shot and return_X) else None 
+    n_seen = 0 
+    try: 
+        for X_batch in itertools.chain([first], batches):
+            inc_pcaObj.partial_fit(X_batch)
+            n_seen += len(X_batch)
+            if spool is not None: 
+                spool.write(np.ascontiguousarray(
+                    X_batch, dtype=first.dtype).tobytes())
+        if not return_X: 
+            return None, inc_pcaObj 
+        if spool is not None: 
+            spool.close()
+            source = np.memmap(spool.name, dtype=first.dtype, mode='r', 
+                               shape=(n_seen, first.shape[1]))
+        shape = (n_seen, inc_pcaObj.n_components_)
+        if to_disk and filename is not None: 
+            X = np.lib.format.open_memmap(
+                filename, mode='w+', dtype=dtype, shape=shape)
+        elif to_disk: 
+            # an anonymous file: the map keeps its own handle, and the 
+            # space is released with the last reference to the result
+            with tempfile.TemporaryFile(prefix='ipca-') as tmp: 
+                X = np.memmap(tmp, mode='w+', dtype=dtype, shape=shape)
+        else: 
+            X = np.empty(shape, dtype=np.float64)
+        start = 0 
+        for X_batch in _iter_ipca_batches(source, batch_size): 
+            X[start: start + len(X_batch)] = inc_pcaObj.transform(X_batch)
+            start += len(X_batch)
+        if isinstance(X, np.memmap): 
+            X.flush()
+    finally: 
+        if spool is not None: 
+            spool.close()
+            source = None # release the memmap before removing its file
+            try: 
+                os.remove(spool.name)
+            except OSError: 
+                pass 
+            
+    return X, inc_pcaObj 
+
 iPCA.__doc__="""\
 Incremental PCA 
 
@@ -270,10 +423,17 @@ Once problem with the preceeding implementation of PCA is that
 requires the whole training set to fit in memory in order of the SVD
 algorithm to run. This is usefull for large training sets, and also 
 applying PCA online(i.e, on the fly as a new instance arrive)
+
+The training set is never loaded at once: the estimator is fitted with 
+``partial_fit`` over batches read one after another, then the batches 
+are transformed one by one. Stored on disk (a ``.npy`` or HDF5 file) or 
+given as an iterable of chunks, a training set larger than the memory 
+can be reduced; the memory used is bounded by about two batches.
  
 Parameters 
 -------------
-X:  Ndarray ( M x N matrix where ``M=m-samples``, & ``N=n-features``)
+X:  Ndarray ( M x N matrix where ``M=m-samples``, & ``N=n-features``), \
+    str or iterable of Ndarray 
     Training set; Denotes data that is observed at training and 
     prediction time, used as independent variables in learning. 
     When a matrix, each sample may be represented by a feature vector, 
@@ -281,6 +441,18 @@ X:  Ndarray ( M x N matrix where ``M=m-samples``, & ``N=n-features``)
     sample. :code:`X` may also not be a matrix, and may require a 
     feature extractor or a pairwise metric to turn it into one  before 
     learning a model.
+    
+    Out-of-core training sets can be given as: 
+        
+    - the path of a ``.npy`` file, opened as a read-only memory map. 
+      :func:`numpy.lib.format.open_memmap` writes such a file by parts.
+    - the path of an HDF5 file (``.h5``, ``.hdf5``), whose `dataset` is 
+      read by slices. Needs :mod:`h5py`. 
+    - an array-like sliced by rows such as a :class:`numpy.memmap` or a 
+      :class:`h5py.Dataset`. 
+    - an iterable of 2D chunks, or a callable returning such an iterable. 
+      A one-shot iterator (e.g. a generator) is spooled to a temporary 
+      binary file while fitting so that it can be transformed afterwards.
 
 n_components: int, optional 
     Number of dimension to preserve. If`n_components` is ranged between 
@@ -289,16 +461,31 @@ n_components: int, optional
     ``95%``.
     
 n_batches: int, optional
-    Number of batches to split the training set.
+    Number of batches to split the training set. Not available for an 
+    iterable of chunks whose length is unknown. 
+    
+batch_size: int, optional 
+    Number of samples of a batch. Takes precedence over `n_batches`. 
+    When both are ``None``, array-likes are split in batches of 
+    ``5 * n_features`` samples and the chunks of an iterable are used 
+    as they come. 
 
 store_in_binary_file: bool, default=False 
-    Alternatively, we used numpy` memmap` class to manipulate a large 
-    array stored in a binary file on disk as if it were entirely in 
-    memory. The class load only the data it need in memory when it need
-    its.
+    Write the transformed training set in a binary ``.npy`` file on disk, 
+    batch by batch, and return it as a :class:`numpy.memmap`. This is 
+    always the case for the out-of-core training sets (file paths, 
+    memory maps and iterables of chunks). 
 
 filename: str,optional 
-    Default binary filename to store in a binary file in  a disk.
+    The ``.npy`` file of the transformed training set. Implies 
+    `store_in_binary_file`. Defaults to an anonymous temporary file, 
+    removed once the returned memory map is released. 
+    
+dataset: str, default='data' 
+    Name of the dataset of an HDF5 training set. 
+    
+dtype: str, default='float32' 
+    Data type of the transformed training set written on disk. 
     
 return_X: bool, default =True , 
     return the train set transformed with most representative varaince 
@@ -323,6 +510,16 @@ Examples
 >>> from gofast.datasets import fetch_data 
 >>> X, _=fetch_data('Bagoue analysed data')
 >>> Xtransf = iPCA(X,n_components=None,n_batches=100, view=True)
+
+Reduce a training set stored on disk, whose transformed samples are 
+written in ``X_reduced.npy``: 
+
+>>> import numpy as np 
+>>> np.save ('X.npy', np.random.randn (100_000, 30)) 
+>>> Xr = iPCA('X.npy', n_components=5, batch_size=10_000, 
+...           filename='X_reduced.npy')
+>>> Xr.shape 
+(100000, 5)
 """
 
 def kPCA(
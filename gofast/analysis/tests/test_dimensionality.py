@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# test_dimensionality.py
+import os
+import tempfile
+import pytest
+import numpy as np
+from sklearn.decomposition import IncrementalPCA
+from gofast.analysis.dimensionality import iPCA
+
+@pytest.fixture
+def X():
+    rng = np.random.default_rng(0)
+    # a last batch of 2 samples, shorter than n_components, with batches
+    # of 30 samples
+    return rng.normal(size=(152, 8)) @ rng.normal(size=(8, 8))
+
+def _expected(X, n_components=5, batch_size=30):
+    return IncrementalPCA(n_components=n_components,
+                          batch_size=batch_size).fit_transform(X)
+
+def _chunks(X, sizes=(7, 41, 3, 19)):
+    start, k = 0, 0
+    while start < len(X):
+        stop = start + sizes[k % len(sizes)]
+        yield X[start:stop]
+        start, k = stop, k + 1
+
+def test_ipca_array(X):
+    Xr = iPCA(X, n_components=5, batch_size=30)
+    assert not isinstance(Xr, np.memmap)
+    np.testing.assert_allclose(Xr, _expected(X), atol=1e-10)
+    # n_batches gives the batch size
+    np.testing.assert_allclose(
+        iPCA(X, n_components=5, n_batches=4),
+        _expected(X, batch_size=38), atol=1e-10)
+
+def test_ipca_return_object(X):
+    obj = iPCA(X, n_components=3, batch_size=30, return_X=False)
+    ipca = IncrementalPCA(n_components=3, batch_size=30).fit(X)
+    assert obj.n_axes == 3
+    np.testing.assert_allclose(obj.components_, ipca.components_, atol=1e-10)
+    np.testing.assert_allclose(obj.explained_variance_ratio_,
+                               ipca.explained_variance_ratio_)
+
+def test_ipca_npy_file(X, tmp_path):
+    np.save(tmp_path / "X.npy", X)
+    Xr = iPCA(str(tmp_path / "X.npy"), n_components=5, batch_size=30,
+              filename=str(tmp_path / "Xr.npy"))
+    assert isinstance(Xr, np.memmap) and Xr.dtype == np.float32
+    np.testing.assert_allclose(Xr, _expected(X), rtol=1e-5, atol=1e-5)
+    np.testing.assert_array_equal(np.load(tmp_path / "Xr.npy"), Xr)
+
+@pytest.mark.parametrize("as_callable", [False, True])
+def test_ipca_chunks(X, as_callable, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    # the chunks are regrouped in batches of 30 samples, and the small
+    # tail is merged in the last batch
+    chunks = (lambda: _chunks(X)) if as_callable else _chunks(X)
+    Xr = iPCA(chunks, n_components=5, batch_size=30)
+    assert isinstance(Xr, np.memmap) and Xr.shape == (152, 5)
+    np.testing.assert_allclose(Xr, _expected(X), rtol=1e-5, atol=1e-5)
+    # neither the spooled chunks nor the result leave a file behind
+    assert not os.listdir(tmp_path)
+
+def test_ipca_hdf5(X, tmp_path):
+    h5py = pytest.importorskip("h5py")
+    with h5py.File(tmp_path / "X.h5", "w") as f:
+        f.create_dataset("survey", data=X)
+    Xr = iPCA(str(tmp_path / "X.h5"), n_components=5, batch_size=30,
+              dataset="survey")
+    np.testing.assert_allclose(Xr, _expected(X), rtol=1e-5, atol=1e-5)
+
+def test_ipca_errors(X):
+    with pytest.raises(TypeError):
+        iPCA(_chunks(X), n_components=5, n_batches=4)
+    with pytest.raises(FileNotFoundError):
+        iPCA("no_such_file.npy", n_components=5)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""
+On-disk cache of the processed results of the dataset loaders.
+
+Each call of a cached loader is keyed by the loader name, its bound
+arguments, the gofast version and a checksum of the source data files.
+The result is written once with :func:`joblib.dump` under
+``<data home>/cache/datasets`` and read back with
+``joblib.load(mmap_mode='c')``: the numeric blocks of the frames and arrays
+are memory-mapped copy-on-write, so a cache hit costs a few page faults
+instead of parsing, casting and encoding the source again, and the
+returned objects can still be modified freely.
+
+Editing or replacing a source file changes its checksum, which selects a
+new entry; the stale entries of the same call are removed when the new
+one is written.
+"""
+
+import os
+import glob
+import hashlib
+import inspect
+import warnings
+import functools
+from importlib import resources
+
+import numpy as np
+import pandas as pd
+from joblib import dump, load, hash as joblib_hash
+
+from .. import __version__ as _gofast_version
+from ..tools.box import Boxspace
+from .io import get_data, DMODULE
+
+__all__ = ["cached_loader", "clear_cache", "get_cache_dir"]
+
+# set to '0', 'false' or 'no' to disable the cache by default
+_CACHE_ENV = "GOFAST_DATASETS_CACHE"
+_CACHEABLE_TYPES = (Boxspace, pd.DataFrame, pd.Series, np.ndarray)
+# in-process memo of the source checksums, keyed by path, size and mtime
+_CHECKSUMS = {}
+
+def get_cache_dir(data_home=None):
+    """
+    Return the directory of the dataset cache, creating it if needed.
+
+    Parameters
+    ----------
+    data_home : str, optional
+        The gofast data directory. Defaults to :func:`gofast.datasets.io.get_data`.
+
+    Returns
+    -------
+    cache_dir : str
+        ``<data home>/cache/datasets``.
+    """
+    cache_dir = os.path.join(get_data(data_home), "cache", "datasets")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def clear_cache(loader=None, data_home=None):
+    """
+    Remove the cached results of one loader, or of every loader.
+
+    Parameters
+    ----------
+    loader : str or callable, optional
+        The loader (or its name) whose entries are removed. All entries are
+        removed when omitted.
+    data_home : str, optional
+        The gofast data directory.
+
+    Returns
+    -------
+    n_removed : int
+        The number of removed entries.
+    """
+    if callable(loader):
+        loader = loader.__name__
+    pattern = f"{loader}-*.joblib" if loader else "*.joblib"
+    n_removed = 0
+    for path in glob.glob(os.path.join(get_cache_dir(data_home), pattern)):
+        try:
+            os.remove(path)
+            n_removed += 1
+        except OSError:
+            pass
+    return n_removed
+
+def cached_loader(*data_files, stochastic=None):
+    """
+    Decorate a dataset loader so that its results are cached on disk.
+
+    The decorated loader accepts an extra keyword ``cache``. ``None`` (the
+    default) uses the cache unless the ``GOFAST_DATASETS_CACHE`` environment
+    variable disables it, ``True`` and ``False`` force it on or off.
+
+    Parameters
+    ----------
+    *data_files : str
+        Names of the source files of the loader in the dataset data module.
+        Their checksum is part of the cache key. Missing files (e.g. files
+        downloaded on the first call) are allowed.
+    stochastic : callable, optional
+        Called with the bound arguments of the call; returns True when the
+        result depends on a random draw. Such calls are cached only when
+        their ``seed`` is an integer.
+
+    Returns
+    -------
+    decorator : callable
+    """
+    def decorator(loader):
+        signature = inspect.signature(loader)
+
+        @functools.wraps(loader)
+        def wrapper(*args, cache=None, **kwargs):
+            if not _use_cache(cache):
+                return loader(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            if stochastic is not None and stochastic(arguments):
+                seed = arguments.get("seed")
+                if not isinstance(seed, (int, np.integer)) or isinstance(
+                        seed, bool):
+                    return loader(*args, **kwargs)
+            try:
+                call_key = joblib_hash((_gofast_version, arguments))
+            except Exception:
+                # unhashable argument, e.g. a lambda
+                return loader(*args, **kwargs)
+
+            prefix = f"{loader.__name__}-{call_key}"
+            path = _entry_path(prefix, data_files)
+            if os.path.isfile(path):
+                try:
+                    return load(path, mmap_mode="c")
+                except Exception:
+                    # truncated or written by an incompatible version
+                    _remove(path)
+
+            result = loader(*args, **kwargs)
+            if _is_cacheable(result):
+                # the source may have been downloaded by the call
+                _write_entry(_entry_path(prefix, data_files), prefix, result)
+            return result
+
+        wrapper.cache_clear = functools.partial(clear_cache, loader.__name__)
+        return wrapper
+
+    return decorator
+
+def _use_cache(cache):
+    """Resolve the `cache` keyword against the environment default."""
+    if cache is not None:
+        return bool(cache)
+    return os.environ.get(_CACHE_ENV, "1").strip().lower() not in (
+        "0", "false", "no", "off")
+
+def _entry_path(prefix, data_files):
+    """Path of the entry of a call for the current state of its sources."""
+    return os.path.join(
+        get_cache_dir(), f"{prefix}-{_sources_checksum(data_files)}.joblib")
+
+def _sources_checksum(data_files):
+    """Checksum of the content of the source files."""
+    digest = hashlib.sha1()
+    for data_file in data_files:
+        digest.update(data_file.encode())
+        with resources.path(DMODULE, data_file) as p:
+            digest.update(_file_checksum(str(p)).encode())
+    return digest.hexdigest()[:16]
+
+def _file_checksum(path):
+    """Content checksum of a file, computed once per file version."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return "missing"
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key not in _CHECKSUMS:
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        _CHECKSUMS[key] = digest.hexdigest()
+    return _CHECKSUMS[key]
+
+def _is_cacheable(result):
+    """Only the data containers returned by the loaders are stored."""
+    if isinstance(result, (tuple, list)):
+        return bool(result) and all(_is_cacheable(r) for r in result)
+    return isinstance(result, _CACHEABLE_TYPES)
+
+def _write_entry(path, prefix, result):
+    """Write the entry atomically and drop the stale ones of the call."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        dump(result, tmp)
+        os.replace(tmp, path)
+    except Exception as error:
+        _remove(tmp)
+        warnings.warn(f"Unable to cache the dataset in {path!r}: {error}")
+        return
+    for stale in glob.glob(os.path.join(os.path.dirname(path),
+                                        f"{prefix}-*.joblib")):
+        if stale != path:
+            _remove(stale)
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -7,6 +7,11 @@ load different data as a function
 =================================
 
 Inspired from the machine learning popular dataset loading 
+
+The processed result of each loader call is cached under the gofast data 
+home and memory-mapped back on the next identical call (see 
+:mod:`gofast.datasets._cache`). Pass ``cache=False`` to a loader, or set 
+the ``GOFAST_DATASETS_CACHE=0`` environment variable, to bypass it.
 """
 import warnings
 import os
@@ -25,6 +30,7 @@ from ..tools.coreutils import  random_sampling, assert_ratio, key_checker
 from ..tools.coreutils import  format_to_datetime, is_in_if, validate_feature
 from ..tools.coreutils import convert_to_structured_format, resample_data
 from ..tools.coreutils import split_train_test_by_id
+from ._cache import cached_loader
 from ._globals import FORENSIC_BF_DICT, FORENSIC_LABELS_DESCR 
 from ._globals import DYSPNEA_DICT, DYSPNEA_LABELS_DESCR
 from .io import csv_data_loader, _to_dataframe, DMODULE 
@@ -34,6 +40,7 @@ __all__= [ "load_iris",  "load_hlogs",  "load_nansha", "load_forensic",
           "load_jrs_bet", "load_statlog", "load_hydro_metrics", "load_mxs"]
 
 
+@cached_loader("hydro_metrics.csv")
 def load_hydro_metrics(*, return_X_y=False, as_frame=False, tag=None, 
                        data_names=None,  **kws):
     """
@@ -156,6 +163,7 @@ def load_hydro_metrics(*, return_X_y=False, as_frame=False, tag=None,
         data_module=DMODULE,
     )
 
+@cached_loader("statlog_heart.csv")
 def load_statlog(*, return_X_y=False, as_frame=False, tag=None, 
                  data_names=None, **kws):
     """
@@ -401,6 +409,7 @@ def load_dyspnea(
         columns_descr=DYSPNEA_DICT
     )
 
+@cached_loader("h.h5")
 def load_hlogs(
     *,
     return_X_y=False,
@@ -595,6 +604,8 @@ To focus on specific targets 'pumping_level' and 'aquifer_thickness':
 ['pumping_level', 'aquifer_thickness']
 """
 
+@cached_loader("nlogs.csv", "nlogs+.csv", "n.npz", stochastic=lambda a: (
+    a["shuffle"] or a["samples"] not in (None, "*")))
 def load_nansha (
     *,  return_X_y=False, 
     as_frame =False, 
@@ -808,6 +819,7 @@ To retrieve land subsidence data for specific years with display rate:
 [easting, northing, longitude, 2015, 2018, disp_rate]
 """
 
+@cached_loader("bagoue.csv")
 def load_bagoue(
         *, return_X_y=False, 
         as_frame=False, 
@@ -933,6 +945,7 @@ array([0, 2, 0])
 ['flow']   
 """
 
+@cached_loader("iris.csv")
 def load_iris(
         *, return_X_y=False, as_frame=False, tag=None, data_names=None, **kws
         ):
@@ -1042,6 +1055,7 @@ array([0, 0, 1])
 ['setosa', 'versicolor', 'virginica']
 """    
    
+@cached_loader("mxs.joblib", stochastic=lambda a: True)
 def load_mxs (
     *,  return_X_y=False, 
     as_frame =False, 
@@ -1364,6 +1378,7 @@ def _get_subsidence_data (
     return  data,  feature_names, target_columns     
     
 
+@cached_loader("forensic_bf.csv", "forensic_bf+.csv")
 def load_forensic( *, 
     return_X_y=False, 
     as_frame=False, 
@@ -1514,6 +1529,8 @@ forensic_bf+.rst files. These documents provide insights into the dataset's
 creation, structure, and attributes.
 """
 
+@cached_loader("jrs_bet.csv", stochastic=lambda a: (
+    a["split_X_y"] or a["return_X_y"]))
 def load_jrs_bet(
     *, 
     return_X_y=False, 
@@ -15,6 +15,11 @@ from gofast.datasets.load import  load_dyspnea, load_hlogs, load_nansha
 from gofast.datasets.load import load_bagoue, load_iris, load_mxs
 from gofast.datasets.load import load_jrs_bet, load_forensic 
 
+@pytest.fixture(autouse=True)
+def no_dataset_cache(monkeypatch):
+    # the mocked loaders below must not read or feed the on-disk cache
+    monkeypatch.setenv("GOFAST_DATASETS_CACHE", "0")
+
 @patch("gofast.datasets.load._finalize_return")
 @patch("gofast.datasets.load._handle_split_X_y")
 @patch("gofast.datasets.load._prepare_data")
@@ -692,5 +697,27 @@ def approx_length(y, data, operation, test_ratio):
     return expected_len - 7 <= len(y) <= expected_len + 7
     
             
+def test_loader_cache(tmp_path, monkeypatch):
+    import glob, os
+    from gofast.datasets import _cache
+    monkeypatch.setenv("GOFAST_DATA", str(tmp_path))
+    frame = load_iris(as_frame=True, cache=True)
+    entries = glob.glob(os.path.join(_cache.get_cache_dir(), "load_iris-*"))
+    assert len(entries) == 1
+    cached = load_iris(as_frame=True, cache=True)
+    pd.testing.assert_frame_equal(cached, frame)
+    cached.iloc[0, 0] = -1 # copy-on-write: the entry is left untouched
+    pd.testing.assert_frame_equal(load_iris(as_frame=True, cache=True), frame)
+    # a changed source selects a new entry and drops the stale one
+    monkeypatch.setattr(_cache, "_file_checksum", lambda path: "edited")
+    load_iris(as_frame=True, cache=True)
+    new_entries = glob.glob(os.path.join(_cache.get_cache_dir(), "load_iris-*"))
+    assert len(new_entries) == 1 and new_entries != entries
+    # unseeded random draws are never cached
+    load_mxs(cache=True)
+    assert not glob.glob(os.path.join(_cache.get_cache_dir(), "load_mxs-*"))
+    assert _cache.clear_cache() == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -5,10 +5,12 @@
 from __future__ import annotations 
 import re  
 import inspect 
+import warnings 
 from numbers import Integral, Real
 from collections import defaultdict
-from scipy import stats
 import numpy as np
+from joblib import Parallel, delayed
+from numpy.lib.stride_tricks import sliding_window_view
 
 from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin, clone
 from sklearn.base import is_regressor, is_classifier 
@@ -19,7 +21,7 @@ from sklearn.pipeline import _name_estimators
 from sklearn.preprocessing import LabelEncoder, LabelBinarizer
 from sklearn.tree import DecisionTreeRegressor, DecisionTreeClassifier
 from sklearn.metrics import r2_score
-from sklearn.utils import shuffle
+from sklearn.utils import shuffle, gen_batches
 try:from sklearn.utils import type_of_target
 except: from .tools.coreutils import type_of_target 
 
@@ -735,6 +737,22 @@ class DecisionStumpRegressor:
     the samples in each of these two sets.
 
     The algorithm selects the feature and threshold that yield the lowest MSE.
+    
+    Rather than recomputing the means for each threshold, both sums are 
+    obtained for all thresholds of all features at once from the 
+    cumulative sums of `y` taken along the sorted feature values. When 
+    `max_bins` is given, the features are first discretized into quantile 
+    bins and only the bin edges are considered as thresholds, which makes 
+    the search linear in the number of samples.
+    
+    Parameters
+    ----------
+    max_bins : int, optional 
+        Maximum number of quantile bins used to discretize each feature 
+        before searching the split. Only the bin edges are evaluated as 
+        candidate thresholds. If ``None`` (default) or if the number of 
+        samples does not exceed `max_bins`, all the unique values are 
+        evaluated and the exact best split is returned.
 
     Attributes
     ----------
@@ -765,9 +783,13 @@ class DecisionStumpRegressor:
     >>> stump = DecisionStumpRegressor()
     >>> stump.fit(X, y)
     >>> predictions = stump.predict(X)
+    >>> # histogram-based search on large data 
+    >>> X, y = make_regression(n_samples=100_000, n_features=20, noise=10)
+    >>> stump = DecisionStumpRegressor(max_bins=256).fit(X, y)
     """
 
-    def __init__(self ):
+    def __init__(self, max_bins=None):
+        self.max_bins=max_bins
         self.split_feature=None
         self.split_value=None
         self.left_value=None
@@ -777,9 +799,11 @@ class DecisionStumpRegressor:
         """
         Fits the decision stump to the data.
 
-        The method iterates over all features and their unique values to 
-        find the split 
-        that minimizes the mean squared error.
+        The method searches all features at once for the split that 
+        minimizes the squared error. Each feature is sorted (or 
+        quantile-binned when `max_bins` is set) a single time and the 
+        error of every candidate threshold is derived from the cumulative 
+        sums of the target, so no boolean mask is rebuilt per candidate.
 
         Parameters
         ----------
@@ -796,32 +820,90 @@ class DecisionStumpRegressor:
         -----
         The decision stump is a weak learner and is primarily used in
         ensemble methods like AdaBoost and Gradient Boosting.
-        """
-        min_error = float('inf')
-        for feature in range(X.shape[1]):
-            possible_values = np.unique(X[:, feature])
-            for value in possible_values:
-                # Create a split and calculate the mean value for each leaf
-                left_mask = X[:, feature] <= value
-                right_mask = X[:, feature] > value
-                left_value = np.mean(y[left_mask]) if np.any(left_mask) else 0
-                right_value = np.mean(y[right_mask]) if np.any(right_mask) else 0
-
-                # Calculate the total error for this split
-                error = np.sum((y[left_mask] - left_value) ** 2
-                               ) + np.sum((y[right_mask] - right_value) ** 2)
-
-                # Update the stump's split if this split is better
-                if error < min_error:
-                    min_error = error
-                    self.split_feature = feature
-                    self.split_value= value
-                    self.left_value= left_value
-                    self.right_value= right_value
-                    
+        
+        With ``max_bins=None`` the search is exact and yields the same split 
+        as the exhaustive scan over the unique values of each feature in 
+        ``O(n_features * n_samples * log(n_samples))``. 
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float).ravel()
+        if X.ndim ==1: 
+            X = X.reshape(-1, 1)
+        if X.shape[0] != y.shape[0]:
+            raise ValueError("Mismatched number of samples between X and y:"
+                             f" {X.shape[0]} and {y.shape[0]}")
+        
+        if self.max_bins is not None and X.shape[0] > self.max_bins: 
+            thresholds, n_left, sum_left = self._binned_cumsums(X, y)
+        else: 
+            thresholds, n_left, sum_left = self._sorted_cumsums(X, y)
+            
+        # SSE(left) + SSE(right) = sum(y^2) - S_l^2/n_l - S_r^2/n_r. The 
+        # constant sum(y^2) is dropped since it does not change the argmin.
+        n_samples = y.shape[0]
+        n_right = n_samples - n_left
+        sum_right = y.sum() - sum_left
+        with np.errstate(divide='ignore', invalid='ignore'):
+            left_mean = np.where(n_left > 0, sum_left / n_left, 0.)
+            right_mean = np.where(n_right > 0, sum_right / n_right, 0.)
+        gain = left_mean * sum_left + right_mean * sum_right
+        # invalid candidates (duplicated thresholds) are flagged with nan.
+        gain[np.isnan(thresholds)] = -np.inf 
+        
+        # thresholds are laid out as (n_features, n_candidates) so that the 
+        # first best split is taken feature by feature, smallest value first.
+        feature, pos = np.unravel_index(np.argmax(gain), gain.shape)
+        self.split_feature = int(feature)
+        self.split_value = thresholds[feature, pos]
+        self.left_value = left_mean[feature, pos]
+        self.right_value = right_mean[feature, pos]
+        
         self.fitted_=True 
         
         return self 
+    
+    def _sorted_cumsums(self, X, y):
+        """Sort every feature once and accumulate the target along the 
+        sorted order. Returns candidate thresholds, left counts and left 
+        sums, each of shape (n_features, n_samples)."""
+        order = np.argsort(X, axis=0, kind='stable')
+        X_sorted = np.take_along_axis(X, order, axis=0).T
+        sum_left = np.cumsum(y[order], axis=0).T
+        n_left = np.broadcast_to(
+            np.arange(1, X.shape[0] + 1, dtype=float), X_sorted.shape)
+        # Only the last occurrence of a value is a valid cut point, 
+        # i.e. the position where `x <= value` includes all its ties.
+        thresholds = X_sorted.copy() 
+        thresholds[:, :-1][X_sorted[:, :-1] == X_sorted[:, 1:]] = np.nan 
+        
+        return thresholds, n_left, sum_left 
+    
+    def _binned_cumsums(self, X, y):
+        """Bin every feature on its quantiles and accumulate counts and 
+        target sums per bin. Returns the bin edges used as thresholds, the 
+        left counts and the left sums, each of shape (n_features, max_bins)."""
+        n_samples, n_features = X.shape
+        n_bins = int(self.max_bins)
+        # The upper edge is the feature maximum so that the last bin 
+        # gathers all samples just like the largest unique value does.
+        edges = np.quantile(X, np.linspace(0, 1, n_bins + 1)[1:], axis=0).T
+        codes = np.empty((n_features, n_samples), dtype=np.intp)
+        for j in range(n_features): 
+            codes[j] = np.searchsorted(edges[j], X[:, j], side='left')
+        # one bincount over all features by offsetting the codes per feature.
+        codes += (np.arange(n_features) * n_bins)[:, None]
+        codes = codes.ravel()
+        counts = np.bincount(codes, minlength=n_features * n_bins)
+        sums = np.bincount(codes, weights=np.tile(y, n_features), 
+                           minlength=n_features * n_bins)
+        n_left = np.cumsum(counts.reshape(n_features, n_bins), axis=1
+                           ).astype(float)
+        sum_left = np.cumsum(sums.reshape(n_features, n_bins), axis=1)
+        
+        thresholds = edges.copy() 
+        thresholds[:, 1:][edges[:, 1:] == edges[:, :-1]] = np.nan 
+        
+        return thresholds, n_left, sum_left 
        
     def predict(self, X):
         """
@@ -1274,6 +1356,13 @@ class BasePerceptron(BaseEstimator, ClassifierMixin):
     random_state : int, default=None
         Seed for the random number generator for weight initialization. A
         consistent random_state ensures reproducibility of results.
+        
+    batch_size : int, default=1
+        Number of samples used for each weight update. ``1`` reproduces the 
+        classical online perceptron rule. Larger values update the weights 
+        with the average correction of the mini-batch in a single vectorized 
+        step, and ``None`` (or any value >= n_samples) performs full-batch 
+        updates.
 
     Attributes
     ----------
@@ -1338,11 +1427,13 @@ class BasePerceptron(BaseEstimator, ClassifierMixin):
         self, 
         eta:float = .01 , 
         n_iter: int = 50 , 
-        random_state:int = None 
+        random_state:int = None, 
+        batch_size: int =1 
         ) :
         self.eta=eta 
         self.n_iter=n_iter 
         self.random_state=random_state 
+        self.batch_size=batch_size 
         
     def fit(self , X, y ): 
         """ Fit the training data 
@@ -1371,23 +1462,56 @@ class BasePerceptron(BaseEstimator, ClassifierMixin):
             X, 
             y, 
             estimator = get_estimator_name(self ), 
-            to_frame= True, 
             )
         
         rgen = np.random.RandomState(self.random_state)
         self.weights_ = rgen.normal(loc=0. , scale =.01 , size = 1 + X.shape[1])
         self.errors_ =list() 
         for _ in range (self.n_iter):
-            errors =0 
-            for xi, target in zip(X, y):
-                update = self.eta * (target - self.predict(xi))
-                self.weights_[1:] += update * xi 
-                self.weights_[0] += update 
-                errors  += int(update !=0.) 
-            self.errors_.append(errors)
+            self.errors_.append(self._update_weights(X, y))
+        
+        return self 
+    
+    def partial_fit(self, X, y): 
+        """ Run a single epoch over the chunk (X, y) without reinitialising 
+        the weights. 
+        
+        Parameters 
+        ----------
+        X:  Ndarray ( M x N matrix where ``M=m-samples``, & ``N=n-features``)
+            Chunk of the training set. 
+        y: array-like, shape (M, ) ``M=m-samples``, 
+            Chunk of the train target. 
+        
+        Returns 
+        --------
+        self: `Perceptron` instance 
+            returns ``self`` for easy method chaining.
+        """
+        X, y = check_X_y(X, y, estimator = get_estimator_name(self ))
+        if not hasattr (self, 'weights_'): 
+            rgen = np.random.RandomState(self.random_state)
+            self.weights_ = rgen.normal(
+                loc=0. , scale =.01 , size = 1 + X.shape[1])
+            self.errors_ =list() 
+        _check_n_features(self, X)
+        self.errors_.append(self._update_weights(X, y))
         
         return self 
     
+    def _update_weights (self, X, y): 
+        """ Apply the perceptron rule over the mini-batches of one epoch and 
+        return the number of misclassifications (updates)."""
+        errors =0 
+        for batch in _gen_batches(X.shape[0], self.batch_size): 
+            update = self.eta * (
+                y[batch] - np.where (self.net_input(X[batch]) >=.0 , 1 , -1 ))
+            self.weights_[1:] += X[batch].T.dot(update) / len(update)
+            self.weights_[0] += update.mean() 
+            errors += np.count_nonzero(update)
+            
+        return errors 
+    
     def net_input(self, X) :
         """ Compute the net input """
         return np.dot (X, self.weights_[1:]) + self.weights_[0] 
@@ -1771,6 +1895,13 @@ class AdalineStochasticRegressor(BaseEstimator, RegressorMixin):
     random_state : int, default=None
         Seed used by the random number generator for shuffling and initializing 
         weights.
+        
+    batch_size : int, default=1
+        Number of samples used for each weight update. ``1`` performs the 
+        pure stochastic updates. Larger values update the weights with the 
+        averaged gradient of the mini-batch in a single vectorized step, 
+        and ``None`` (or any value >= n_samples) performs full-batch 
+        gradient descent.
 
     Attributes
     ----------
@@ -1821,12 +1952,14 @@ class AdalineStochasticRegressor(BaseEstimator, RegressorMixin):
         eta=0.0001, 
         n_iter=10, 
         shuffle=True,
-        random_state=None 
+        random_state=None, 
+        batch_size=1
         ):
         self.eta = eta
         self.n_iter = n_iter
         self.shuffle = shuffle
         self.random_state=random_state 
+        self.batch_size=batch_size 
 
     def fit(self, X, y):
         """Fit training data.
@@ -1844,22 +1977,56 @@ class AdalineStochasticRegressor(BaseEstimator, RegressorMixin):
         self : object
         """
         X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
-        rgen = np.random.RandomState(self.random_state)
-        self.weights_ = rgen.normal(loc=0. , scale =.01 , size = 1 + X.shape[1])
-        # self.weights_ = np.zeros(1 + X.shape[1])
+        self.rgen_ = np.random.RandomState(self.random_state)
+        self.weights_ = self.rgen_.normal(
+            loc=0. , scale =.01 , size = 1 + X.shape[1])
         self.cost_ = []
 
         for i in range(self.n_iter):
             if self.shuffle:
-                X, y = shuffle(X, y)
-            cost = []
-            for xi, target in zip(X, y):
-                error = target - self.predict(xi)
-                self.weights_[1:] += self.eta * xi * error
-                self.weights_[0] += self.eta * error
-                cost.append(error**2 / 2.0)
-            self.cost_.append(np.mean(cost))
+                r = self.rgen_.permutation(len(y))
+                X, y = X[r], y[r]
+            self.cost_.append(self._update_weights(X, y))
         return self
+    
+    def partial_fit(self, X, y):
+        """Fit training data without reinitialising the weights.
+        
+        A single epoch is run over the chunk (X, y) so that the model can 
+        be trained on data streamed by chunks.
+
+        Parameters
+        ----------
+        X : {array-like}, shape = [n_samples, n_features]
+            Chunk of training vectors.
+        y : array-like, shape = [n_samples]
+            Chunk of target values.
+
+        Returns
+        -------
+        self : object
+        """
+        X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
+        if not hasattr (self, 'weights_'): 
+            self.rgen_ = np.random.RandomState(self.random_state)
+            self.weights_ = self.rgen_.normal(
+                loc=0. , scale =.01 , size = 1 + X.shape[1])
+            self.cost_ = []
+        _check_n_features(self, X)
+        self.cost_.append(self._update_weights(X, y))
+        
+        return self 
+    
+    def _update_weights(self, X, y):
+        """Update the weights over the mini-batches of one epoch and return 
+        the average cost."""
+        cost = 0.
+        for batch in _gen_batches(X.shape[0], self.batch_size):
+            error = y[batch] - self.net_input(X[batch])
+            self.weights_[1:] += self.eta * X[batch].T.dot(error) / len(error)
+            self.weights_[0] += self.eta * error.mean()
+            cost += (error**2).sum() / 2.0
+        return cost / X.shape[0]
 
     def net_input(self, X):
         """Calculate net input"""
@@ -1927,6 +2094,13 @@ class AdalineStochasticClassifier(BaseEstimator, ClassifierMixin):
     random_state : int, optional (default=42)
         The seed of the pseudo random number generator to use when shuffling the 
         data and initializing the weights.
+        
+    batch_size : int, optional (default=1)
+        Number of samples used for each weight update. ``1`` performs the 
+        pure stochastic updates. Larger values update the weights with the 
+        averaged gradient of the mini-batch in a single vectorized step, 
+        and ``None`` (or any value >= n_samples) performs full-batch 
+        gradient descent.
 
     Attributes
     ----------
@@ -1966,11 +2140,12 @@ class AdalineStochasticClassifier(BaseEstimator, ClassifierMixin):
     """
 
     def __init__(self, eta:float = .01 , n_iter: int = 50 , shuffle=True, 
-                 random_state:int = None ) :
+                 random_state:int = None, batch_size: int =1 ) :
         self.eta=eta 
         self.n_iter=n_iter 
         self.shuffle=shuffle 
         self.random_state=random_state 
+        self.batch_size=batch_size 
         
         
     def fit(self , X, y ): 
@@ -2007,11 +2182,7 @@ class AdalineStochasticClassifier(BaseEstimator, ClassifierMixin):
         for i in range(self.n_iter ): 
             if self.shuffle: 
                 X, y = self._shuffle (X, y) 
-            cost =[] 
-            for xi , target in zip(X, y) :
-                cost.append(self._update_weights(xi, target)) 
-            avg_cost = sum(cost)/len(y) 
-            self.cost_.append(avg_cost) 
+            self.cost_.append(self._update_weights(X, y)) 
         
         return self 
     
@@ -2046,14 +2217,11 @@ class AdalineStochasticClassifier(BaseEstimator, ClassifierMixin):
             estimator = get_estimator_name(self),  
             )
         
-        if not self.weights_initialized_ : 
+        if not getattr(self, 'weights_initialized_', False): 
            self._init_weights (X.shape[1])
-          
-        if y.ravel().shape [0]> 1: 
-            for xi, target in zip(X, y):
-                self._update_weights (xi, target) 
-        else: 
-            self._update_weights (X, y)
+           self.cost_=list() 
+        _check_n_features(self, X)
+        self.cost_.append(self._update_weights (X, y))
                 
         return self 
     
@@ -2100,7 +2268,8 @@ class AdalineStochasticClassifier(BaseEstimator, ClassifierMixin):
         
     def _update_weights (self, X, y):
         """
-        Adeline learning rules to update the weights 
+        Adeline learning rules to update the weights over the 
+        mini-batches of one epoch. 
 
         Parameters
         ----------
@@ -2111,16 +2280,19 @@ class AdalineStochasticClassifier(BaseEstimator, ClassifierMixin):
 
         Returns
         -------
-        cost: list,
-            sum-squared errors 
+        cost: float,
+            average sum-squared errors 
 
         """
-        output = self.activation (self.net_input(X))
-        errors =(y - output ) 
-        self.weights_[1:] += self.eta * X.dot(errors) 
-        cost = errors **2 /2. 
+        cost = 0. 
+        for batch in _gen_batches(X.shape[0], self.batch_size): 
+            output = self.activation (self.net_input(X[batch]))
+            errors =(y[batch] - output ) 
+            self.weights_[1:] += self.eta * X[batch].T.dot(errors) / len(errors)
+            self.weights_[0] += self.eta * errors.mean() 
+            cost += (errors **2).sum() /2. 
         
-        return cost 
+        return cost / X.shape[0]
     
     def net_input (self, X):
         """
@@ -2142,7 +2314,6 @@ class AdalineStochasticClassifier(BaseEstimator, ClassifierMixin):
         weight net inputs 
 
         """
-        self.inspect 
         return np.dot (X, self.weights_[1:]) + self.weights_[0] 
 
     def activation (self, X):
@@ -2261,6 +2432,13 @@ class AdalineRegressor(BaseEstimator, RegressorMixin):
     random_state : int, optional (default=None)
         The seed of the pseudo random number generator for shuffling the data 
         and initializing the weights.
+        
+    batch_size : int, optional (default=1)
+        Number of samples used for each weight update. ``1`` updates the 
+        weights sample by sample. Larger values update the weights with the 
+        averaged gradient of the mini-batch in a single vectorized step, 
+        and ``None`` (or any value >= n_samples) performs full-batch 
+        gradient descent.
 
     Attributes
     ----------
@@ -2301,10 +2479,11 @@ class AdalineRegressor(BaseEstimator, RegressorMixin):
 
     """
 
-    def __init__(self, eta=0.01, n_iter=50, random_state =None):
+    def __init__(self, eta=0.01, n_iter=50, random_state =None, batch_size=1):
         self.eta = eta
         self.n_iter = n_iter
         self.random_state=random_state 
+        self.batch_size=batch_size 
 
     def fit(self, X, y):
         """Fit training data.
@@ -2329,15 +2508,48 @@ class AdalineRegressor(BaseEstimator, RegressorMixin):
         self.errors_ = []
 
         for _ in range(self.n_iter):
-            errors = 0
-            for xi, target in zip(X, y):
-                error = target - self.predict(xi)
-                update = self.eta * error
-                self.weights_[1:] += update * xi
-                self.weights_[0] += update
-                errors += error ** 2
-            self.errors_.append(errors)
+            self.errors_.append(self._update_weights(X, y))
         return self
+    
+    def partial_fit(self, X, y):
+        """Fit training data without reinitialising the weights.
+        
+        A single epoch is run over the chunk (X, y) so that the model can 
+        be trained on data streamed by chunks.
+
+        Parameters
+        ----------
+        X : {array-like}, shape = [n_samples, n_features]
+            Chunk of training vectors.
+        y : array-like, shape = [n_samples]
+            Chunk of target values.
+
+        Returns
+        -------
+        self : object
+        """
+        X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
+        if not hasattr (self, 'weights_'): 
+            rgen = np.random.RandomState(self.random_state)
+            self.weights_ = rgen.normal(
+                loc=0. , scale =.01 , size = 1 + X.shape[1])
+            self.errors_ = []
+        _check_n_features(self, X)
+        self.errors_.append(self._update_weights(X, y))
+        
+        return self 
+    
+    def _update_weights(self, X, y):
+        """Update the weights over the mini-batches of one epoch and return 
+        the sum of squared errors."""
+        errors = 0.
+        for batch in _gen_batches(X.shape[0], self.batch_size):
+            error = y[batch] - self.net_input(X[batch])
+            update = self.eta * error
+            self.weights_[1:] += X[batch].T.dot(update) / len(update)
+            self.weights_[0] += update.mean()
+            errors += (error ** 2).sum()
+        return errors
 
     def net_input(self, X):
         """Calculate net input"""
@@ -2389,6 +2601,12 @@ class AdalineClassifier(BaseEstimator, ClassifierMixin):
     random_state : int, optional (default=None)
         The seed of the pseudo random number generator for shuffling the data 
         and initializing the weights.
+        
+    batch_size : int, optional (default=1)
+        Number of samples used for each weight update. ``1`` updates the 
+        weights sample by sample. Larger values update the weights with the 
+        averaged correction of the mini-batch in a single vectorized step, 
+        and ``None`` (or any value >= n_samples) performs full-batch updates.
 
     Attributes
     ----------
@@ -2429,10 +2647,11 @@ class AdalineClassifier(BaseEstimator, ClassifierMixin):
 
     """
 
-    def __init__(self, eta=0.01, n_iter=50, random_state=None ):
+    def __init__(self, eta=0.01, n_iter=50, random_state=None, batch_size=1 ):
         self.eta = eta
         self.n_iter = n_iter
         self.random_state=random_state  
+        self.batch_size=batch_size 
         
     def fit(self, X, y):
         """Fit training data.
@@ -2457,14 +2676,48 @@ class AdalineClassifier(BaseEstimator, ClassifierMixin):
         self.errors_ = []
 
         for _ in range(self.n_iter):
-            errors = 0
-            for xi, target in zip(X, y):
-                update = self.eta * (target - self.predict(xi))
-                self.weights_[1:] += update * xi
-                self.weights_[0] += update
-                errors += int(update != 0.0)
-            self.errors_.append(errors)
+            self.errors_.append(self._update_weights(X, y))
         return self
+    
+    def partial_fit(self, X, y):
+        """Fit training data without reinitialising the weights.
+        
+        A single epoch is run over the chunk (X, y) so that the model can 
+        be trained on data streamed by chunks.
+
+        Parameters
+        ----------
+        X : {array-like}, shape = [n_samples, n_features]
+            Chunk of training vectors.
+        y : array-like, shape = [n_samples]
+            Chunk of target values.
+
+        Returns
+        -------
+        self : object
+        """
+        X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
+        if not hasattr (self, 'weights_'): 
+            rgen = np.random.RandomState(self.random_state)
+            self.weights_ = rgen.normal(
+                loc=0. , scale =.01 , size = 1 + X.shape[1])
+            self.errors_ = []
+        _check_n_features(self, X)
+        self.errors_.append(self._update_weights(X, y))
+        
+        return self 
+    
+    def _update_weights(self, X, y):
+        """Update the weights over the mini-batches of one epoch and return 
+        the number of misclassifications."""
+        errors = 0
+        for batch in _gen_batches(X.shape[0], self.batch_size):
+            update = self.eta * (
+                y[batch] - np.where(self.net_input(X[batch]) >= 0.0, 1, -1))
+            self.weights_[1:] += X[batch].T.dot(update) / len(update)
+            self.weights_[0] += update.mean()
+            errors += np.count_nonzero(update)
+        return errors
 
     def net_input(self, X):
         """Calculate net input"""
@@ -2862,11 +3115,20 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         The number of past time steps to consider in the model. This parameter
         defines the 'memory' of the system, enabling the model to use past 
         information for current predictions.
+        
+    dtype : data-type (default=np.float64)
+        Floating type of the transformed inputs. The lagged design matrix is 
+        a strided view over the transformed inputs, so ``np.float32`` halves 
+        the memory used by the model inputs.
 
     Attributes
     ----------
     fitted_ : bool
         Indicates whether the classifier has been fitted to the data.
+        
+    buffer_ : ndarray of shape (memory_depth, n_features)
+        The last `memory_depth` transformed input rows kept by 
+        :meth:`partial_predict` between two calls. 
 
     Examples
     --------
@@ -2881,6 +3143,9 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
     >>> X, y = np.random.rand(100, 1), np.random.randint(0, 2, 100)
     >>> hw.fit(X, y)
     >>> y_pred = hw.predict(X)
+    >>> # score a live feed sample by sample 
+    >>> hw.reset_stream()
+    >>> y_stream = np.concatenate(list(hw.predict_stream(X[:, None, :])))
 
     Notes
     -----
@@ -2907,12 +3172,14 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         classifier="LogisticRegression", 
         nonlinearity_in=np.tanh, 
         nonlinearity_out="sigmoid", 
-        memory_depth=5
+        memory_depth=5, 
+        dtype=np.float64, 
         ):
         self.classifier = classifier
         self.nonlinearity_in = nonlinearity_in
         self.nonlinearity_out = nonlinearity_out
         self.memory_depth = memory_depth
+        self.dtype=dtype 
 
     def _preprocess_data(self, X):
         """
@@ -2929,17 +3196,10 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         X_transformed : array-like
             The transformed input data.
         """
-        X_transformed = self.nonlinearity_in(X)
-
-        n_samples, n_features = X_transformed.shape
-        X_lagged = np.zeros((n_samples - self.memory_depth, 
-                             self.memory_depth * n_features))
-        for i in range(self.memory_depth, n_samples):
-            X_lagged[i - self.memory_depth, :] = ( 
-                X_transformed[i - self.memory_depth:i, :].flatten()
-                )
+        X_transformed = self.nonlinearity_in(
+            np.asarray(X, dtype=self.dtype))
 
-        return X_lagged
+        return _lag_features(X_transformed, self.memory_depth)
 
     def fit(self, X, y):
         """
@@ -2964,7 +3224,7 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         elif self.nonlinearity_out =='softmax': 
             self.nonlinearity_out=lambda x: np.exp(x) / np.sum(np.exp(x), axis=0)
             
-        if self.classfifer=='LogisticRegression': 
+        if self.classifier=='LogisticRegression': 
             if type_of_target(y)=='binary': 
                 self.classifier = LogisticRegression()
             else: 
@@ -3027,6 +3287,67 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         # Apply the output nonlinearity (if necessary)
         return np.apply_along_axis(self.nonlinearity_out, 1, proba_linear)
 
+    def partial_predict(self, X):
+        """
+        Predict the next chunk of a stream of inputs.
+
+        The last `memory_depth` transformed rows seen by the previous call 
+        are kept in :attr:`buffer_` and prepended to the chunk, so the 
+        lags are only built for the new samples. Contrary to :meth:`predict`, 
+        consecutive calls therefore score the samples of a live feed, even 
+        one at a time, as if they were passed in a single array.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Next samples of the stream.
+
+        Returns
+        -------
+        y_pred : array-like of shape (n_predicted,)
+            Predictions for the samples of the chunk that have a full 
+            history of `memory_depth` past rows. Nothing is returned 
+            (empty array) until the buffer has been filled.
+        """
+        check_is_fitted (self, 'fitted_') 
+        X = check_array(X)
+        X_transformed = self.nonlinearity_in(np.asarray(X, dtype=self.dtype))
+        
+        buffer = getattr(self, 'buffer_', None)
+        if buffer is not None and buffer.shape[1]==X_transformed.shape[1]: 
+            X_transformed = np.concatenate((buffer, X_transformed))
+        self.buffer_ = X_transformed[-self.memory_depth:].copy()
+        
+        if len(X_transformed) <= self.memory_depth: 
+            return np.empty((0,), dtype=self.dtype)
+        
+        X_lagged = _lag_features(X_transformed, self.memory_depth)
+        y_linear = self.classifier.predict(X_lagged)
+        
+        return self.nonlinearity_out(y_linear)
+    
+    def predict_stream(self, X_chunks):
+        """
+        Predict over an iterable of chunks with :meth:`partial_predict`.
+
+        Parameters
+        ----------
+        X_chunks : iterable of array-like of shape (n_samples, n_features)
+            The stream of input chunks, e.g. the rows of a sensor feed.
+
+        Yields
+        ------
+        y_pred : array-like
+            The predictions of each chunk.
+        """
+        for X in X_chunks: 
+            yield self.partial_predict(X)
+            
+    def reset_stream(self):
+        """Forget the rows buffered by :meth:`partial_predict`."""
+        self.buffer_ = None 
+        return self 
+
 class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
     r"""
     Hammerstein-Wiener Estimator for Nonlinear Dynamic System Identification.
@@ -3072,11 +3393,20 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         crucial for capturing the memory effect in dynamic systems. A higher value 
         means more past data points are used, which can enhance model accuracy but 
         increase computational complexity.
+        
+    dtype : data-type (default=np.float64)
+        Floating type of the transformed inputs. The lagged design matrix is 
+        a strided view over the transformed inputs, so ``np.float32`` halves 
+        the memory used by the model inputs.
 
     Attributes
     ----------
     fitted_ : bool
         Indicates whether the estimator has been fitted to data.
+        
+    buffer_ : ndarray of shape (memory_depth, n_features)
+        The last `memory_depth` transformed input rows kept by 
+        :meth:`partial_predict` between two calls. 
 
     Examples
     --------
@@ -3091,6 +3421,9 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
     >>> X, y = np.random.rand(100, 1), np.random.rand(100)
     >>> hw.fit(X, y)
     >>> y_pred = hw.predict(X)
+    >>> # score a live feed sample by sample 
+    >>> hw.reset_stream()
+    >>> y_stream = np.concatenate(list(hw.predict_stream(X[:, None, :])))
 
     Notes
     -----
@@ -3118,12 +3451,14 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         linear_model, 
         nonlinearity_in= np.tanh, 
         nonlinearity_out=np.tanh, 
-        memory_depth=5
+        memory_depth=5, 
+        dtype=np.float64, 
         ):
         self.nonlinearity_in = nonlinearity_in
         self.nonlinearity_out = nonlinearity_out
         self.linear_model = linear_model
         self.memory_depth = memory_depth
+        self.dtype=dtype 
 
 
     def _preprocess_data(self, X):
@@ -3142,18 +3477,11 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
             The transformed input data.
         """
         # Apply the input nonlinearity
-        X_transformed = self.nonlinearity_in(X)
+        X_transformed = self.nonlinearity_in(
+            np.asarray(X, dtype=self.dtype))
 
         # Incorporate memory depth
-        n_samples, n_features = X_transformed.shape
-        X_lagged = np.zeros((n_samples - self.memory_depth, 
-                             self.memory_depth * n_features))
-        for i in range(self.memory_depth, n_samples):
-            X_lagged[i - self.memory_depth, :] = ( 
-                X_transformed[i - self.memory_depth:i, :].flatten()
-                )
-
-        return X_lagged
+        return _lag_features(X_transformed, self.memory_depth)
 
     def fit(self, X, y):
         """
@@ -3211,6 +3539,67 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         y_pred = self.nonlinearity_out(y_linear)
         return y_pred
 
+    def partial_predict(self, X):
+        """
+        Predict the next chunk of a stream of inputs.
+
+        The last `memory_depth` transformed rows seen by the previous call 
+        are kept in :attr:`buffer_` and prepended to the chunk, so the 
+        lags are only built for the new samples. Contrary to :meth:`predict`, 
+        consecutive calls therefore score the samples of a live feed, even 
+        one at a time, as if they were passed in a single array.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Next samples of the stream.
+
+        Returns
+        -------
+        y_pred : array-like of shape (n_predicted,)
+            Predictions for the samples of the chunk that have a full 
+            history of `memory_depth` past rows. Nothing is returned 
+            (empty array) until the buffer has been filled.
+        """
+        check_is_fitted (self, 'fitted_') 
+        X = check_array(X)
+        X_transformed = self.nonlinearity_in(np.asarray(X, dtype=self.dtype))
+        
+        buffer = getattr(self, 'buffer_', None)
+        if buffer is not None and buffer.shape[1]==X_transformed.shape[1]: 
+            X_transformed = np.concatenate((buffer, X_transformed))
+        self.buffer_ = X_transformed[-self.memory_depth:].copy()
+        
+        if len(X_transformed) <= self.memory_depth: 
+            return np.empty((0,), dtype=self.dtype)
+        
+        X_lagged = _lag_features(X_transformed, self.memory_depth)
+        y_linear = self.linear_model.predict(X_lagged)
+        
+        return self.nonlinearity_out(y_linear)
+    
+    def predict_stream(self, X_chunks):
+        """
+        Predict over an iterable of chunks with :meth:`partial_predict`.
+
+        Parameters
+        ----------
+        X_chunks : iterable of array-like of shape (n_samples, n_features)
+            The stream of input chunks, e.g. the rows of a sensor feed.
+
+        Yields
+        ------
+        y_pred : array-like
+            The predictions of each chunk.
+        """
+        for X in X_chunks: 
+            yield self.partial_predict(X)
+            
+    def reset_stream(self):
+        """Forget the rows buffered by :meth:`partial_predict`."""
+        self.buffer_ = None 
+        return self 
+
 class GradientDescentClassifier(BaseEstimator, ClassifierMixin):
     r"""
     Gradient Descent Classifier for Binary and Multi-Class Classification.
@@ -4208,7 +4597,7 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
     where previous models have performed poorly.
     
     ``Different Loss Functions``: supports different loss functions 
-    ('linear', 'square', 'exponential'). The derivative of the loss function 
+    ('linear', 'square', 'pseudo_huber'). The derivative of the loss function 
     is used to update the residuals.
     
     ``Stochastic Boosting``: The model includes an option for stochastic 
@@ -4251,15 +4640,44 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
         The maximum depth of each regression tree.
     loss : str
         The loss function to use. Supported values are 'linear', 
-        'square', and 'exponential'.
+        'square', and 'pseudo_huber'. The pseudo-Huber loss 
+        :math:`\\sqrt{1 + r^2} - 1` behaves as the square loss for small 
+        residuals :math:`r` and as the absolute loss for the large ones, 
+        which makes it robust to outliers.
+
+        .. deprecated:: 0.1.0
+           ``loss='exponential'`` diverged and is deprecated. It is fitted 
+           as ``'pseudo_huber'`` and will be removed in a future release.
     subsample : float
         The fraction of samples to be used for fitting each individual base 
         learner .If smaller than 1.0, it enables stochastic boosting.
+    validation_fraction : float, default=0.1
+        The proportion of training data to set aside as validation set for 
+        early stopping. Only used if `n_iter_no_change` is set to an integer.
+    n_iter_no_change : int, default=None
+        Number of iterations without an improvement of the validation loss 
+        larger than `tol` after which the training stops. ``None`` disables 
+        early stopping and all the `n_estimators` trees are built.
+    tol : float, default=1e-4
+        Minimum decrease of the validation loss to count as an improvement 
+        when early stopping is enabled.
+    random_state : int, default=None
+        Seed of the generator used for the sub-sampling and the validation 
+        split.
 
     Attributes
     ----------
     estimators_ : list of DecisionTreeRegressor
         The collection of fitted sub-estimators.
+    n_estimators_ : int
+        The number of trees actually built, which is lower than 
+        `n_estimators` when early stopping was triggered.
+    train_score_ : ndarray of shape (n_estimators_,)
+        The mean squared error of the ensemble on the training samples after 
+        each iteration.
+    validation_score_ : ndarray of shape (n_estimators_,)
+        The mean squared error on the validation samples after each 
+        iteration. Only available when early stopping is enabled.
 
     Examples
     --------
@@ -4269,6 +4687,12 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
     >>> X, y = np.random.rand(100, 4), np.random.rand(100)
     >>> brt.fit(X, y)
     >>> y_pred = brt.predict(X)
+    >>> # stop once 5 trees in a row do not improve the validation loss
+    >>> brt = BoostedRegressionTree(n_estimators=500, n_iter_no_change=5, 
+                                    random_state=0).fit(X, y)
+    >>> brt.n_estimators_
+    >>> for y_stage in brt.staged_predict(X): 
+    ...     pass 
     
     See Also
     --------
@@ -4288,6 +4712,9 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
     - Stochastic boosting can help in reducing overfitting by using a fraction
       of samples for fitting each tree.
     - Tree depth can be controlled to avoid overly complex models.
+    - The training predictions are updated from the leaf values of the 
+      newly added tree only, so each iteration costs one tree traversal 
+      regardless of the size of the ensemble.
 
     """
 
@@ -4297,13 +4724,21 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
         learning_rate=0.1, 
         max_depth=3,
         loss='linear', 
-        subsample=1.0
+        subsample=1.0, 
+        validation_fraction=0.1, 
+        n_iter_no_change=None, 
+        tol=1e-4, 
+        random_state=None, 
         ):
         self.n_estimators = n_estimators
         self.learning_rate = learning_rate
         self.max_depth = max_depth
         self.loss = loss
         self.subsample = subsample
+        self.validation_fraction=validation_fraction 
+        self.n_iter_no_change=n_iter_no_change 
+        self.tol=tol 
+        self.random_state=random_state 
         
     def _loss_derivative(self, y, y_pred):
         """
@@ -4319,13 +4754,18 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
         Returns
         -------
         loss_derivative : array-like of shape (n_samples,)
+            The negative gradient (pseudo-residual) the next tree is fitted 
+            to.
         """
         if self.loss == 'linear':
             return y - y_pred
         elif self.loss == 'square':
             return (y - y_pred) * 2
-        elif self.loss == 'exponential':
-            return np.exp(y_pred - y)
+        elif self.loss in ('pseudo_huber', 'exponential'):
+            # Negative gradient of the pseudo-Huber loss sqrt(1 + r**2) - 1:
+            # the residual for small errors, bounded by 1 for the large ones.
+            residual = y - y_pred
+            return residual / np.sqrt(1 + residual ** 2)
         else:
             raise ValueError("Unsupported loss function")
 
@@ -4346,25 +4786,61 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
             Returns self.
         """
         X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
+        y = y.astype(float)
+        rng = np.random.RandomState(self.random_state)
+        if self.loss == 'exponential': 
+            warnings.warn("loss='exponential' is deprecated and is fitted as"
+                          " loss='pseudo_huber'. It will be removed in a"
+                          " future release.", FutureWarning)
+        
+        early_stopping = self.n_iter_no_change is not None 
+        if early_stopping: 
+            indices = rng.permutation(X.shape[0])
+            n_val = max(int(self.validation_fraction * X.shape[0]), 1)
+            X_val, y_val = X[indices[:n_val]], y[indices[:n_val]]
+            X, y = X[indices[n_val:]], y[indices[n_val:]]
+            y_pred_val = np.zeros(len(y_val))
+            
         n_samples = X.shape[0]
-        residual = y.copy()
+        sample_size = max(int(self.subsample * n_samples), 1)
+        # Training predictions of the ensemble built so far.
+        y_pred = np.zeros(n_samples)
         
         self.estimators_ = []
+        train_score, validation_score = [], []
+        best_score, n_no_change = np.inf, 0 
         for _ in range(self.n_estimators):
-            tree = DecisionTreeRegressor(max_depth=self.max_depth)
+            residual = self._loss_derivative(y, y_pred)
+            tree = DecisionTreeRegressor(max_depth=self.max_depth, 
+                                         random_state=rng)
 
             # Stochastic boosting (sub-sampling)
-            sample_size = int(self.subsample * n_samples)
-            indices = np.random.choice(n_samples, sample_size, replace=False)
-            X_subset, residual_subset = X[indices], residual[indices]
-
-            tree.fit(X_subset, residual_subset)
-            prediction = tree.predict(X)
-
-            # Update residuals
-            residual -= self.learning_rate * self._loss_derivative(y, prediction)
-
+            if sample_size < n_samples: 
+                indices = rng.choice(n_samples, sample_size, replace=False)
+                tree.fit(X[indices], residual[indices])
+            else: 
+                tree.fit(X, residual)
+                
+            # Only the new tree contributes: read its leaf values instead 
+            # of predicting with the whole ensemble again.
+            y_pred += self.learning_rate * _leaf_values(tree, X)
+            train_score.append(np.mean((y - y_pred) ** 2))
             self.estimators_.append(tree)
+            
+            if early_stopping: 
+                y_pred_val += self.learning_rate * _leaf_values(tree, X_val)
+                validation_score.append(np.mean((y_val - y_pred_val) ** 2))
+                if validation_score[-1] < best_score - self.tol: 
+                    best_score, n_no_change = validation_score[-1], 0 
+                else: 
+                    n_no_change += 1 
+                if n_no_change >= self.n_iter_no_change: 
+                    break 
+                
+        self.n_estimators_ = len(self.estimators_)
+        self.train_score_ = np.asarray(train_score)
+        if early_stopping: 
+            self.validation_score_ = np.asarray(validation_score)
 
         return self
 
@@ -4396,6 +4872,36 @@ class BoostedRegressionTree(BaseEstimator, RegressorMixin):
             y_pred += self.learning_rate * tree.predict(X)
 
         return y_pred
+    
+    def staged_predict(self, X):
+        """
+        Return the predictions of the ensemble after each boosting stage.
+
+        It is the cheap way to pick the number of trees on a held-out set 
+        since the predictions of stage ``k`` are obtained by adding the 
+        contribution of the ``k``-th tree to those of stage ``k - 1``.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            The input samples.
+
+        Yields
+        ------
+        y_pred : ndarray of shape (n_samples,)
+            The predicted values after each stage.
+        """
+        check_is_fitted(self, 'estimators_')
+        X = check_array(
+            X,
+            accept_large_sparse=True,
+            accept_sparse= True,
+            to_frame=False, 
+            )
+        y_pred = np.zeros(X.shape[0])
+        for tree in self.estimators_:
+            y_pred += self.learning_rate * _leaf_values(tree, X)
+            yield y_pred.copy()
 
 class DecisionTreeBasedRegressor(BaseEstimator, RegressorMixin):
     r"""
@@ -4427,6 +4933,13 @@ class DecisionTreeBasedRegressor(BaseEstimator, RegressorMixin):
         The maximum depth of each regression tree.
     random_state : int
         Controls the randomness of the estimator.
+    n_jobs : int, default=None
+        The number of jobs to fit the ensemble members in parallel. ``None`` 
+        means 1 and ``-1`` means using all processors.
+    warm_start : bool, default=False
+        When set to ``True``, reuse the members of the previous call to fit 
+        and only fit the additional members needed to reach `n_estimators`. 
+        Otherwise, fit a whole new ensemble.
 
     Attributes
     ----------
@@ -4460,10 +4973,13 @@ class DecisionTreeBasedRegressor(BaseEstimator, RegressorMixin):
       averaged to obtain the final prediction.
     """
 
-    def __init__(self, n_estimators=100, max_depth=3, random_state=None):
+    def __init__(self, n_estimators=100, max_depth=3, random_state=None, 
+                 n_jobs=None, warm_start=False):
         self.n_estimators = n_estimators
         self.max_depth = max_depth
         self.random_state = random_state
+        self.n_jobs=n_jobs 
+        self.warm_start=warm_start 
         
     def fit(self, X, y):
         """
@@ -4482,12 +4998,16 @@ class DecisionTreeBasedRegressor(BaseEstimator, RegressorMixin):
             Returns self.
         """
         X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
-        self.estimators_ = []
-        for _ in range(self.n_estimators):
-            tree = DecisionTreeRegressor(max_depth=self.max_depth,
-                                         random_state=self.random_state)
-            tree.fit(X, y)
-            self.estimators_.append(tree)
+        if not self.warm_start or not hasattr(self, 'estimators_'): 
+            self.estimators_ = []
+            
+        new_trees = [
+            DecisionTreeRegressor(max_depth=self.max_depth,
+                                  random_state=self.random_state)
+            for _ in range(_n_more_estimators(self, self.estimators_))
+            ]
+        self.estimators_ += _fit_ensemble_members(
+            new_trees, X, y, n_jobs= self.n_jobs, prefer ='threads')
 
         return self
 
@@ -4514,8 +5034,11 @@ class DecisionTreeBasedRegressor(BaseEstimator, RegressorMixin):
             to_frame=False, 
             )
         
-        predictions = np.array([tree.predict(X) for tree in self.estimators_])
-        return np.mean(predictions, axis=0)
+        y_pred = _accumulate_predictions(
+            self.estimators_, X, _add_prediction, np.zeros(X.shape[0]))
+        y_pred /= len(self.estimators_)
+        
+        return y_pred 
 
 class HBTEnsembleRegressor(BaseEstimator, RegressorMixin):
     r"""
@@ -4534,6 +5057,10 @@ class HBTEnsembleRegressor(BaseEstimator, RegressorMixin):
         The learning rate for gradient boosting (between 0.0 and 1.0).
     max_depth : int, default=3
         The maximum depth of individual decision trees.
+    warm_start : bool, default=False
+        When set to ``True``, reuse the members of the previous call to fit 
+        and only add the boosting stages needed to reach `n_estimators`. 
+        Otherwise, fit a whole new ensemble.
 
     Attributes
     ----------
@@ -4616,10 +5143,12 @@ class HBTEnsembleRegressor(BaseEstimator, RegressorMixin):
       Tree for regression tasks.
     """
 
-    def __init__(self, n_estimators=50, learning_rate=0.1, max_depth=3):
+    def __init__(self, n_estimators=50, learning_rate=0.1, max_depth=3, 
+                 warm_start=False):
         self.n_estimators = n_estimators
         self.learning_rate = learning_rate
         self.max_depth = max_depth
+        self.warm_start=warm_start 
 
 
     def fit(self, X, y):
@@ -4637,26 +5166,33 @@ class HBTEnsembleRegressor(BaseEstimator, RegressorMixin):
         -------
         self : object
         """
-        self.base_estimators_ = []
-        self.weights_ = []
-        F_k = np.zeros(len(y))
+        X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
+        if not self.warm_start or not hasattr(self, 'base_estimators_'): 
+            self.base_estimators_ = []
+            self.weights_ = []
+            
+        # Resume boosting from the predictions of the kept stages.
+        F_k = _accumulate_predictions(
+            list(zip(self.base_estimators_, self.weights_)), X, 
+            _add_weighted_prediction, np.zeros(len(y)))
 
-        for _ in range(self.n_estimators):
+        for _ in range(_n_more_estimators(self, self.base_estimators_)):
             # Calculate residuals
             residual = y - F_k
             
             # Fit a decision tree on the residuals
             base_estimator = DecisionTreeRegressor(max_depth=self.max_depth)
             base_estimator.fit(X, residual)
+            h_k = base_estimator.predict(X)
             
             # Calculate weighted error
-            weighted_error = np.sum((residual - base_estimator.predict(X)) ** 2)
+            weighted_error = np.sum((residual - h_k) ** 2)
             
             # Calculate weight for this base estimator
             weight = self.learning_rate / (1 + weighted_error)
             
             # Update predictions
-            F_k += weight * base_estimator.predict(X)
+            F_k += weight * h_k
             
             # Store the base estimator and its weight
             self.base_estimators_.append(base_estimator)
@@ -4678,11 +5214,15 @@ class HBTEnsembleRegressor(BaseEstimator, RegressorMixin):
             Predicted target values.
         """
         check_is_fitted(self, 'weights_')
-        y_pred = np.zeros(X.shape[0])
-        for i, base_estimator in enumerate(self.base_estimators_):
-            y_pred += self.weights_[i] * base_estimator.predict(X)
-        
-        return y_pred
+        X = check_array(
+            X,
+            accept_large_sparse=True,
+            accept_sparse= True,
+            to_frame=False, 
+            )
+        return _accumulate_predictions(
+            list(zip(self.base_estimators_, self.weights_)), X, 
+            _add_weighted_prediction, np.zeros(X.shape[0]))
 
 class HybridBoostedTreeClassifier(BaseEstimator, ClassifierMixin):
     r"""
@@ -4906,6 +5446,13 @@ class HybridBoostedTreeRegressor(BaseEstimator, RegressorMixin):
     brt_params : dict, default=None
         Parameters to be passed to each Boosted Regression Tree model. If None,
         default values for BRT parameters are used.
+    n_jobs : int, default=None
+        The number of jobs to fit the ensemble members in parallel. ``None`` 
+        means 1 and ``-1`` means using all processors.
+    warm_start : bool, default=False
+        When set to ``True``, reuse the members of the previous call to fit 
+        and only fit the additional members needed to reach `n_estimators`. 
+        Otherwise, fit a whole new ensemble.
 
     Attributes
     ----------
@@ -4959,9 +5506,12 @@ class HybridBoostedTreeRegressor(BaseEstimator, RegressorMixin):
 
     """
 
-    def __init__(self, n_estimators=10, brt_params=None):
+    def __init__(self, n_estimators=10, brt_params=None, n_jobs=None, 
+                 warm_start=False):
         self.n_estimators = n_estimators
         self.brt_params = brt_params or {}
+        self.n_jobs=n_jobs 
+        self.warm_start=warm_start 
 
     def fit(self, X, y):
         """
@@ -4980,11 +5530,15 @@ class HybridBoostedTreeRegressor(BaseEstimator, RegressorMixin):
             Returns self.
         """
         X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
-        self.brt_ensembles_ = []
-        for _ in range(self.n_estimators):
-            brt = GradientBoostingRegressor(**self.brt_params)
-            brt.fit(X, y)
-            self.brt_ensembles_.append(brt)
+        if not self.warm_start or not hasattr(self, 'brt_ensembles_'): 
+            self.brt_ensembles_ = []
+            
+        new_brts = [
+            GradientBoostingRegressor(**self.brt_params)
+            for _ in range(_n_more_estimators(self, self.brt_ensembles_))
+            ]
+        self.brt_ensembles_ += _fit_ensemble_members(
+            new_brts, X, y, n_jobs= self.n_jobs)
 
         return self
 
@@ -5011,8 +5565,11 @@ class HybridBoostedTreeRegressor(BaseEstimator, RegressorMixin):
             to_frame=False, 
             )
         
-        predictions = np.array([brt.predict(X) for brt in self.brt_ensembles_])
-        return np.mean(predictions, axis=0)
+        y_pred = _accumulate_predictions(
+            self.brt_ensembles_, X, _add_prediction, np.zeros(X.shape[0]))
+        y_pred /= len(self.brt_ensembles_)
+        
+        return y_pred 
 
 class BoostedClassifierTree(BaseEstimator, ClassifierMixin):
     r"""
@@ -5236,11 +5793,20 @@ class DecisionTreeBasedClassifier(BaseEstimator, ClassifierMixin):
         The maximum depth of each decision tree.
     random_state : int or None, default=None
         Controls the randomness of the estimator for reproducibility.
+    n_jobs : int, default=None
+        The number of jobs to fit the ensemble members in parallel. ``None`` 
+        means 1 and ``-1`` means using all processors.
+    warm_start : bool, default=False
+        When set to ``True``, reuse the members of the previous call to fit 
+        and only fit the additional members needed to reach `n_estimators`. 
+        Otherwise, fit a whole new ensemble.
 
     Attributes
     ----------
     estimators_ : list of DecisionTreeClassifier
         The collection of fitted sub-estimators.
+    classes_ : ndarray of shape (n_classes,)
+        The classes labels.
 
     Example
     -------
@@ -5273,10 +5839,13 @@ class DecisionTreeBasedClassifier(BaseEstimator, ClassifierMixin):
 
     """
 
-    def __init__(self, n_estimators=100, max_depth=3, random_state=None):
+    def __init__(self, n_estimators=100, max_depth=3, random_state=None, 
+                 n_jobs=None, warm_start=False):
         self.n_estimators = n_estimators
         self.max_depth = max_depth
         self.random_state = random_state 
+        self.n_jobs=n_jobs 
+        self.warm_start=warm_start 
         
         
     def fit(self, X, y):
@@ -5296,12 +5865,17 @@ class DecisionTreeBasedClassifier(BaseEstimator, ClassifierMixin):
             Returns self.
         """
         X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
-        self.estimators_ = []
-        for _ in range(self.n_estimators):
-            tree = DecisionTreeClassifier(max_depth=self.max_depth, 
-                                          random_state=self.random_state)
-            tree.fit(X, y)
-            self.estimators_.append(tree)
+        if not self.warm_start or not hasattr(self, 'estimators_'): 
+            self.estimators_ = []
+        self.classes_ = _check_warm_start_classes(self, self.estimators_, y)
+        
+        new_trees = [
+            DecisionTreeClassifier(max_depth=self.max_depth, 
+                                   random_state=self.random_state)
+            for _ in range(_n_more_estimators(self, self.estimators_))
+            ]
+        self.estimators_ += _fit_ensemble_members(
+            new_trees, X, y, n_jobs= self.n_jobs, prefer ='threads')
 
         return self
 
@@ -5326,10 +5900,11 @@ class DecisionTreeBasedClassifier(BaseEstimator, ClassifierMixin):
             accept_sparse= True,
             to_frame=False, 
             )
-        predictions = np.array([tree.predict(X) for tree in self.estimators_])
         # Majority voting
-        y_pred = stats.mode(predictions, axis=0).mode[0]
-        return y_pred
+        votes = _accumulate_predictions(
+            self.estimators_, X, _add_vote(self.classes_),
+            np.zeros((X.shape[0], len(self.classes_))))
+        return self.classes_[np.argmax(votes, axis=1)]
     
     def predict_proba(self, X):
         """
@@ -5349,10 +5924,11 @@ class DecisionTreeBasedClassifier(BaseEstimator, ClassifierMixin):
         check_is_fitted(self, 'estimators_')
         X = check_array(X, accept_sparse=True)
 
-        # Collect probabilities from each estimator
-        all_proba = np.array([tree.predict_proba(X) for tree in self.estimators_])
         # Average probabilities across all estimators
-        avg_proba = np.mean(all_proba, axis=0)
+        avg_proba = _accumulate_predictions(
+            self.estimators_, X, _add_proba(self.classes_), 
+            np.zeros((X.shape[0], len(self.classes_))))
+        avg_proba /= len(self.estimators_)
         return avg_proba
     
 class HBTEnsembleClassifier(BaseEstimator, ClassifierMixin):
@@ -5400,11 +5976,20 @@ class HBTEnsembleClassifier(BaseEstimator, ClassifierMixin):
         The number of Boosted Decision Tree models in the ensemble.
     gb_params : dict
         Parameters to be passed to each GradientBoostingClassifier model.
+    n_jobs : int, default=None
+        The number of jobs to fit the ensemble members in parallel. ``None`` 
+        means 1 and ``-1`` means using all processors.
+    warm_start : bool, default=False
+        When set to ``True``, reuse the members of the previous call to fit 
+        and only fit the additional members needed to reach `n_estimators`. 
+        Otherwise, fit a whole new ensemble.
 
     Attributes
     ----------
     gb_ensembles_ : list of GradientBoostingClassifier
         The collection of fitted Boosted Decision Tree ensembles.
+    classes_ : ndarray of shape (n_classes,)
+        The classes labels.
 
     Mathematical Formulation
     ------------------------
@@ -5441,9 +6026,12 @@ class HBTEnsembleClassifier(BaseEstimator, ClassifierMixin):
     >>> y_pred = hybrid_gb.predict(X)
     """
 
-    def __init__(self, n_estimators=10, gb_params=None):
+    def __init__(self, n_estimators=10, gb_params=None, n_jobs=None, 
+                 warm_start=False):
         self.n_estimators = n_estimators
         self.gb_params = gb_params or {}
+        self.n_jobs=n_jobs 
+        self.warm_start=warm_start 
         
 
     def fit(self, X, y):
@@ -5464,11 +6052,16 @@ class HBTEnsembleClassifier(BaseEstimator, ClassifierMixin):
             Returns self.
         """
         X, y = check_X_y( X, y, estimator = get_estimator_name(self ))
-        self.gb_ensembles_ = []
-        for _ in range(self.n_estimators):
-            gb = GradientBoostingClassifier(**self.gb_params)
-            gb.fit(X, y)
-            self.gb_ensembles_.append(gb)
+        if not self.warm_start or not hasattr(self, 'gb_ensembles_'): 
+            self.gb_ensembles_ = []
+        self.classes_ = _check_warm_start_classes(self, self.gb_ensembles_, y)
+        
+        new_gbs = [
+            GradientBoostingClassifier(**self.gb_params)
+            for _ in range(_n_more_estimators(self, self.gb_ensembles_))
+            ]
+        self.gb_ensembles_ += _fit_ensemble_members(
+            new_gbs, X, y, n_jobs= self.n_jobs)
 
         return self
 
@@ -5494,10 +6087,11 @@ class HBTEnsembleClassifier(BaseEstimator, ClassifierMixin):
             accept_sparse= True,
             to_frame=False, 
             )
-        predictions = np.array([gb.predict(X) for gb in self.gb_ensembles_])
         # Majority voting for classification
-        y_pred = stats.mode(predictions, axis=0).mode[0]
-        return y_pred
+        votes = _accumulate_predictions(
+            self.gb_ensembles_, X, _add_vote(self.classes_),
+            np.zeros((X.shape[0], len(self.classes_))))
+        return self.classes_[np.argmax(votes, axis=1)]
 
 class WeightedAverageClassifier(BaseEstimator, ClassifierMixin):
     r"""
@@ -6270,6 +6864,128 @@ class _GradientBoostingClassifier:
         return np.where(self._sigmoid(F_m) > 0.5, 1, 0)
     
 
+def _gen_batches(n_samples, batch_size):
+    """Generate the slices of the mini-batches of an epoch. 
+    
+    ``batch_size=None`` or any size larger than `n_samples` yields a single 
+    full batch.
+    """
+    if batch_size is None: 
+        batch_size = n_samples 
+    if not isinstance (batch_size, Integral) or batch_size < 1: 
+        raise ValueError("batch_size must be a positive integer or None."
+                         f" Got {batch_size!r}.")
+    return gen_batches(n_samples, min(int(batch_size), n_samples))
+
+def _n_more_estimators(ensemble, members):
+    """Number of members to add to reach `n_estimators`, checking the 
+    `warm_start` consistency the way scikit-learn ensembles do."""
+    n_more = ensemble.n_estimators - len(members)
+    if n_more < 0: 
+        raise ValueError(
+            f"n_estimators={ensemble.n_estimators} must be larger or equal to"
+            f" the {len(members)} members already fitted when warm_start=True")
+    if n_more ==0 and members: 
+        warnings.warn("Warm-start fitting without increasing n_estimators"
+                      " does not fit new members.")
+    return n_more 
+
+def _fit_member(estimator, X, y):
+    """Fit one ensemble member. Defined at module level to be picklable."""
+    return estimator.fit(X, y)
+
+def _fit_ensemble_members(estimators, X, y, n_jobs=None, prefer=None):
+    """Fit independent ensemble members in parallel with joblib. 
+    
+    Decision trees release the GIL while growing, so ``prefer='threads'`` 
+    avoids copying `X` into each worker process for them.
+    """
+    if not estimators: 
+        return []
+    return Parallel(n_jobs=n_jobs, prefer=prefer)(
+        delayed(_fit_member)(estimator, X, y) for estimator in estimators)
+
+def _add_prediction(estimator, X, out):
+    out += estimator.predict(X)
+
+def _add_weighted_prediction(member, X, out):
+    estimator, weight = member 
+    out += weight * estimator.predict(X)
+
+def _check_warm_start_classes(ensemble, members, y):
+    """Classes of a classifier ensemble. A warm start keeps the classes of 
+    the members already fitted and rejects the labels unseen by them."""
+    classes = np.unique(y)
+    if not members: 
+        return classes 
+    unseen = np.setdiff1d(classes, ensemble.classes_)
+    if len(unseen): 
+        raise ValueError(
+            f"warm_start can only be used with the classes {ensemble.classes_}"
+            f" seen by the members already fitted. Got new labels {unseen}.")
+    return ensemble.classes_ 
+
+def _add_proba(classes):
+    """Make an accumulator summing the class probabilities of each member. 
+    
+    The columns of a member fitted on a subset of `classes` (warm start) 
+    are added to those of its classes.
+    """
+    def _add(estimator, X, out): 
+        out[:, np.searchsorted(classes, estimator.classes_)] += (
+            estimator.predict_proba(X))
+    return _add 
+
+def _add_vote(classes):
+    """Make an accumulator that counts the class votes of each member."""
+    def _add(estimator, X, out): 
+        out[np.arange(X.shape[0]), np.searchsorted(
+            classes, estimator.predict(X))] += 1 
+    return _add 
+
+def _accumulate_predictions(members, X, add, out, chunk_size=65536):
+    """Accumulate the outputs of the ensemble members into `out` in place. 
+    
+    Rows are processed by chunks of `chunk_size` so that the temporary 
+    output of a single member never exceeds one chunk, and no 
+    (n_estimators, n_samples) array is built.
+    """
+    for rows in gen_batches(X.shape[0], chunk_size): 
+        X_rows, out_rows = X[rows], out[rows]
+        for member in members: 
+            add(member, X_rows, out_rows)
+    return out 
+
+def _leaf_values(tree, X):
+    """Output of a fitted regression tree read from the leaves reached by 
+    `X`, skipping the input validation of ``predict``."""
+    return tree.tree_.value[tree.apply(X), 0, 0]
+
+def _lag_features(X, memory_depth):
+    """Build the lagged design matrix of the Hammerstein-Wiener models. 
+    
+    Row ``i`` holds the flattened rows ``X[i: i + memory_depth]``. Since 
+    these rows are contiguous in a C-ordered array, the matrix is returned 
+    as a read-only strided view over `X` instead of a copy.
+    """
+    X = np.ascontiguousarray(X)
+    n_samples, n_features = X.shape
+    n_windows = max(n_samples - memory_depth, 0)
+    window = memory_depth * n_features 
+    if n_windows ==0: 
+        return np.empty((0, window), dtype=X.dtype)
+    
+    return sliding_window_view(X.ravel(), window)[::n_features][:n_windows]
+
+def _check_n_features(estimator, X):
+    """Check that a chunk passed to ``partial_fit`` has the number of 
+    features of the fitted weights."""
+    n_features = len(estimator.weights_) - 1
+    if X.shape[1] != n_features: 
+        raise ValueError(
+            f"X has {X.shape[1]} features, but {get_estimator_name(estimator)}"
+            f" is expecting {n_features} features as input.")
+
 @validate_params(
     {
         "X": ["array-like", "sparse matrix"],
@@ -11,17 +11,19 @@ as an attribute of the selection module::
     >>> from gofast.experimental import enable_hyperband_selection  # noqa
     >>> # now you can import normally from HyperbandSearchCV
     >>> from gofast.models.selection import HyperbandSearchCV
+    >>> from gofast.models.selection import ASHASearchCV
     
 Created on Sat Feb  3 20:58:51 2024
 @author: LKouadio<etanoyau@gmail.com>
 """
 
-from ..models.deep_selection import HyperbandSearchCV
+from ..models.deep_selection import HyperbandSearchCV, ASHASearchCV
 from ..models import selection 
 from .. import models 
 
 # use settattr to avoid mypy errors when monkeypatching
 setattr ( models, 'selection', selection )
 setattr ( models.selection, "HyperbandSearchCV", HyperbandSearchCV )
+setattr ( models.selection, "ASHASearchCV", ASHASearchCV )
 
-models.selection.__all__ += ["HyperbandSearchCV"]
+models.selection.__all__ += ["HyperbandSearchCV", "ASHASearchCV"]
@@ -4,14 +4,14 @@ _config_gdal.py
 
 This module configures GDAL and PyProj for the application. It checks for the 
 availability of GDAL and PyProj libraries, determines the version of GDAL if 
-available, and loads EPSG codes from a local file or a numpy backup, ensuring
+available, and loads EPSG codes from a local file or the packaged registry, ensuring
  the application can correctly handle geospatial data.
 
 Attributes:
     HAS_GDAL (bool): Indicates if GDAL is available.
     NEW_GDAL (bool): True if the GDAL version is 3 or higher.
     HAS_PROJ (bool): True if PyProj is available.
-    EPSG_DICT (dict): Dictionary of EPSG codes mapped to their definitions.
+    EPSG_DICT (dict or EPSGRegistry): EPSG codes mapped to their definitions.
     
 Created on Sat Feb  3 21:33:42 2024
 @author: LKouadio <etanoyau@gmail.com>
@@ -20,7 +20,8 @@ Created on Sat Feb  3 21:33:42 2024
 import os
 import warnings
 import re
-import numpy as np
+
+from ._epsg import EPSGRegistry
 
 def suppress_warnings():
     """
@@ -40,9 +41,11 @@ def check_gdal_availability():
         tuple: A tuple containing two boolean values. The first indicates if 
         GDAL is available, and the second if the GDAL version is 3 or higher.
     """
-    from ..decorators import gdal_data_check
+    from ..decorators import CheckGDALData
     try:
-        has_gdal = gdal_data_check(None)._gdal_data_found
+        checker = CheckGDALData()
+        checker._check_gdal_data()
+        has_gdal = checker._gdal_data_found
         new_gdal = False
         if has_gdal:
             from osgeo import __version__ as osgeo_version
@@ -68,13 +71,13 @@ def check_proj_availability():
 
 def load_epsg_codes(has_proj):
     """
-    Loads EPSG codes from the PyProj data directory or a numpy backup file.
+    Loads EPSG codes from the PyProj data directory or the packaged registry.
 
     Parameters:
         has_proj (bool): Indicates if PyProj is available.
 
     Returns:
-        dict: A dictionary mapping EPSG codes to their definitions.
+        dict or EPSGRegistry: A mapping of EPSG codes to their definitions.
     """
     EPSG_DICT = {}
     if has_proj:
@@ -112,21 +115,21 @@ def parse_epsg_line(line):
 
 def load_epsg_from_backup():
     """
-    Loads EPSG codes from a numpy backup file.
+    Loads EPSG codes from the registry shipped with the package.
+
+    The registry files are memory-mapped on first lookup, so calling this 
+    function does not read them.
 
     Returns:
-        dict: A dictionary mapping EPSG codes to their definitions, loaded 
-        from a numpy file.
+        EPSGRegistry: A mapping of EPSG codes to their definitions.
 
     Raises:
-        RuntimeError: If the numpy file could not be found or loaded.
+        RuntimeError: If the registry files could not be found.
     """
-    try:
-        path = os.path.dirname(os.path.abspath(__file__))
-        epsg_dict_fn = os.path.join(path, 'epsg.npy')
-        return np.load(epsg_dict_fn, allow_pickle=True).item()
-    except Exception as e:
-        raise RuntimeError("Failed to load EPSG codes from backup file.") from e
+    registry = EPSGRegistry()
+    if not os.path.isfile(os.path.join(registry.directory, 'epsg_codes.npy')):
+        raise RuntimeError("Failed to load EPSG codes from backup file.")
+    return registry
 
 # Main execution block
 if __name__ == "__main__":
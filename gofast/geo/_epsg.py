@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""
+Compact, lazily loaded registry of the EPSG projection definitions.
+
+The definitions are stored in three NumPy files next to this module:
+
+- ``epsg_codes.npy``: the sorted EPSG codes,
+- ``epsg_offsets.npy``: the offset of each definition in the blob,
+- ``epsg_defs.npy``: the proj strings concatenated as UTF-8 bytes.
+
+The files are memory-mapped on first lookup, so importing the geo modules
+costs nothing and forked workers share the same pages of the page cache.
+"""
+
+import os
+import re
+from collections.abc import MutableMapping
+import numpy as np
+
+__all__ = ["EPSGRegistry", "build_epsg_registry"]
+
+_REGISTRY_DIR = os.path.dirname(os.path.abspath(__file__))
+_UTM_PATTERN = re.compile(r'\+proj=utm \+zone=(\d+) (\+south )?')
+
+class EPSGRegistry(MutableMapping):
+    """
+    Mapping of EPSG codes to proj definition strings.
+
+    Lookups are binary searches over the sorted codes, in O(log n), and
+    only the bytes of the requested definition are decoded. Entries set on
+    the registry (e.g. custom projections) are kept in memory on top of
+    the stored definitions.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory holding the registry files. Defaults to the directory of
+        the :mod:`gofast.geo` package.
+
+    Examples
+    --------
+    >>> from gofast.geo._epsg import EPSGRegistry
+    >>> registry = EPSGRegistry()
+    >>> registry[32755]
+    '+proj=utm +zone=55 +south +datum=WGS84 +units=m +no_defs'
+    >>> registry.utm_zone_to_epsg(55, False)
+    32755
+    """
+    def __init__(self, directory=None):
+        self.directory = directory or _REGISTRY_DIR
+        self._codes = None
+        self._offsets = None
+        self._defs = None
+        self._utm_index = None
+        self._extra = {}
+
+    def _load(self):
+        """Memory-map the registry files on first use."""
+        if self._codes is None:
+            def load(name):
+                return np.load(os.path.join(self.directory, name),
+                               mmap_mode='r')
+            self._offsets = load('epsg_offsets.npy')
+            self._defs = load('epsg_defs.npy')
+            self._codes = load('epsg_codes.npy')
+        return self._codes
+
+    def _find(self, code):
+        """Position of `code` in the stored codes, or -1."""
+        codes = self._load()
+        try:
+            code = int(code)
+        except (TypeError, ValueError):
+            return -1
+        position = int(np.searchsorted(codes, code))
+        if position < len(codes) and codes[position] == code:
+            return position
+        return -1
+
+    def __getitem__(self, code):
+        if code in self._extra:
+            return self._extra[code]
+        position = self._find(code)
+        if position < 0:
+            raise KeyError(code)
+        start, stop = self._offsets[position], self._offsets[position + 1]
+        return bytes(self._defs[start:stop]).decode('utf-8')
+
+    def __contains__(self, code):
+        return code in self._extra or self._find(code) >= 0
+
+    def __setitem__(self, code, definition):
+        self._extra[code] = definition
+
+    def __delitem__(self, code):
+        if code not in self._extra:
+            raise KeyError(f"{code} is a stored definition and cannot be"
+                           " deleted.")
+        del self._extra[code]
+
+    def __iter__(self):
+        yield from (int(code) for code in self._load())
+        yield from (code for code in self._extra if self._find(code) < 0)
+
+    def __len__(self):
+        return len(self._load()) + sum(
+            1 for code in self._extra if self._find(code) < 0)
+
+    def __repr__(self):
+        state = 'loaded' if self._codes is not None else 'not loaded'
+        return (f"{self.__class__.__name__}(directory={self.directory!r},"
+                f" {state})")
+
+    def utm_zone_to_epsg(self, zone_number, is_northern):
+        """
+        EPSG code of the WGS84 UTM projection of a zone.
+
+        The reverse index is built from the stored definitions on the first
+        call, then each lookup is a dictionary access.
+
+        Parameters
+        ----------
+        zone_number : int
+            UTM zone number.
+        is_northern : bool
+            True for the northern hemisphere.
+
+        Returns
+        -------
+        epsg : int or None
+            The EPSG code, or None when the zone is unknown.
+        """
+        if self._utm_index is None:
+            self._load()
+            index = {}
+            offsets = np.asarray(self._offsets)
+            blob = bytes(self._defs).decode('utf-8')
+            for code, start, stop in zip(self._codes.tolist(),
+                                         offsets[:-1].tolist(),
+                                         offsets[1:].tolist()):
+                definition = blob[start:stop]
+                match = _UTM_PATTERN.search(definition)
+                if match and '+datum=WGS84' in definition:
+                    # keep the smallest code of each zone
+                    index.setdefault(
+                        (int(match.group(1)), match.group(2) is None), code)
+            self._utm_index = index
+        return self._utm_index.get((int(zone_number), bool(is_northern)))
+
+def build_epsg_registry(definitions, directory=None):
+    """
+    Write the registry files from a mapping of EPSG codes to proj strings.
+
+    Parameters
+    ----------
+    definitions : dict
+        EPSG codes mapped to their proj definition strings, e.g. as parsed
+        from the ``epsg`` file of a proj data directory.
+    directory : str, optional
+        Output directory. Defaults to the directory of the :mod:`gofast.geo`
+        package.
+
+    Returns
+    -------
+    registry : EPSGRegistry
+        The registry reading the written files.
+    """
+    directory = directory or _REGISTRY_DIR
+    codes = np.array(sorted(int(code) for code in definitions), dtype=np.int32)
+    encoded = [definitions[code].encode('utf-8') for code in codes.tolist()]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int32)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    np.save(os.path.join(directory, 'epsg_codes.npy'), codes)
+    np.save(os.path.join(directory, 'epsg_offsets.npy'), offsets)
+    np.save(os.path.join(directory, 'epsg_defs.npy'),
+            np.frombuffer(b''.join(encoded), dtype=np.uint8))
+    return EPSGRegistry(directory)
@@ -5,13 +5,15 @@
 import re 
 import os 
 import warnings 
-import numpy as np 
 
-from ..decorators import gdal_data_check
+from ..decorators import CheckGDALData
+from ._epsg import EPSGRegistry 
 
 with warnings.catch_warnings():  # noqa 
     warnings.filterwarnings(action='ignore', category=UserWarning)
-    HAS_GDAL = gdal_data_check(None)._gdal_data_found
+    _gdal_checker = CheckGDALData()
+    _gdal_checker._check_gdal_data()
+    HAS_GDAL = _gdal_checker._gdal_data_found
     NEW_GDAL = False
 
 HAS_PROJ=False 
@@ -47,7 +49,5 @@ try:
             pass  
    
 except Exception:
-    path = os.path.dirname(os.path.abspath(__file__))
-    epsg_dict_fn = os.path.join(path, 'epsg.npy')
-
-    EPSG_DICT = np.load(epsg_dict_fn, allow_pickle=True).item()
\ No newline at end of file
+    # memory-mapped on first lookup rather than unpickled at import
+    EPSG_DICT = EPSGRegistry()
@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""
+Geodesic Distances
+==================
+
+Vectorized great-circle (haversine) and ellipsoidal (Vincenty) distances
+between stations given by their latitude and longitude in decimal degrees.
+
+Distance matrices are computed by blocks of rows whose temporaries fit in
+a bounded working memory, and can be written into a preallocated output
+such as a :class:`numpy.memmap`. Nearest-station queries over large
+surveys use a :class:`StationIndex`, a ball tree (or a KD-tree for
+projected coordinates) built once and saved on disk.
+"""
+
+import warnings
+import numpy as np
+from joblib import dump, load
+from sklearn import get_config
+from sklearn.neighbors import BallTree, KDTree
+
+from ..exceptions import NotFittedError
+
+__all__ = [
+    "haversine",
+    "vincenty",
+    "geodesic_distances",
+    "iter_geodesic_distances",
+    "StationIndex",
+]
+
+# mean radius of the Earth in kilometers
+EARTH_RADIUS = 6371.
+# WGS84 ellipsoid, in kilometers
+_WGS84_A = 6378.137
+_WGS84_F = 1 / 298.257223563
+_WGS84_B = (1 - _WGS84_F) * _WGS84_A
+
+def haversine(lat1, lon1, lat2, lon2, radius=EARTH_RADIUS):
+    """
+    Great-circle distance between points on a sphere.
+
+    The arguments are broadcast against each other, so a point can be
+    compared with many others in one call.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : float or array-like
+        Coordinates in decimal degrees.
+    radius : float, default=6371.
+        Radius of the sphere. The default is the mean Earth radius in
+        kilometers.
+
+    Returns
+    -------
+    distance : float or ndarray
+        Distance in the unit of `radius`.
+
+    Examples
+    --------
+    >>> from gofast.geo.geodesic import haversine
+    >>> round(haversine(34.0522, -118.2437, 40.7128, -74.0060), 1)
+    3935.7
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2)
+         * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * radius * np.arcsin(np.sqrt(np.clip(a, 0, 1)))
+
+def vincenty(lat1, lon1, lat2, lon2, max_iter=200, tol=1e-12):
+    """
+    Distance between points on the WGS84 ellipsoid (Vincenty inverse
+    formula).
+
+    The iteration runs on the whole broadcast arrays. The few pairs that
+    do not converge (nearly antipodal points) fall back to the haversine
+    distance with a warning.
+
+    Parameters
+    ----------
+    lat1, lon1, lat2, lon2 : float or array-like
+        Coordinates in decimal degrees.
+    max_iter : int, default=200
+        Maximum number of iterations on the longitude on the auxiliary
+        sphere.
+    tol : float, default=1e-12
+        Convergence tolerance on that longitude, in radians.
+
+    Returns
+    -------
+    distance : float or ndarray
+        Distance in kilometers.
+
+    Examples
+    --------
+    >>> from gofast.geo.geodesic import vincenty
+    >>> round(vincenty(34.0522, -118.2437, 40.7128, -74.0060), 1)
+    3944.4
+    """
+    phi1, lon1, phi2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    # reduced latitudes
+    u1 = np.arctan((1 - _WGS84_F) * np.tan(phi1))
+    u2 = np.arctan((1 - _WGS84_F) * np.tan(phi2))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+    sin_u2, cos_u2 = np.sin(u2), np.cos(u2)
+    big_l = lon2 - lon1
+    lam = big_l
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for _ in range(max_iter):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.hypot(cos_u2 * sin_lam,
+                                 cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(
+                sin_sigma == 0, 0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            # equatorial lines have cos2_alpha = 0
+            cos_2sm = np.where(cos2_alpha == 0, 0,
+                               cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+            c = _WGS84_F / 16 * cos2_alpha * (
+                4 + _WGS84_F * (4 - 3 * cos2_alpha))
+            lam_prev = lam
+            lam = big_l + (1 - c) * _WGS84_F * sin_alpha * (
+                sigma + c * sin_sigma * (
+                    cos_2sm + c * cos_sigma * (-1 + 2 * cos_2sm ** 2)))
+            converged = np.abs(lam - lam_prev) <= tol
+            if np.all(converged):
+                break
+
+    u_sq = cos2_alpha * (_WGS84_A ** 2 - _WGS84_B ** 2) / _WGS84_B ** 2
+    big_a = 1 + u_sq / 16384 * (4096 + u_sq * (-768 + u_sq * (
+        320 - 175 * u_sq)))
+    big_b = u_sq / 1024 * (256 + u_sq * (-128 + u_sq * (74 - 47 * u_sq)))
+    delta_sigma = big_b * sin_sigma * (cos_2sm + big_b / 4 * (
+        cos_sigma * (-1 + 2 * cos_2sm ** 2) - big_b / 6 * cos_2sm * (
+            -3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sm ** 2)))
+    distance = _WGS84_B * big_a * (sigma - delta_sigma)
+
+    if not np.all(converged):
+        warnings.warn(
+            f"Vincenty formula did not converge for {np.sum(~converged)}"
+            " pair(s) of nearly antipodal points. Their haversine distance"
+            " is used instead.")
+        distance = np.where(converged, distance, haversine(
+            np.degrees(phi1), np.degrees(lon1), np.degrees(phi2),
+            np.degrees(lon2)))
+    return distance
+
+def iter_geodesic_distances(
+    X, Y=None, *, method='haversine', radius=EARTH_RADIUS,
+    working_memory=None,
+    ):
+    """
+    Generate the distance matrix between `X` and `Y` by blocks of rows.
+
+    Each block holds as many rows as fit in `working_memory`, so the
+    blocks can be reduced on the fly (e.g. nearest station, count within a
+    radius) without the full matrix in memory.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples_X, 2)
+        Latitude and longitude of the stations, in decimal degrees.
+    Y : array-like of shape (n_samples_Y, 2), optional
+        Latitude and longitude of the other stations. Defaults to `X`.
+    method : {'haversine', 'vincenty'}, default='haversine'
+        Great-circle distance on a sphere of `radius`, or distance on the
+        WGS84 ellipsoid.
+    radius : float, default=6371.
+        Sphere radius of the haversine distance, in kilometers.
+    working_memory : int, optional
+        Memory allowed for the temporaries of a block, in MiB. Defaults to
+        ``sklearn.get_config()['working_memory']``.
+
+    Yields
+    ------
+    rows : slice
+        The rows of `X` of the block.
+    distances : ndarray of shape (n_rows, n_samples_Y)
+        The distances in kilometers.
+    """
+    X, Y = _check_coordinates(X), (
+        None if Y is None else _check_coordinates(Y))
+    Y = X if Y is None else Y
+    method = _check_method(method)
+    working_memory = working_memory or get_config()['working_memory']
+    # float64 temporaries of a row block, about 12 for vincenty
+    n_temporaries = 12 if method == 'vincenty' else 4
+    block_size = max(1, int(working_memory * 2 ** 20 // (
+        8 * n_temporaries * max(len(Y), 1))))
+
+    lat2, lon2 = Y[:, 0], Y[:, 1]
+    for start in range(0, len(X), block_size):
+        rows = slice(start, min(start + block_size, len(X)))
+        lat1, lon1 = X[rows, :1], X[rows, 1:]
+        if method == 'vincenty':
+            block = vincenty(lat1, lon1, lat2, lon2)
+        else:
+            block = haversine(lat1, lon1, lat2, lon2, radius=radius)
+        yield rows, block
+
+def geodesic_distances(
+    X, Y=None, *, method='haversine', radius=EARTH_RADIUS,
+    working_memory=None, out=None,
+    ):
+    """
+    Distance matrix between stations given by latitude and longitude.
+
+    The matrix is filled by blocks of rows (see
+    :func:`iter_geodesic_distances`), so only the output is as large as
+    ``n_samples_X * n_samples_Y``. It can be a preallocated
+    :class:`numpy.memmap` for matrices larger than the memory.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples_X, 2) or (2,)
+        Latitude and longitude of the stations, in decimal degrees. A
+        single station gives the one-to-many distances to `Y`.
+    Y : array-like of shape (n_samples_Y, 2), optional
+        Latitude and longitude of the other stations. Defaults to `X`.
+    method : {'haversine', 'vincenty'}, default='haversine'
+        Great-circle distance on a sphere of `radius`, or distance on the
+        WGS84 ellipsoid.
+    radius : float, default=6371.
+        Sphere radius of the haversine distance, in kilometers.
+    working_memory : int, optional
+        Memory allowed for the temporaries of a block, in MiB.
+    out : ndarray of shape (n_samples_X, n_samples_Y), optional
+        Preallocated output.
+
+    Returns
+    -------
+    distances : ndarray of shape (n_samples_X, n_samples_Y) or (n_samples_Y,)
+        The distances in kilometers.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.geo.geodesic import geodesic_distances
+    >>> stations = np.c_[np.random.uniform(5, 10, 5000),
+    ...                  np.random.uniform(-8, -3, 5000)]
+    >>> boreholes = np.c_[np.random.uniform(5, 10, 300),
+    ...                   np.random.uniform(-8, -3, 300)]
+    >>> geodesic_distances(stations, boreholes).shape
+    (5000, 300)
+    >>> geodesic_distances(stations[0], boreholes).shape
+    (300,)
+    """
+    one_to_many = np.ndim(X) == 1
+    X = _check_coordinates(X)
+    Y = X if Y is None else _check_coordinates(Y)
+    if out is None:
+        out = np.empty((len(X), len(Y)))
+    elif out.shape != (len(X), len(Y)):
+        raise ValueError(f"Expect an output of shape {(len(X), len(Y))},"
+                         f" got {out.shape}.")
+    for rows, block in iter_geodesic_distances(
+            X, Y, method=method, radius=radius,
+            working_memory=working_memory):
+        out[rows] = block
+    return out[0] if one_to_many else out
+
+class StationIndex:
+    """
+    Spatial index of stations for k-nearest and radius queries.
+
+    Geographic coordinates are indexed with a ball tree on the haversine
+    metric; projected coordinates (e.g. UTM easting and northing) with a
+    KD-tree. A query costs about ``log(n_stations)`` per point instead of
+    a scan of every station, and the index can be saved on disk to be
+    reused across sessions.
+
+    Parameters
+    ----------
+    metric : {'haversine', 'euclidean'}, default='haversine'
+        'haversine' expects (latitude, longitude) in decimal degrees and
+        measures distances in kilometers on a sphere of `radius`.
+        'euclidean' expects projected coordinates and measures distances
+        in their unit.
+    leaf_size : int, default=40
+        Leaf size of the tree.
+    radius : float, default=6371.
+        Sphere radius of the haversine metric, in kilometers.
+
+    Attributes
+    ----------
+    tree_ : sklearn.neighbors.BallTree or sklearn.neighbors.KDTree
+        The fitted tree.
+    ids_ : ndarray of shape (n_stations,)
+        Identifiers of the stations; their positions when not given.
+    n_stations_ : int
+        Number of indexed stations.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.geo.geodesic import StationIndex
+    >>> boreholes = np.c_[np.random.uniform(5, 10, 100_000),
+    ...                   np.random.uniform(-8, -3, 100_000)]
+    >>> stations = np.c_[np.random.uniform(5, 10, 200_000),
+    ...                  np.random.uniform(-8, -3, 200_000)]
+    >>> index = StationIndex().fit(boreholes)
+    >>> distance, nearest = index.query(stations, k=1)
+    >>> within_5km = index.query_radius(stations, 5.)
+    >>> index.save('boreholes.idx')
+    >>> index = StationIndex.load('boreholes.idx')
+    """
+
+    def __init__(self, metric='haversine', leaf_size=40,
+                 radius=EARTH_RADIUS):
+        self.metric = metric
+        self.leaf_size = leaf_size
+        self.radius = radius
+
+    def fit(self, X, ids=None):
+        """
+        Build the index of the stations.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_stations, n_coordinates)
+            Coordinates of the stations; (latitude, longitude) in decimal
+            degrees for the haversine metric.
+        ids : array-like of shape (n_stations,), optional
+            Identifiers of the stations, e.g. their names.
+
+        Returns
+        -------
+        self : StationIndex
+        """
+        if self.metric not in ('haversine', 'euclidean'):
+            raise ValueError("metric must be 'haversine' or 'euclidean',"
+                             f" got {self.metric!r}")
+        points = self._to_tree_space(X)
+        if self.metric == 'haversine':
+            self.tree_ = BallTree(points, leaf_size=self.leaf_size,
+                                  metric='haversine')
+        else:
+            self.tree_ = KDTree(points, leaf_size=self.leaf_size)
+        self.n_stations_ = len(points)
+        self.ids_ = (np.arange(self.n_stations_) if ids is None
+                     else np.asarray(ids))
+        if len(self.ids_) != self.n_stations_:
+            raise ValueError(f"Expect {self.n_stations_} ids, got"
+                             f" {len(self.ids_)}.")
+        return self
+
+    def query(self, X, k=1, return_distance=True):
+        """
+        Find the `k` nearest stations of each point.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_points, n_coordinates)
+            Coordinates of the points, in the form of the indexed stations.
+        k : int, default=1
+            Number of neighbours.
+        return_distance : bool, default=True
+            Whether to return the distances too.
+
+        Returns
+        -------
+        distances : ndarray of shape (n_points, k)
+            Distances to the neighbours, sorted, in kilometers for the
+            haversine metric. Only returned with `return_distance`.
+        indices : ndarray of shape (n_points, k)
+            Positions of the neighbours in the indexed stations; their
+            identifiers are ``ids_[indices]``.
+        """
+        self._check_is_fitted()
+        result = self.tree_.query(
+            self._to_tree_space(X), k=k, return_distance=return_distance)
+        if not return_distance:
+            return result
+        distances, indices = result
+        return self._scale(distances), indices
+
+    def query_radius(self, X, r, return_distance=False, sort_results=False):
+        """
+        Find the stations within a distance of each point.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_points, n_coordinates)
+            Coordinates of the points, in the form of the indexed stations.
+        r : float or array-like of shape (n_points,)
+            Search distance, in kilometers for the haversine metric.
+        return_distance : bool, default=False
+            Whether to return the distances too.
+        sort_results : bool, default=False
+            Whether to sort the neighbours of each point by distance.
+            Needs `return_distance`.
+
+        Returns
+        -------
+        indices : ndarray of shape (n_points,) of ndarray
+            Positions of the stations within `r` of each point.
+        distances : ndarray of shape (n_points,) of ndarray
+            Their distances. Only returned with `return_distance`.
+        """
+        self._check_is_fitted()
+        r = np.asarray(r, dtype=float)
+        if self.metric == 'haversine':
+            r = r / self.radius
+        result = self.tree_.query_radius(
+            self._to_tree_space(X), r, return_distance=return_distance,
+            sort_results=sort_results)
+        if not return_distance:
+            return result
+        indices, distances = result
+        for i, d in enumerate(distances):
+            distances[i] = self._scale(d)
+        return indices, distances
+
+    def save(self, filename, compress=0):
+        """
+        Save the index on disk with :func:`joblib.dump`.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the file.
+        compress : int, default=0
+            Compression level of :func:`joblib.dump`.
+
+        Returns
+        -------
+        filename : str
+        """
+        self._check_is_fitted()
+        dump(self, filename, compress=compress)
+        return filename
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load an index saved with :meth:`save`.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the file.
+
+        Returns
+        -------
+        index : StationIndex
+        """
+        index = load(filename)
+        if not isinstance(index, cls):
+            raise TypeError(f"{filename!r} does not hold a {cls.__name__},"
+                            f" got {type(index).__name__!r}")
+        return index
+
+    def _to_tree_space(self, X):
+        if self.metric == 'haversine':
+            return np.radians(_check_coordinates(X))
+        X = np.asarray(X, dtype=float)
+        return X.reshape(1, -1) if X.ndim == 1 else X
+
+    def _scale(self, distances):
+        return (distances * self.radius if self.metric == 'haversine'
+                else distances)
+
+    def _check_is_fitted(self):
+        if not hasattr(self, 'tree_'):
+            raise NotFittedError(
+                f"{type(self).__name__} is not fitted yet. Call 'fit' with"
+                " the coordinates of the stations first.")
+
+    def __repr__(self):
+        fitted = (f", n_stations={self.n_stations_}"
+                  if hasattr(self, 'tree_') else "")
+        return (f"{type(self).__name__}(metric={self.metric!r},"
+                f" leaf_size={self.leaf_size}{fitted})")
+
+def _check_coordinates(X):
+    """Return the (latitude, longitude) coordinates as a 2D float array."""
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X.reshape(1, -1)
+    if X.ndim != 2 or X.shape[1] != 2:
+        raise ValueError("Expect (latitude, longitude) coordinates of shape"
+                         f" (n_samples, 2), got an array of shape {X.shape}.")
+    return X
+
+def _check_method(method):
+    method = str(method).lower().strip()
+    if method not in ('haversine', 'vincenty'):
+        raise ValueError("method must be 'haversine' or 'vincenty', got"
+                         f" {method!r}")
+    return method
@@ -13,7 +13,11 @@ pyproj is used. Main functions are:
     * project_point_ll2utm
     * project_point_utm2ll
     
-These can take in a point or an array or list of points to project.
+These can take in a point or an array or list of points to project. Large 
+sets of points are better projected in one vectorized pass with:
+
+    * project_ll2utm_batch
+    * project_utm2ll_batch
 
 latitude and longitude can be input as:
     * 'DD:mm:ss.ms'
@@ -22,16 +26,18 @@ latitude and longitude can be input as:
     
 """
 
+import threading 
 import numpy as np
 
 from .._gofastlog import gofastlog
 from ..decorators import (
-    deprecated ,
-    gdal_data_check
+    Deprecated as deprecated,
+    CheckGDALData 
     )
 from ..exceptions import ( 
     GISError
     )
+from ._epsg import EPSGRegistry 
   
 try : 
     from ._set_gdal import HAS_GDAL, EPSG_DICT, NEW_GDAL 
@@ -42,9 +48,11 @@ try :
     else:
         import pyproj
 except :
-    HAS_GDAL =False
+    HAS_GDAL = NEW_GDAL = False
     pass 
 
+gdal_data_check = CheckGDALData()
+
 _logger = gofastlog.get_gofast_logger(__name__)
 
 def assert_xy_coordinate_system (x, y ): 
@@ -564,31 +572,16 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
                     
     """
 
-    lat = np.array(lat)
-    lon = np.array(lon)
+    if lat is None or lon is None:
+        return None, None, None
 
     # check length of arrays
     if np.shape(lat) != np.shape(lon):
         raise ValueError("latitude and longitude arrays are of different lengths")
 
-    # flatten, if necessary
-    flattened = False
-    llshape = np.shape(lat)
-    if llshape[0] > 1:
-        flattened = True
-        lat = lat.flatten()
-        lon = lon.flatten()
-
-    '''
-    # check lat/lon values
-    # this is incredibly slow; disabling for the time being
-    for ii in range(len(lat)):
-        lat[ii] = assert_lat_value(lat[ii])
-        lon[ii] = assert_lon_value(lon[ii])
-    '''
-    
-    if lat is None or lon is None:
-        return None, None, None
+    # check lat/lon values in one vectorized pass and flatten
+    lat = _as_degrees(lat, 'latitude')
+    lon = _as_degrees(lon, 'longitude')
 
     if HAS_GDAL:
         # set utm coordinate system
@@ -617,8 +610,6 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
             if(utm_zone>0):
                 # set projection info
                 utm_cs.SetUTM(abs(utm_zone), utm_zone > 0)
-        else:
-            pp = pyproj.Proj('+init=EPSG:%d'%(epsg))
         # end if
     else:
         if utm_zone is not None:
@@ -634,10 +625,6 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
 
         if(HAS_GDAL):
             utm_cs.SetUTM(zone_number, is_northern)
-        else:
-            projstring = '+proj=utm +zone=%d +%s +datum=%s' % \
-                         (zone_number, 'north' if is_northern else 'south', datum)
-            pp = pyproj.Proj(projstring)
         # end if
     # end if
     
@@ -646,17 +633,12 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
         easting, northing, elev = np.array(ll2utm(np.array([lon, lat]).T)).T
 
     else:
-        ll2utm = pp
-        easting, northing = ll2utm(lon, lat)
+        easting, northing, _ = project_ll2utm_batch(
+            lat, lon, datum=datum, utm_zone=utm_zone, epsg=epsg)
     # end if
 
     projected_point = (easting, northing, utm_zone)
 
-    # reshape back into original shape
-    if flattened:
-        lat = lat.reshape(llshape)
-        lon = lon.reshape(llshape)
-
     return projected_point
 # end func
 
@@ -721,86 +703,30 @@ def ll_to_utm(reference_ellipsoid, lat, lon):
     Lat and Long are in decimal degrees
     Written by Chuck Gantz- chuck.gantz@globalstar.com
 
+    `lat` and `lon` can also be arrays, in which case the zone is inferred 
+    for each point and arrays are returned.
+
     Outputs:
         UTMzone, easting, northing"""
 
     a = _ellipsoid[reference_ellipsoid][_equatorial_radius]
     ecc_squared = _ellipsoid[reference_ellipsoid][_eccentricity_squared]
-    k0 = 0.9996
     if isinstance (lat, str): 
         lat = convert_position_str2float(lat) 
     if isinstance (lon, str): 
         lon = convert_position_str2float(lon) 
-        
+    lat = np.asarray(lat, dtype=float)
     # Make sure the longitude is between -180.00 .. 179.9
-    long_temp = (lon + 180) - int((lon + 180) / 360) * 360 - 180  # -180.00 .. 179.9
-
-    lat_rad = lat * _deg2rad
-    long_rad = long_temp * _deg2rad
-
-    zone_number = int((long_temp + 180) / 6) + 1
-
-    if 56.0 <= lat < 64.0 and 3.0 <= long_temp < 12.0:
-        zone_number = 32
+    long_temp = _normalize_longitude(np.asarray(lon, dtype=float))
 
-    # Special zones for Svalbard
-    if 72.0 <= lat < 84.0:
-        if 0.0 <= long_temp < 9.0:
-            zone_number = 31
-        elif 9.0 <= long_temp < 21.0:
-            zone_number = 33
-        elif 21.0 <= long_temp < 33.0:
-            zone_number = 35
-        elif 33.0 <= long_temp < 42.0:
-            zone_number = 37
-
-    long_origin = (zone_number - 1) * 6 - 180 + 3  # +3 puts origin in middle of zone
-    long_origin_rad = long_origin * _deg2rad
+    zone_number = _utm_zone_numbers(lat, long_temp)
+    utm_easting, utm_northing = _ll_to_utm_arrays(
+        lat, long_temp, zone_number, lat >= 0, a, ecc_squared)
 
     # compute the UTM Zone from the latitude and longitude
-    utm_zone = "%d%c" % (zone_number, _utm_letter_designator(lat))
-
-    ecc_prime_squared = ecc_squared / (1 - ecc_squared)
-    N = a / np.sqrt(1 - ecc_squared * np.sin(lat_rad) ** 2)
-    T = np.tan(lat_rad) ** 2
-    C = ecc_prime_squared * np.cos(lat_rad) ** 2
-    A = np.cos(lat_rad) * (long_rad - long_origin_rad)
-
-    M = a * (
-        (1
-         - ecc_squared / 4
-         - 3 * ecc_squared ** 2 / 64
-         - 5 * ecc_squared ** 3 / 256) * lat_rad
-        - (3 * ecc_squared / 8
-           + 3 * ecc_squared ** 2 / 32
-           + 45 * ecc_squared ** 3 / 1024) * np.sin(2 * lat_rad)
-        + (15 * ecc_squared ** 2 / 256
-           + 45 * ecc_squared ** 3 / 1024) * np.sin(4 * lat_rad)
-        - (35 * ecc_squared ** 3 / 3072) * np.sin(6 * lat_rad))
-
-    utm_easting = (k0 * N * (A
-                             + (1 - T + C) * A ** 3 / 6
-                             + (5 - 18 * T
-                                + T ** 2
-                                + 72 * C
-                                - 58 * ecc_prime_squared) * A ** 5 / 120)
-                   + 500000.0)
-
-    utm_northing = (k0 * (M
-                          + N * np.tan(lat_rad) * (A ** 2 / 2
-                                                   + (5
-                                                      - T
-                                                      + 9 * C
-                                                      + 4 * C ** 2) * A ** 4 / 24
-                                                   + (61
-                                                      - 58 * T
-                                                      + T ** 2
-                                                      + 600 * C
-                                                      - 330 * ecc_prime_squared
-                                                      ) * A ** 6 / 720)))
-
-    if lat < 0:
-        utm_northing = utm_northing + 10000000.0  # 10000000 meter offset for southern hemisphere
+    utm_zone = np.char.add(zone_number.astype(str), _utm_letters(lat))
+    if utm_zone.ndim == 0:
+        return str(utm_zone), float(utm_easting), float(utm_northing)
     return utm_zone, utm_easting, utm_northing
 
 
@@ -862,26 +788,123 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     Written by Chuck Gantz- chuck.gantz@globalstar.com
     Converted to Python by Russ Nelson <nelson@crynwr.com>
 
+    `northing` and `easting` can also be arrays of points of the same zone.
+
     Outputs:
         Lat,Lon
     """
-
-    k0 = 0.9996
     a = _ellipsoid[reference_ellipsoid][_equatorial_radius]
     ecc_squared = _ellipsoid[reference_ellipsoid][_eccentricity_squared]
-    e1 = (1 - np.sqrt(1 - ecc_squared)) / (1 + np.sqrt(1 - ecc_squared))
-    # NorthernHemisphere; //1 for northern hemispher, 0 for southern
-
-    x = easting - 500000.0  # remove 500,000 meter offset for longitude
-    y = northing
 
     zone_letter = zone[-1]
     zone_number = int(zone[:-1])
-    if zone_letter >= 'N':
-        NorthernHemisphere = 1  # point is in northern hemisphere
-    else:
-        NorthernHemisphere = 0  # point is in southern hemisphere
-        y -= 10000000.0  # remove 10,000,000 meter offset used for southern hemisphere
+    # point is in northern hemisphere from the 'N' band
+    lat, lon = _utm_to_ll_arrays(
+        np.asarray(easting, dtype=float), np.asarray(northing, dtype=float), 
+        zone_number, zone_letter.upper() >= 'N', a, ecc_squared)
+    if lat.ndim == 0:
+        return float(lat), float(lon)
+    return lat, lon
+
+def _normalize_longitude(lon):
+    """Wrap longitudes into [-180, 180)."""
+    return (lon + 180) - np.trunc((lon + 180) / 360) * 360 - 180
+
+def _utm_zone_numbers(lat, lon):
+    """
+    UTM zone number of each point, with the Norway and Svalbard exceptions.
+    `lon` is expected in [-180, 180).
+    """
+    zone_number = np.floor((lon + 180) / 6).astype(int) + 1
+    zone_number = np.where(
+        (56.0 <= lat) & (lat < 64.0) & (3.0 <= lon) & (lon < 12.0),
+        32, zone_number)
+    # Special zones for Svalbard
+    svalbard = (72.0 <= lat) & (lat < 84.0)
+    for zone, west, east in ((31, 0., 9.), (33, 9., 21.), (35, 21., 33.), 
+                             (37, 33., 42.)):
+        zone_number = np.where(svalbard & (west <= lon) & (lon < east),
+                               zone, zone_number)
+    return np.clip(zone_number, 1, 60)
+
+# latitude bands of 8 degrees from 80S, X stretched to 84N, Z outside
+_UTM_BANDS = np.array(list('CDEFGHJKLMNPQRSTUVWXXZ'))
+# zone strings looked up by (zone number, band index)
+_UTM_ZONE_TABLE = np.array([[f'{zone:02d}{band}' for band in _UTM_BANDS]
+                            for zone in range(61)], dtype='U3')
+
+def _utm_bands(lat):
+    """Index of the UTM latitude band of each point in `_UTM_BANDS`."""
+    band = np.clip(np.floor((lat + 80) / 8).astype(int), 0, 20)
+    return np.where((lat < -80) | (lat > 84), 21, band)
+
+def _utm_letters(lat):
+    """UTM latitude band letter of each point, 'Z' outside 80S-84N."""
+    return _UTM_BANDS[_utm_bands(lat)]
+
+def _ll_to_utm_arrays(lat, lon, zone_number, is_northern, a, ecc_squared):
+    """Vectorized forward projection (USGS Bulletin 1532) of decimal
+    degrees onto the given zones."""
+    k0 = 0.9996
+    lat_rad = lat * _deg2rad
+    long_rad = lon * _deg2rad
+    # +3 puts origin in middle of zone
+    long_origin_rad = ((zone_number - 1) * 6 - 180 + 3) * _deg2rad
+
+    ecc_prime_squared = ecc_squared / (1 - ecc_squared)
+    sin_lat, cos_lat, tan_lat = np.sin(lat_rad), np.cos(lat_rad), np.tan(lat_rad)
+    N = a / np.sqrt(1 - ecc_squared * sin_lat ** 2)
+    T = tan_lat ** 2
+    C = ecc_prime_squared * cos_lat ** 2
+    A = cos_lat * (long_rad - long_origin_rad)
+
+    M = a * (
+        (1
+         - ecc_squared / 4
+         - 3 * ecc_squared ** 2 / 64
+         - 5 * ecc_squared ** 3 / 256) * lat_rad
+        - (3 * ecc_squared / 8
+           + 3 * ecc_squared ** 2 / 32
+           + 45 * ecc_squared ** 3 / 1024) * np.sin(2 * lat_rad)
+        + (15 * ecc_squared ** 2 / 256
+           + 45 * ecc_squared ** 3 / 1024) * np.sin(4 * lat_rad)
+        - (35 * ecc_squared ** 3 / 3072) * np.sin(6 * lat_rad))
+
+    utm_easting = (k0 * N * (A
+                             + (1 - T + C) * A ** 3 / 6
+                             + (5 - 18 * T
+                                + T ** 2
+                                + 72 * C
+                                - 58 * ecc_prime_squared) * A ** 5 / 120)
+                   + 500000.0)
+
+    utm_northing = (k0 * (M
+                          + N * tan_lat * (A ** 2 / 2
+                                           + (5
+                                              - T
+                                              + 9 * C
+                                              + 4 * C ** 2) * A ** 4 / 24
+                                           + (61
+                                              - 58 * T
+                                              + T ** 2
+                                              + 600 * C
+                                              - 330 * ecc_prime_squared
+                                              ) * A ** 6 / 720)))
+    # 10000000 meter offset for southern hemisphere
+    utm_northing = np.where(is_northern, utm_northing, 
+                            utm_northing + 10000000.0)
+    return utm_easting, utm_northing
+
+def _utm_to_ll_arrays(easting, northing, zone_number, is_northern, a, 
+                      ecc_squared):
+    """Vectorized inverse projection (USGS Bulletin 1532) of UTM points
+    to decimal degrees."""
+    k0 = 0.9996
+    e1 = (1 - np.sqrt(1 - ecc_squared)) / (1 + np.sqrt(1 - ecc_squared))
+
+    x = easting - 500000.0  # remove 500,000 meter offset for longitude
+    # remove 10,000,000 meter offset used for southern hemisphere
+    y = np.where(is_northern, northing, northing - 10000000.0)
 
     # +3 puts origin in middle of zone
     long_origin = (zone_number - 1) * 6 - 180 + 3
@@ -895,13 +918,12 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     phi1_rad = (mu + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * np.sin(2 * mu)
                 + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * np.sin(4 * mu)
                 + (151 * e1 ** 3 / 96) * np.sin(6 * mu))
-    phi1 = phi1_rad * _rad2deg
 
-    n1 = a / np.sqrt(1 - ecc_squared * np.sin(phi1_rad) ** 2)
+    sin_phi1 = np.sin(phi1_rad)
+    n1 = a / np.sqrt(1 - ecc_squared * sin_phi1 ** 2)
     t1 = np.tan(phi1_rad) ** 2
     c1 = ecc_prime_squared * np.cos(phi1_rad) ** 2
-    r1 = a * (1 - ecc_squared) / np.power(1 - ecc_squared *
-                                          np.sin(phi1_rad) ** 2, 1.5)
+    r1 = a * (1 - ecc_squared) / np.power(1 - ecc_squared * sin_phi1 ** 2, 1.5)
     d = x / (n1 * k0)
 
     lat = phi1_rad - (n1 * np.tan(phi1_rad) / r1) * (
@@ -1178,6 +1200,9 @@ def utm_zone_to_epsg(zone_number, is_northern):
         32755
 
     """
+    if isinstance(EPSG_DICT, EPSGRegistry):
+        # indexed lookup instead of a scan of the definitions
+        return EPSG_DICT.utm_zone_to_epsg(zone_number, is_northern)
     for key in list(EPSG_DICT.keys()):
         val = EPSG_DICT[key]
         if ('+zone={:<2}'.format(zone_number) in val) and \
@@ -1324,23 +1349,8 @@ def validate_input_values(values, location_type=None):
     # Flatten to 1D
     values = values.flatten()
 
-    if location_type in ['lat', 'latitude']:
-        for ii, value in enumerate(values):
-            try:
-                values[ii] = assert_lat_value(value)
-            except GISError as error:
-                raise GISError('{0}\n Bad input value at index {1}'.format(
-                               error, ii))
-        values = values.astype(float)
-
-    if location_type in ['lon', 'longitude']:
-        for ii, value in enumerate(values):
-            try:
-                values[ii] = assert_lon_value(value)
-            except GISError as error:
-                raise GISError('{0}\n Bad input value at index {1}'.format(
-                               error, ii))
-        values = values.astype(float)
+    if location_type in ['lat', 'latitude', 'lon', 'longitude']:
+        values = _as_degrees(values, location_type)
 
     return values
 
@@ -1515,29 +1525,31 @@ def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
         zone_number, is_northern, utm_zone = get_utm_zone(lat.mean(),
                                                           lon.mean())
     epsg = validate_epsg(epsg)
-    if HAS_GDAL:
-        ll2utm = _get_gdal_projection_ll2utm(datum, utm_zone, epsg)
-    else:
-        ll2utm = _get_pyproj_projection(datum, utm_zone, epsg)
 
     # return different results depending on if lat/lon are iterable
     projected_point = np.zeros_like(lat, dtype=[('easting', float),
                                                 ('northing', float),
                                                 ('elev', float),
                                                 ('utm_zone', 'U3')])
+    projected_point['utm_zone'] = utm_zone
 
-    for ii in range(lat.size):
-        if NEW_GDAL:
-            point = ll2utm(lat[ii], lon[ii])
-        else:
-            point = ll2utm(lon[ii], lat[ii])
+    if HAS_GDAL:
+        ll2utm = _get_gdal_projection_ll2utm(datum, utm_zone, epsg)
+        for ii in range(lat.size):
+            if NEW_GDAL:
+                point = ll2utm(lat[ii], lon[ii])
+            else:
+                point = ll2utm(lon[ii], lat[ii])
 
-        projected_point['easting'][ii] = point[0]
-        projected_point['northing'][ii] = point[1]
-        if HAS_GDAL:
+            projected_point['easting'][ii] = point[0]
+            projected_point['northing'][ii] = point[1]
             projected_point['elev'][ii] = point[2]
-
-        projected_point['utm_zone'][ii] = utm_zone
+    else:
+        # all the points in one call
+        easting, northing, _ = project_ll2utm_batch(
+            lat, lon, datum=datum, utm_zone=utm_zone, epsg=epsg)
+        projected_point['easting'] = easting
+        projected_point['northing'] = northing
 
     # if just projecting one point, then return as a tuple so as not to break
     # anything.  In the future we should adapt to just return a record array
@@ -1599,17 +1611,13 @@ def project_point_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None):
     northing = validate_input_values(northing)
     epsg = validate_epsg(epsg)
 
-    if HAS_GDAL:
-        utm2ll = _get_gdal_projection_utm2ll(datum, utm_zone, epsg)
-    else:
-        utm2ll = _get_pyproj_projection(datum, utm_zone, epsg)
-
     # return different results depending on if lat/lon are iterable
     projected_point = np.zeros_like(easting,
                                     dtype=[('latitude', float),
                                            ('longitude', float)])
-    for ii in range(easting.size):
-        if HAS_GDAL:
+    if HAS_GDAL:
+        utm2ll = _get_gdal_projection_utm2ll(datum, utm_zone, epsg)
+        for ii in range(easting.size):
             point = utm2ll(easting[ii], northing[ii], 0.0)
 
             try:
@@ -1619,11 +1627,12 @@ def project_point_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None):
             except GISError:
                 projected_point['latitude'][ii] = round(point[1], 6)
                 projected_point['longitude'][ii] = round(point[0], 6)
-
-        else:
-            point = utm2ll(easting[ii], northing[ii], inverse=True)
-            projected_point['latitude'][ii] = round(point[1], 6)
-            projected_point['longitude'][ii] = round(point[0], 6)
+    else:
+        # all the points in one call
+        lat, lon = project_utm2ll_batch(
+            easting, northing, utm_zone, datum=datum, epsg=epsg)
+        projected_point['latitude'] = np.round(lat, 6)
+        projected_point['longitude'] = np.round(lon, 6)
 
     # if just projecting one point, then return as a tuple so as not to break
     # anything.  In the future we should adapt to just return a record array
@@ -1634,6 +1643,371 @@ def project_point_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None):
         return np.rec.array(projected_point)
 
 
+# ==============================================================================
+# Batch projection
+# ==============================================================================
+# (geographic, northern UTM base, southern UTM base) EPSG codes per datum
+_DATUM_EPSG = {
+    'WGS84': (4326, 32600, 32700), 
+    'NAD83': (4269, 26900, None), 
+    'NAD27': (4267, 26700, None), 
+    }
+# ellipsoid index in `_ellipsoid` per datum
+_DATUM_ELLIPSOID = {'WGS84': 23, 'WGS72': 22, 'NAD83': 11, 'GRS80': 11,
+                    'NAD27': 5}
+
+_transformer_pool = threading.local()
+
+def get_transformer(crs_from, crs_to):
+    """
+    Get a cached :class:`pyproj.Transformer` between two coordinate systems.
+
+    Transformers are costly to build, so one is created per pair of 
+    coordinate systems and per thread (pyproj transformers are not 
+    thread-safe), then reused by every later call.
+
+    Parameters
+    ----------
+    crs_from, crs_to : int or str
+        EPSG numbers, or any coordinate system definition understood by 
+        :meth:`pyproj.CRS.from_user_input`.
+
+    Returns
+    -------
+    transformer : pyproj.Transformer
+        Transformer taking and returning (x, y), i.e. (longitude, latitude)
+        for geographic coordinate systems.
+
+    Examples
+    --------
+    >>> from gofast.geo.gisutils import get_transformer
+    >>> get_transformer(4326, 32755).transform(149.2010301, -34.299442)
+    (702562.69..., 6202448.56...)
+    """
+    pool = getattr(_transformer_pool, 'transformers', None)
+    if pool is None:
+        pool = _transformer_pool.transformers = {}
+    key = (crs_from, crs_to)
+    transformer = pool.get(key)
+    if transformer is None:
+        try:
+            import pyproj
+        except ImportError:
+            raise ImportError("pyproj is required for projecting with"
+                              " transformers. Use engine='numpy' instead.")
+        transformer = pool[key] = pyproj.Transformer.from_crs(
+            crs_from, crs_to, always_xy=True)
+    return transformer
+
+def get_utm_zones(latitude, longitude):
+    """
+    Vectorized :func:`get_utm_zone`: get the UTM zone of each point.
+
+    Unlike :func:`get_utm_zone`, the Norway (32V) and Svalbard (31X to 37X)
+    zone exceptions are applied.
+
+    Parameters
+    ----------
+    latitude, longitude : array-like
+        Coordinates in decimal degrees or 'DD:mm:ss.ms' strings.
+
+    Returns
+    -------
+    zone_number : ndarray of int
+        UTM zone number of each point.
+    is_northern : ndarray of bool
+        True for the points in the northern hemisphere.
+    utm_zone : ndarray of str
+        UTM zone of each point, e.g. '55H'.
+
+    Examples
+    --------
+    >>> from gofast.geo.gisutils import get_utm_zones
+    >>> get_utm_zones([-34.299442, 60.], [149.2010301, 5.])
+    (array([55, 32]), array([False,  True]), array(['55H', '32V'], dtype='<U3'))
+    """
+    lat = _as_degrees(latitude, 'latitude')
+    lon = _normalize_longitude(_as_degrees(longitude, 'longitude'))
+    zone_number = _utm_zone_numbers(lat, lon)
+    return zone_number, lat >= 0, _format_utm_zones(zone_number, lat)
+
+def project_ll2utm_batch(
+    lat, lon, datum='WGS84', utm_zone=None, epsg=None, engine='auto'):
+    """
+    Project many latitude/longitude points to UTM in one vectorized pass.
+
+    Unless a `utm_zone` or an `epsg` is given, each point is projected onto
+    its own UTM zone. Points are grouped by zone and each group is 
+    projected with a single call to a cached pyproj transformer (see 
+    :func:`get_transformer`), or with the closed-form formulas of 
+    :func:`ll_to_utm` evaluated on the whole arrays when pyproj is not 
+    installed.
+
+    Parameters
+    ----------
+    lat, lon : array-like
+        Coordinates in decimal degrees or 'DD:mm:ss.ms' strings. They are 
+        flattened.
+    datum : str, default='WGS84'
+        Well known datum, e.g. 'WGS84', 'NAD83' or 'NAD27'.
+    utm_zone : str or int, optional
+        Zone {0-9}{0-9}{C-X} or {+, -}{0-9}{0-9} onto which every point is
+        projected.
+    epsg : int, optional
+        EPSG number of the target projection. Overrides `utm_zone`.
+    engine : {'auto', 'pyproj', 'numpy'}, default='auto'
+        Projection backend. 'auto' uses pyproj when it is installed.
+
+    Returns
+    -------
+    easting, northing : ndarray
+        Projected coordinates in meters.
+    utm_zone : ndarray of str
+        UTM zone of each point. Empty when `epsg` is not a WGS84 UTM 
+        projection.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.geo.gisutils import project_ll2utm_batch
+    >>> lat = np.random.uniform(-34.5, -34.0, 1_000_000)
+    >>> lon = np.random.uniform(148.0, 150.0, 1_000_000)
+    >>> easting, northing, utm_zone = project_ll2utm_batch(lat, lon)
+    >>> np.unique(utm_zone)
+    array(['55H', '56H'], dtype='<U3')
+    """
+    lat = _as_degrees(lat, 'latitude')
+    lon = _normalize_longitude(_as_degrees(lon, 'longitude'))
+    if lat.shape != lon.shape:
+        raise ValueError("latitude and longitude arrays are of different"
+                         " lengths")
+    engine = _check_engine(engine)
+
+    epsg = validate_epsg(epsg)
+    if epsg is not None:
+        zone = _split_utm_epsg(epsg)
+        if zone is None:
+            if engine == 'numpy':
+                raise GISError(f"EPSG {epsg} is not a WGS84 UTM projection;"
+                               " pyproj is required to project onto it.")
+            easting, northing = get_transformer(
+                _datum_crs(datum)[0], epsg).transform(lon, lat)
+            return (np.asarray(easting), np.asarray(northing), 
+                    np.full(lat.shape, '', dtype='U3'))
+        datum = 'WGS84'
+        zone_number = np.full(lat.shape, zone[0])
+        is_northern = np.full(lat.shape, zone[1])
+        utm_zones = _format_utm_zones(zone_number, lat)
+    elif utm_zone not in [None, 'none', 'None']:
+        number, northern = _split_utm_zones(np.asarray(
+            validate_utm_zone(utm_zone)))
+        zone_number = np.full(lat.shape, number)
+        is_northern = np.full(lat.shape, northern)
+        utm_zones = np.full(lat.shape, str(utm_zone), dtype='U3')
+    else:
+        zone_number = _utm_zone_numbers(lat, lon)
+        is_northern = lat >= 0
+        utm_zones = _format_utm_zones(zone_number, lat)
+
+    if engine == 'numpy':
+        easting, northing = _ll_to_utm_arrays(
+            lat, lon, zone_number, is_northern, *_datum_ellipsoid(datum))
+        return easting, northing, utm_zones
+
+    easting, northing = np.empty_like(lat), np.empty_like(lat)
+    for index, number, northern in _group_by_zone(zone_number, is_northern):
+        geographic, projected = _datum_crs(datum, number, northern)
+        easting[index], northing[index] = get_transformer(
+            geographic, projected).transform(lon[index], lat[index])
+    return easting, northing, utm_zones
+
+def project_utm2ll_batch(
+    easting, northing, utm_zone=None, datum='WGS84', epsg=None, 
+    engine='auto'):
+    """
+    Project many UTM points to latitude/longitude in one vectorized pass.
+
+    Parameters
+    ----------
+    easting, northing : array-like
+        Coordinates in meters. They are flattened.
+    utm_zone : str, int or array-like
+        Zone {0-9}{0-9}{C-X} or {+, -}{0-9}{0-9} of all the points, or one 
+        zone per point as returned by :func:`project_ll2utm_batch`.
+    datum : str, default='WGS84'
+        Well known datum, e.g. 'WGS84', 'NAD83' or 'NAD27'.
+    epsg : int, optional
+        EPSG number of the source projection. Overrides `utm_zone`.
+    engine : {'auto', 'pyproj', 'numpy'}, default='auto'
+        Projection backend. 'auto' uses pyproj when it is installed.
+
+    Returns
+    -------
+    lat, lon : ndarray
+        Coordinates in decimal degrees.
+
+    Examples
+    --------
+    >>> from gofast.geo.gisutils import project_utm2ll_batch
+    >>> project_utm2ll_batch([702562.69, 276979.93], 
+    ...                      [6202448.57, 6658157.20], ['55H', '32V'])
+    (array([-34.299442,  60.      ]), array([149.2010301,   5.       ]))
+    """
+    easting = np.asarray(easting, dtype=float).ravel()
+    northing = np.asarray(northing, dtype=float).ravel()
+    if easting.shape != northing.shape:
+        raise ValueError("easting and northing arrays are of different"
+                         " lengths")
+    engine = _check_engine(engine)
+
+    epsg = validate_epsg(epsg)
+    if epsg is not None:
+        zone = _split_utm_epsg(epsg)
+        if zone is None:
+            if engine == 'numpy':
+                raise GISError(f"EPSG {epsg} is not a WGS84 UTM projection;"
+                               " pyproj is required to project from it.")
+            lon, lat = get_transformer(
+                epsg, _datum_crs(datum)[0]).transform(easting, northing)
+            return np.asarray(lat), np.asarray(lon)
+        datum = 'WGS84'
+        zone_number, is_northern = zone
+    elif utm_zone is None:
+        raise GISError('Need to input either UTM zone or EPSG number')
+    else:
+        utm_zone = np.asarray(utm_zone)
+        if utm_zone.dtype.kind in 'SO':
+            utm_zone = utm_zone.astype(str)
+        zone_number, is_northern = _split_utm_zones(utm_zone)
+    zone_number = np.broadcast_to(zone_number, easting.shape)
+    is_northern = np.broadcast_to(is_northern, easting.shape)
+
+    if engine == 'numpy':
+        return _utm_to_ll_arrays(easting, northing, zone_number, is_northern,
+                                 *_datum_ellipsoid(datum))
+
+    lat, lon = np.empty_like(easting), np.empty_like(easting)
+    for index, number, northern in _group_by_zone(zone_number, is_northern):
+        geographic, projected = _datum_crs(datum, number, northern)
+        lon[index], lat[index] = get_transformer(
+            projected, geographic).transform(easting[index], northing[index])
+    return lat, lon
+
+def _as_degrees(values, location_type='latitude'):
+    """
+    Convert `values` to a flat array of decimal degrees and check their 
+    range in one vectorized pass.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'OU':
+        values = np.array([
+            convert_position_str2float(v) if isinstance(v, str) and ':' in v 
+            else v for v in values.ravel()], dtype=float)
+    values = values.astype(float).ravel()
+
+    name, limit = (('Latitude', 90) if location_type.startswith('lat') 
+                   else ('Longitude', 180))
+    with np.errstate(invalid='ignore'):
+        bad = np.flatnonzero(np.abs(values) >= limit)
+    if bad.size:
+        raise GISError('|{0}| > {1}, unacceptable!\n Bad input value at'
+                       ' index {2}'.format(name, limit, bad[0]))
+    return values
+
+def _check_engine(engine):
+    """Resolve the projection backend of the batch functions."""
+    if engine not in ('auto', 'pyproj', 'numpy'):
+        raise ValueError("engine must be 'auto', 'pyproj' or 'numpy';"
+                         f" got {engine!r}")
+    if engine == 'auto':
+        try:
+            import pyproj # noqa
+            engine = 'pyproj'
+        except ImportError:
+            engine = 'numpy'
+    return engine
+
+def _format_utm_zones(zone_number, lat):
+    """Zone strings such as '55H' from zone numbers and latitudes."""
+    return _UTM_ZONE_TABLE[zone_number, _utm_bands(lat)]
+
+def _split_utm_zones(utm_zone):
+    """
+    Vectorized :func:`split_utm_zone` of an array of zones. Letters from 
+    'N' are the northern bands.
+    """
+    if utm_zone.dtype.kind in 'iuf':
+        utm_zone = utm_zone.astype(int)
+        return np.abs(utm_zone), utm_zone >= 0
+    # parse each distinct zone only once
+    zones, inverse = np.unique(utm_zone, return_inverse=True)
+    try:
+        numbers = np.array([int(zone[:-1]) for zone in zones])
+    except ValueError:
+        raise GISError(f"Invalid UTM zones {zones.tolist()}")
+    northern = np.array([zone[-1].upper() >= 'N' for zone in zones])
+    return (numbers[inverse].reshape(utm_zone.shape), 
+            northern[inverse].reshape(utm_zone.shape))
+
+def _split_utm_epsg(epsg):
+    """Zone number and hemisphere of a WGS84 UTM EPSG number, or None."""
+    if 32601 <= epsg <= 32660:
+        return epsg - 32600, True
+    if 32701 <= epsg <= 32760:
+        return epsg - 32700, False
+    return None
+
+def _group_by_zone(zone_number, is_northern):
+    """
+    Yield ``(index, zone_number, is_northern)`` for each distinct zone, 
+    where `index` selects the points of that zone.
+    """
+    codes = zone_number * 2 + is_northern
+    first = codes.flat[0] if codes.size else 0
+    if not codes.size or (codes == first).all():
+        yield slice(None), int(first // 2), bool(first % 2)
+        return
+    order = np.argsort(codes, kind='stable')
+    bounds = np.flatnonzero(np.diff(codes[order])) + 1
+    for index in np.split(order, bounds):
+        code = codes[index[0]]
+        yield index, int(code // 2), bool(code % 2)
+
+def _datum_crs(datum, zone_number=None, is_northern=True):
+    """
+    Geographic and UTM coordinate systems of a datum, as EPSG numbers when
+    they exist, otherwise as proj strings.
+    """
+    key = str(datum).upper().replace('-', '').replace(' ', '')
+    geographic, north, south = _DATUM_EPSG.get(key, (None, None, None))
+    if geographic is None:
+        geographic = f'+proj=longlat +datum={datum} +no_defs'
+    if zone_number is None:
+        return geographic, None
+    base = north if is_northern else south
+    if base is not None:
+        return geographic, base + zone_number
+    return geographic, '+proj=utm +zone={0} {1}+datum={2} +units=m'.format(
+        zone_number, '' if is_northern else '+south ', datum)
+
+def _datum_ellipsoid(datum):
+    """Equatorial radius and squared eccentricity of the datum ellipsoid."""
+    if isinstance(datum, int):
+        index = datum
+    else:
+        key = str(datum).upper().replace('-', '').replace(' ', '')
+        index = _DATUM_ELLIPSOID.get(key)
+        if index is None:
+            names = [str(e[1]).upper().replace('-', '').replace(' ', '') 
+                     for e in _ellipsoid]
+            if key not in names:
+                raise GISError(f"Unknown datum {datum!r}. Expect one of"
+                               f" {sorted(_DATUM_ELLIPSOID)} or an ellipsoid"
+                               " name.")
+            index = names.index(key)
+    return (_ellipsoid[index][_equatorial_radius], 
+            _ellipsoid[index][_eccentricity_squared])
+
 def epsg_project(x, y, epsg_from, epsg_to, proj_str=None):
     """
     project some xy points using the pyproj modules
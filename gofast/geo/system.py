@@ -45,8 +45,10 @@ Note:
   class and other experimental features.
 
 """
+import operator
 import threading
 import time
+import weakref
 try :import geopandas as gpd
 except : pass 
 import numpy as np 
@@ -55,6 +57,7 @@ import matplotlib.pyplot as plt
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error
+from sklearn.neighbors import KDTree
 
 from ..exceptions import NotFittedError
 from ..tools.funcutils import ensure_pkg
@@ -354,6 +357,8 @@ class GeoIntelligentSystem:
         else:
             data.to_crs(targetCRS, inplace=True)
             self.data = data
+            # the cached spatial index holds the former coordinates
+            self._spatial_index = None 
             
     def calculateArea(self, geometry):
         """
@@ -439,22 +444,24 @@ class GeoIntelligentSystem:
         labels = model.fit_predict(list(coordinates))
         return labels
 
-    def findNearest(self, feature, features_list, n_neighbors=1):
+    def findNearest(self, feature, features_list=None, n_neighbors=1):
         """
         Identifies the nearest geographical feature(s) from a list to the 
         specified feature(s).
         
         This method supports applications like nearest facility location, 
-        emergency response planning, and more.
+        emergency response planning, and more. The neighbours of all the 
+        features are found in one call to :meth:`queryNearest`, backed by a 
+        cached spatial index of `features_list`.
 
         Parameters
         ----------
         feature : GeoSeries or GeoDataFrame
             A single geographical feature or multiple features to which the 
             nearest neighbor(s) are found.
-        features_list : GeoDataFrame
+        features_list : GeoDataFrame, optional
             A collection of geographical features from which the nearest to 
-            the `feature` is identified.
+            the `feature` is identified. Defaults to the fitted data.
         n_neighbors : int, default 1
             The number of nearest neighbors to find. Default is 1, which means 
             the single nearest neighbor.
@@ -480,25 +487,225 @@ class GeoIntelligentSystem:
         >>> nearest_feature = geo_sys.findNearest(feature, features_list)
         >>> print(nearest_feature)
         """
-        # import geopandas as gpd
-        # from shapely.ops import nearest_points
-        # Ensure input is in GeoDataFrame format
-        if isinstance(feature, gpd.GeoSeries):
-            feature = gpd.GeoDataFrame(feature)
-
-        # Calculate the nearest feature(s)
-        nearest_indices = []
-        for feat in feature.geometry:
-            # Calculate all distances from the feature to each in the features_list
-            distances = features_list.geometry.distance(feat)
-            # Find the index(es) of the nearest neighbor(s)
-            nearest_indices.extend(distances.nsmallest(n_neighbors).index.tolist())
+        features_list = self._get_layer(features_list)
+        _, indices = self.queryNearest(
+            feature, n_neighbors=n_neighbors, features_list=features_list)
+        # unique positions in case of overlapping nearest for multiple 
+        # input features
+        return features_list.iloc[np.unique(indices[indices >= 0])]
+
+    def queryNearest(self, feature, n_neighbors=1, features_list=None):
+        """
+        Finds the `n_neighbors` nearest features of every input feature 
+        in one call.
+        
+        The spatial index of the layer is built on the first query and 
+        cached: a KD-tree when the layer and the queries are points, a 
+        :class:`shapely.STRtree` otherwise. A query then costs about 
+        ``log(n_layer)`` per feature instead of a distance to every 
+        feature of the layer. The index is rebuilt when the layer or its 
+        CRS changes, e.g. after :meth:`transformCoordinates`.
+
+        Parameters
+        ----------
+        feature : GeoSeries, GeoDataFrame or array of shapely geometries
+            The features whose neighbours are searched.
+        n_neighbors : int, default 1
+            The number of nearest neighbors of each feature.
+        features_list : GeoDataFrame, optional
+            The layer searched. Defaults to the fitted data.
+
+        Returns
+        -------
+        distances : ndarray of shape (n_features, n_neighbors)
+            Distances to the neighbours, sorted, in the unit of the CRS. 
+            ``inf`` when the layer has less than `n_neighbors` features.
+        indices : ndarray of shape (n_features, n_neighbors)
+            Positions of the neighbours in the layer (for ``iloc``); -1 
+            when missing.
+
+        Examples
+        --------
+        >>> import geopandas as gpd 
+        >>> from gofast.experimental import enable_geo_intel_system
+        >>> from gofast.geo.system import GeoIntelligentSystem 
+        >>> facilities = gpd.GeoDataFrame(geometry=gpd.points_from_xy(
+        ...     [0, 10, 20], [0, 0, 0]))
+        >>> parcels = gpd.GeoSeries(gpd.points_from_xy([1, 18], [1, 0]))
+        >>> geo_sys = GeoIntelligentSystem().fit(facilities)
+        >>> distances, indices = geo_sys.queryNearest(parcels, n_neighbors=2)
+        >>> indices
+        array([[0, 1],
+               [2, 1]])
+        """
+        import shapely 
+        
+        features_list = self._get_layer(features_list)
+        geoms = self._as_geometries(feature)
+        index = self._get_spatial_index(features_list)
+        k = int(n_neighbors)
+        if k < 1: 
+            raise ValueError(f"n_neighbors must be >= 1, got {n_neighbors}")
+        distances = np.full((len(geoms), k), np.inf)
+        indices = np.full((len(geoms), k), -1, dtype=np.intp)
+        # missing or empty features of the layer are never neighbours
+        n_layer = int(np.sum(~shapely.is_missing(index['geoms']) 
+                             & ~shapely.is_empty(index['geoms'])))
+        if not len(geoms) or not n_layer: 
+            return distances, indices 
+        kk = min(k, n_layer)
         
-        # Get unique indices in case of overlapping nearest for multiple input features
-        unique_indices = list(set(nearest_indices))
+        if index['kind'] == 'kdtree' and _all_points(geoms): 
+            d, i = index['tree'].query(
+                np.c_[shapely.get_x(geoms), shapely.get_y(geoms)], k=kk)
+            distances[:, :kk], indices[:, :kk] = d, i
+            return distances, indices 
         
-        # Return the nearest feature(s) as a GeoDataFrame
-        return features_list.iloc[unique_indices]
+        tree = index['strtree']
+        # nearest features, then all the features within a radius growing 
+        # from that distance until it holds `kk` of them
+        pairs, nearest = tree.query_nearest(
+            geoms, return_distance=True, all_matches=False)
+        radius = np.empty(len(geoms))
+        radius[pairs[0]] = nearest 
+        if kk ==1: 
+            distances[pairs[0], 0], indices[pairs[0], 0] = nearest, pairs[1]
+            return distances, indices 
+        
+        # the features without nearest (missing or empty) are skipped
+        todo = np.unique(pairs[0])
+        bounds = shapely.total_bounds(index['geoms'])
+        scale = max(bounds[2] - bounds[0], bounds[3] - bounds[1], 1e-12)
+        radius = np.maximum(radius, scale / np.sqrt(n_layer))
+        while len(todo): 
+            src, dst = tree.query(geoms[todo], predicate='dwithin', 
+                                  distance=radius[todo])
+            counts = np.bincount(src, minlength=len(todo))
+            done = counts >= kk 
+            keep = done[src]
+            src, dst = src[keep], dst[keep]
+            d = shapely.distance(geoms[todo][src], index['geoms'][dst])
+            # sort the candidates of each feature by distance
+            order = np.lexsort((d, src))
+            src, dst, d = src[order], dst[order], d[order]
+            rank = np.arange(len(src)) - np.repeat(
+                np.r_[0, np.cumsum(counts[done])[:-1]], counts[done])
+            first = rank < kk 
+            rows = todo[src[first]]
+            distances[rows, rank[first]] = d[first]
+            indices[rows, rank[first]] = dst[first]
+            todo = todo[~done]
+            radius[todo] *= 2 
+        return distances, indices 
+
+    def queryWithin(self, feature, distance, features_list=None):
+        """
+        Finds the features of the layer within `distance` of every input 
+        feature in one call.
+        
+        The query uses the cached spatial index of the layer (see 
+        :meth:`queryNearest`).
+
+        Parameters
+        ----------
+        feature : GeoSeries, GeoDataFrame or array of shapely geometries
+            The features whose neighbours are searched.
+        distance : float or array-like of shape (n_features,)
+            Search distance in the unit of the CRS.
+        features_list : GeoDataFrame, optional
+            The layer searched. Defaults to the fitted data.
+
+        Returns
+        -------
+        feature_indices : ndarray of shape (n_pairs,)
+            Positions of the input features.
+        indices : ndarray of shape (n_pairs,)
+            Positions of their neighbours in the layer.
+        distances : ndarray of shape (n_pairs,)
+            Distances of the pairs, in the unit of the CRS.
+        """
+        import shapely 
+        
+        features_list = self._get_layer(features_list)
+        geoms = self._as_geometries(feature)
+        index = self._get_spatial_index(features_list)
+        distance = np.broadcast_to(
+            np.asarray(distance, dtype=float), (len(geoms),))
+        if not len(geoms) or not len(index['geoms']): 
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty.copy(), np.empty(0)
+        
+        if index['kind'] == 'kdtree' and _all_points(geoms): 
+            ind, dist = index['tree'].query_radius(
+                np.c_[shapely.get_x(geoms), shapely.get_y(geoms)], 
+                distance, return_distance=True)
+            src = np.repeat(np.arange(len(geoms)), [len(i) for i in ind])
+            return (src, np.concatenate(ind).astype(np.intp), 
+                    np.concatenate(dist))
+        
+        src, dst = index['strtree'].query(
+            geoms, predicate='dwithin', distance=distance)
+        return src, dst, shapely.distance(geoms[src], index['geoms'][dst])
+
+    def _get_layer(self, features_list):
+        """The searched layer: `features_list` or the fitted data."""
+        if features_list is not None: 
+            return features_list 
+        if getattr(self, 'data', None) is None: 
+            raise NotFittedError(
+                f"{self.__class__.__name__} instance is not fitted yet."
+                " Call 'fit' or pass the 'features_list' to search.")
+        return self.data 
+
+    @staticmethod 
+    def _as_geometries(feature):
+        """Shapely geometries of a GeoSeries, GeoDataFrame or sequence."""
+        if hasattr(feature, 'geometry'): 
+            feature = feature.geometry 
+        return np.asarray(getattr(feature, 'values', feature), dtype=object
+                          ).ravel()
+
+    def _get_spatial_index(self, layer):
+        """Build or reuse the spatial index of `layer`.
+        
+        The cached index is reused only for the very same layer object 
+        (held by a weak reference when possible), with the same CRS and the 
+        same geometry objects. Shapely geometries are immutable, so 
+        reprojecting the layer or editing any of its geometries in place 
+        invalidates the index. 
+        """
+        import shapely 
+        
+        geoms = self._as_geometries(layer)
+        crs = str(getattr(layer, 'crs', None))
+        cache = getattr(self, '_spatial_index', None)
+        if (
+            cache is not None 
+            and cache['layer']() is layer 
+            and cache['crs'] == crs 
+            and len(cache['geoms']) == len(geoms) 
+            and all(map(operator.is_, cache['geoms'], geoms))
+        ): 
+            return cache 
+        
+        try: 
+            layer_ref = weakref.ref(layer)
+        except TypeError: 
+            # lists and tuples of geometries are not weak referenceable
+            layer_ref = lambda: layer  # noqa: E731
+        # the geometries may be a view on the layer data: keep our own 
+        # references to compare with after an in-place edit
+        geoms = geoms.copy()
+        cache = {'layer': layer_ref, 'crs': crs, 'geoms': geoms, 
+                 'kind': 'strtree'}
+        if len(geoms) and _all_points(geoms): 
+            cache['kind'] = 'kdtree'
+            cache['tree'] = KDTree(
+                np.c_[shapely.get_x(geoms), shapely.get_y(geoms)])
+        # the STRtree also serves the queries of non point features
+        cache['strtree'] = shapely.STRtree(geoms)
+        self._spatial_index = cache 
+        return cache 
 
     @ensure_pkg ("networkx")
     def calculateShortestPath(self, graph, start_point, end_point, criteria='distance'):
@@ -1140,4 +1347,11 @@ class GeoIntelligentSystem:
                )
         if not hasattr ( self, 'data'):  
             raise NotFittedError(msg.format(expobj=self))
-        return 1
\ No newline at end of file
+        return 1
+
+def _all_points(geoms):
+    """Whether all the geometries are non-empty points."""
+    import shapely 
+    
+    return bool(np.all(shapely.get_type_id(geoms) == 0) and not np.any(
+        shapely.is_empty(geoms)))
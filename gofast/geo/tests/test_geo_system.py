@@ -104,6 +104,69 @@ def test_interactive_query(setup_geo_system):
     assert isinstance(interactive_map, folium.Map)
     assert len(interactive_map._children) > 1  # Check if more than the base layer is present, indicating added interaction layers
 
+def test_batch_nearest_queries(setup_geo_system):
+    import numpy as np
+    rng = np.random.default_rng(0)
+    facilities = gpd.GeoDataFrame(
+        {'name': range(200)}, crs='EPSG:32630', index=np.arange(200) + 100,
+        geometry=gpd.points_from_xy(rng.random(200) * 100, rng.random(200) * 100))
+    parcels = gpd.GeoSeries(gpd.points_from_xy(
+        rng.random(50) * 100, rng.random(50) * 100), crs='EPSG:32630')
+    geo_sys = setup_geo_system.fit(facilities)
+    distances = np.array(
+        [facilities.geometry.distance(p).to_numpy() for p in parcels])
+
+    d, i = geo_sys.queryNearest(parcels, n_neighbors=3)
+    np.testing.assert_allclose(d, np.sort(distances, axis=1)[:, :3])
+    np.testing.assert_array_equal(i[:, 0], distances.argmin(axis=1))
+    nearest = geo_sys.findNearest(parcels, n_neighbors=1)
+    assert set(nearest['name']) == set(distances.argmin(axis=1))
+
+    # non point layers are searched with an STRtree
+    areas = gpd.GeoDataFrame(geometry=facilities.buffer(rng.random(200) * 3))
+    area_distances = np.array(
+        [areas.geometry.distance(p).to_numpy() for p in parcels])
+    d, _ = geo_sys.queryNearest(parcels, n_neighbors=2, features_list=areas)
+    np.testing.assert_allclose(d, np.sort(area_distances, axis=1)[:, :2])
+
+    src, dst, d = geo_sys.queryWithin(parcels, 10.)
+    assert len(src) == np.sum(distances <= 10.)
+    np.testing.assert_allclose(d, distances[src, dst])
+
+    # reprojecting the layer drops its cached index
+    geo_sys.transformCoordinates(targetCRS='EPSG:4326', inplace=True)
+    d, i = geo_sys.queryNearest(parcels.to_crs('EPSG:4326'))
+    np.testing.assert_array_equal(i[:, 0], distances.argmin(axis=1))
+
+def test_spatial_index_cache(setup_geo_system):
+    import numpy as np
+    from shapely.geometry import Point
+    rng = np.random.default_rng(1)
+    base = gpd.GeoDataFrame(geometry=gpd.points_from_xy(
+        rng.random(300) * 100, rng.random(300) * 100))
+    queries = gpd.GeoSeries(gpd.points_from_xy(
+        rng.random(20) * 100, rng.random(20) * 100))
+    geo_sys = setup_geo_system
+
+    # temporary layers freed between the calls may reuse the same id
+    for t in range(200):
+        layer = base.sample(40, random_state=t)
+        expected = np.array([layer.distance(q).to_numpy() for q in queries])
+        _, i = geo_sys.queryNearest(queries, features_list=layer)
+        np.testing.assert_array_equal(i[:, 0], expected.argmin(axis=1))
+        del layer
+
+    # a geometry edited in place is seen by the next query
+    layer = base.copy()
+    _, i = geo_sys.queryNearest(queries[:1], features_list=layer)
+    layer.loc[layer.index[5], 'geometry'] = queries.iloc[0]
+    _, i = geo_sys.queryNearest(queries[:1], features_list=layer)
+    assert i[0, 0] == 5
+    layer.geometry = layer.geometry.translate(1000., 1000.)
+    layer.loc[layer.index[7], 'geometry'] = Point(queries.iloc[0].coords[0])
+    _, i = geo_sys.queryNearest(queries[:1], features_list=layer)
+    assert i[0, 0] == 7
+
 def test_stream_data(setup_geo_system):
     # Mock the streaming data source to return a known dataset
     # This requires the streaming data method to be adaptable for testing with a mock source
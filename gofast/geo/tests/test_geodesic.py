@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# test_geodesic.py
+import pytest
+import numpy as np
+from sklearn.metrics.pairwise import haversine_distances
+from gofast.geo.geodesic import geodesic_distances, iter_geodesic_distances
+from gofast.geo.geodesic import haversine, vincenty, StationIndex
+from gofast.tools.coreutils import find_close_position
+from gofast.exceptions import NotFittedError
+
+@pytest.fixture
+def surveys():
+    rng = np.random.default_rng(0)
+    stations = np.c_[rng.uniform(5, 10, 400), rng.uniform(-8, -3, 400)]
+    boreholes = np.c_[rng.uniform(5, 10, 300), rng.uniform(-8, -3, 300)]
+    return stations, boreholes
+
+def test_haversine_and_vincenty():
+    # Los Angeles to New York
+    assert haversine(34.0522, -118.2437, 40.7128, -74.0060) == pytest.approx(
+        3935.75, abs=0.01)
+    assert vincenty(34.0522, -118.2437, 40.7128, -74.0060) == pytest.approx(
+        3944.42, abs=0.01)
+    assert vincenty(10., 20., 10., 20.) == 0
+    # one degree of longitude on the equator of the WGS84 ellipsoid
+    assert vincenty(0, 0, 0, 1) == pytest.approx(111.3195, abs=1e-4)
+
+@pytest.mark.parametrize("method", ["haversine", "vincenty"])
+def test_geodesic_distances_by_blocks(surveys, method):
+    stations, boreholes = surveys
+    expected = haversine_distances(
+        np.radians(stations), np.radians(boreholes)) * 6371.
+    # a tiny working memory splits the matrix in many blocks
+    blocks = list(iter_geodesic_distances(
+        stations, boreholes, method=method, working_memory=0.1))
+    assert len(blocks) > 1
+    out = np.empty((len(stations), len(boreholes)))
+    distances = geodesic_distances(
+        stations, boreholes, method=method, working_memory=0.1, out=out)
+    assert distances is out
+    np.testing.assert_allclose(
+        distances, expected, rtol=1e-9 if method == "haversine" else 1e-2)
+    np.testing.assert_allclose(
+        geodesic_distances(stations[3], boreholes, method=method),
+        distances[3])
+
+def test_station_index(surveys, tmp_path):
+    stations, boreholes = surveys
+    distances = geodesic_distances(stations, boreholes)
+    index = StationIndex().fit(boreholes, ids=[f"B{i}" for i in range(300)])
+
+    d, nearest = index.query(stations, k=2)
+    np.testing.assert_allclose(d[:, 0], distances.min(axis=1))
+    np.testing.assert_array_equal(nearest[:, 0], distances.argmin(axis=1))
+
+    within = index.query_radius(stations, 20.)
+    for i in range(len(stations)):
+        assert set(within[i]) == set(np.flatnonzero(distances[i] <= 20.))
+
+    index = StationIndex.load(index.save(str(tmp_path / "boreholes.idx")))
+    assert index.ids_[index.query(stations[:1], return_distance=False)[0, 0]
+                      ] == f"B{distances[0].argmin()}"
+    with pytest.raises(NotFittedError):
+        StationIndex().query(stations)
+
+def test_find_close_position():
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        refarr = rng.integers(0, 10, rng.integers(1, 30)).astype(float)
+        arr = rng.integers(-3, 13, 20) + rng.choice([0, 0.5], 20)
+        assert list(find_close_position(refarr, arr)) == [
+            np.argmin(np.abs(refarr - item)) for item in arr]
+    # non finite items are mapped as np.argmin does
+    refarr = np.array([3., 1., 2.])
+    arr = np.array([np.nan, np.inf, -np.inf, 2.4])
+    assert list(find_close_position(refarr, arr)) == [
+        np.argmin(np.abs(refarr - item)) for item in arr] == [0, 0, 0, 2]
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# test_gisutils.py
+import pytest
+import numpy as np
+from gofast.geo.gisutils import ll_to_utm, get_utm_zones
+from gofast.geo.gisutils import project_ll2utm_batch, project_utm2ll_batch
+
+@pytest.fixture
+def stations():
+    rng = np.random.default_rng(0)
+    return rng.uniform(-60, 70, 5000), rng.uniform(-179, 179, 5000)
+
+@pytest.mark.parametrize("engine", ["numpy", "pyproj"])
+def test_projection_batch_roundtrip(stations, engine):
+    if engine == "pyproj":
+        pytest.importorskip("pyproj")
+    lat, lon = stations
+    easting, northing, utm_zone = project_ll2utm_batch(lat, lon, engine=engine)
+    assert easting.shape == northing.shape == utm_zone.shape == lat.shape
+    # each point is projected onto its own zone
+    assert np.array_equal(utm_zone, get_utm_zones(lat, lon)[2])
+    lat2, lon2 = project_utm2ll_batch(easting, northing, utm_zone,
+                                      engine=engine)
+    np.testing.assert_allclose(lat2, lat, atol=1e-5)
+    np.testing.assert_allclose(lon2, lon, atol=1e-5)
+
+def test_projection_batch_matches_scalar(stations):
+    lat, lon = stations
+    easting, northing, utm_zone = project_ll2utm_batch(
+        lat[:20], lon[:20], engine='numpy')
+    for i in range(20):
+        zone, e, n = ll_to_utm(23, lat[i], lon[i])
+        assert zone.zfill(3) == utm_zone[i]
+        assert e == pytest.approx(easting[i])
+        assert n == pytest.approx(northing[i])
+
+def test_projection_batch_forced_zone():
+    pytest.importorskip("pyproj")
+    lat, lon = [-34.3, -34.2], [149.2, 149.3]
+    by_zone = project_ll2utm_batch(lat, lon, utm_zone='55H')
+    by_epsg = project_ll2utm_batch(lat, lon, epsg=32755)
+    np.testing.assert_allclose(by_zone[0], by_epsg[0])
+    np.testing.assert_allclose(by_zone[1], by_epsg[1])
+    assert list(by_epsg[2]) == ['55H', '55H']
+
+def test_epsg_registry(tmp_path):
+    from gofast.geo._epsg import EPSGRegistry, build_epsg_registry
+    registry = EPSGRegistry()
+    assert registry._codes is None # nothing read before the first lookup
+    assert registry[32755] == (
+        '+proj=utm +zone=55 +south +datum=WGS84 +units=m +no_defs')
+    assert 4326 in registry and 1 not in registry
+    assert registry.utm_zone_to_epsg(31, True) == 32631
+    with pytest.raises(KeyError):
+        registry[1]
+    custom = build_epsg_registry({3: 'c', 1: 'a', 2: 'bb'}, str(tmp_path))
+    custom[0] = 'custom'
+    assert list(custom) == [1, 2, 3, 0]
+    assert [custom[code] for code in custom] == ['a', 'bb', 'c', 'custom']
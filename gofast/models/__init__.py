@@ -143,9 +143,9 @@ else:
 import typing
 
 if typing.TYPE_CHECKING:
-    from .deep_selection import  HyperbandSearchCV # noqa
+    from .deep_selection import  HyperbandSearchCV, ASHASearchCV # noqa
 def __getattr__(name):
-    if name =="HyperbandSearchCV":
+    if name in ("HyperbandSearchCV", "ASHASearchCV"):
         raise ImportError(
             f"{name} is experimental and the API might change without any "
             "deprecation cycle. To use it, you need to explicitly import "
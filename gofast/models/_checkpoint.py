@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""
+On-disk checkpointing of cross-validation scores so that interrupted
+hyperparameter searches resume where they stopped.
+"""
+
+import os
+import sqlite3
+import hashlib
+import warnings
+import numpy as np
+from scipy.stats import rankdata
+
+from joblib import Parallel, delayed, hash as joblib_hash
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
+from sklearn.model_selection import ParameterGrid, ParameterSampler, check_cv
+
+from ._selection import _fit_and_score_fold, _params_key
+
+__all__=["SearchCheckpoint"]
+
+class SearchCheckpoint:
+    """
+    Persistent store of cross-validation fold scores backed by SQLite.
+
+    Each score is keyed by the estimator and its full set of parameters, the
+    train/test indices of the fold, the scoring strategy and a fingerprint
+    of the data. Re-running the same search against the same store skips
+    every fit already recorded, so a search killed midway resumes from the
+    last completed fold.
+
+    Parameters
+    ----------
+    path : str, default='gofast_search.sqlite'
+        Path to the SQLite database. It is created on first use.
+
+    Attributes
+    ----------
+    n_hits_ : int
+        Number of fold scores read back from the store.
+
+    n_misses_ : int
+        Number of fold scores computed and written to the store.
+
+    Notes
+    -----
+    A new connection is opened for each read or write, so the store can be
+    shared between threads and processes of the same node. Failed fits
+    (scored with `error_score`) are not recorded and are retried on the
+    next run.
+
+    Examples
+    --------
+    >>> from sklearn.datasets import load_iris
+    >>> from sklearn.model_selection import GridSearchCV
+    >>> from sklearn.svm import SVC
+    >>> from gofast.models._checkpoint import SearchCheckpoint
+    >>> X, y = load_iris(return_X_y=True)
+    >>> checkpoint = SearchCheckpoint('iris_svc.sqlite')
+    >>> search = GridSearchCV(SVC(), {'C': [1, 10]}, cv=3)
+    >>> search = checkpoint.fit_search(search, X, y)
+    >>> search = checkpoint.fit_search(search, X, y) # no refit of the folds
+    >>> checkpoint.n_hits_
+    6
+    """
+    def __init__(self, path='gofast_search.sqlite'):
+        self.path = str(path)
+        self.n_hits_ = 0
+        self.n_misses_ = 0
+
+    def _connect(self):
+        """Open a connection and make sure the scores table exists."""
+        dirname = os.path.dirname(self.path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        con = sqlite3.connect(self.path, timeout=60)
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS scores (key TEXT PRIMARY KEY,"
+            " estimator TEXT, params TEXT, fold INTEGER, score REAL)"
+            )
+        return con
+
+    def get(self, keys):
+        """
+        Fetch the recorded scores of `keys`.
+
+        Parameters
+        ----------
+        keys : list of str
+            The fold keys to look up.
+
+        Returns
+        -------
+        scores : dict
+            Mapping of the keys found in the store to their score.
+        """
+        found = {}
+        keys = list(keys)
+        con = self._connect()
+        try:
+            # stay below the SQLite bound-parameters limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = con.execute(
+                    "SELECT key, score FROM scores WHERE key IN ({})".format(
+                        ",".join("?" * len(chunk))), chunk)
+                found.update(rows.fetchall())
+        finally:
+            con.close()
+        self.n_hits_ += len(found)
+        return found
+
+    def put(self, records):
+        """
+        Record fold scores.
+
+        Parameters
+        ----------
+        records : list of tuple
+            ``(key, estimator, params, fold, score)`` rows. Rows with a
+            NaN score are skipped.
+        """
+        records = [r for r in records if not np.isnan(r[-1])]
+        if not records:
+            return
+        con = self._connect()
+        try:
+            with con:
+                con.executemany(
+                    "INSERT OR REPLACE INTO scores VALUES (?, ?, ?, ?, ?)",
+                    records)
+        finally:
+            con.close()
+        self.n_misses_ += len(records)
+
+    def clear(self):
+        """Remove every recorded score."""
+        con = self._connect()
+        try:
+            with con:
+                con.execute("DELETE FROM scores")
+        finally:
+            con.close()
+
+    def __len__(self):
+        con = self._connect()
+        try:
+            return con.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+        finally:
+            con.close()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    def cross_val_score(
+        self,
+        estimator,
+        X,
+        y=None,
+        *,
+        groups=None,
+        cv=None,
+        scoring=None,
+        n_jobs=None,
+        pre_dispatch="2*n_jobs",
+        error_score=np.nan
+        ):
+        """
+        Checkpointed equivalent of :func:`sklearn.model_selection.cross_val_score`.
+
+        Returns
+        -------
+        scores : ndarray of shape (n_splits,)
+            The score of the estimator on each fold.
+        """
+        return self.evaluate(
+            estimator, [{}], X, y, groups=groups, cv=cv, scoring=scoring,
+            n_jobs=n_jobs, pre_dispatch=pre_dispatch,
+            error_score=error_score)[0]
+
+    def evaluate(
+        self,
+        estimator,
+        candidates,
+        X,
+        y=None,
+        *,
+        groups=None,
+        cv=None,
+        scoring=None,
+        n_jobs=None,
+        pre_dispatch="2*n_jobs",
+        error_score=np.nan
+        ):
+        """
+        Score each candidate on each fold, fitting only the folds missing
+        from the store.
+
+        The missing (candidate, fold) fits are dispatched to one joblib pool
+        and each score is written as soon as it is available, so the work
+        done before an interruption is kept.
+
+        Parameters
+        ----------
+        estimator : estimator object
+            The base estimator, cloned for each fit.
+
+        candidates : list of dict
+            The hyperparameter sets to score.
+
+        X : array-like of shape (n_samples, n_features)
+            Training vectors.
+
+        y : array-like of shape (n_samples,), optional
+            Target values.
+
+        groups : array-like of shape (n_samples,), optional
+            Group labels of the samples, used by group splitters such as
+            `GroupKFold`.
+
+        cv : int, cross-validation generator or iterable, optional
+            Determines the cross-validation splitting strategy.
+
+        scoring : str or callable, optional
+            Strategy used to score each test fold.
+
+        n_jobs : int, optional
+            Number of jobs to run in parallel.
+
+        pre_dispatch : int or str, default='2*n_jobs'
+            Controls the number of fits dispatched ahead to the pool.
+
+        error_score : 'raise' or numeric, default=np.nan
+            Score assigned to a fold when the fit fails.
+
+        Returns
+        -------
+        scores : ndarray of shape (n_candidates, n_splits)
+            The score of each candidate on each fold.
+        """
+        cv = check_cv(cv, y, classifier=is_classifier(estimator))
+        splits = list(cv.split(X, y, groups))
+        scorer = check_scoring(estimator, scoring=scoring)
+
+        data_key = joblib_hash((X, y))
+        fold_keys = [joblib_hash((train, test)) for train, test in splits]
+        scoring_key = _scoring_key(scoring)
+        estimator_name = (f"{type(estimator).__module__}."
+                          f"{type(estimator).__qualname__}")
+
+        keys, rows = [], []
+        for params in candidates:
+            full_params = clone(estimator).set_params(**params).get_params()
+            params_key = repr(_params_key(full_params))
+            for fold, fold_key in enumerate(fold_keys):
+                keys.append(hashlib.sha1(repr((
+                    estimator_name, params_key, fold_key, scoring_key,
+                    data_key)).encode()).hexdigest())
+                rows.append((estimator_name, repr(params), fold))
+
+        scores = self.get(keys)
+        pending = [i for i, key in enumerate(keys) if key not in scores]
+        if pending:
+            parallel = Parallel(n_jobs=n_jobs, pre_dispatch=pre_dispatch,
+                                return_as="generator")
+            n_splits = len(splits)
+            results = parallel(
+                delayed(_fit_and_score_fold)(
+                    clone(estimator), candidates[i // n_splits], X, y,
+                    *splits[i % n_splits], scorer, error_score)
+                for i in pending
+                )
+            for i, score in zip(pending, results):
+                score = float(score)
+                self.put([(keys[i], *rows[i], score)])
+                scores[keys[i]] = score
+
+        return np.array([scores[key] for key in keys], dtype=float).reshape(
+            len(candidates), len(splits))
+
+    def fit_search(self, search, X, y=None, groups=None, **fit_params):
+        """
+        Fit a `GridSearchCV` or `RandomizedSearchCV` instance, reusing the
+        fold scores already recorded.
+
+        The candidates of the search are enumerated as the search itself
+        would, scored through :meth:`evaluate`, and the usual fitted
+        attributes (``cv_results_``, ``best_index_``, ``best_params_``,
+        ``best_score_``, ``best_estimator_``, ...) are set on `search`.
+        Other optimizers, multi-metric scoring and ``return_train_score``
+        fall back to the plain ``search.fit``, and so does a
+        `RandomizedSearchCV` whose `random_state` is not an integer since it
+        draws new candidates on each run and could never resume. Resumed
+        scores have no timing, so the ``*_fit_time`` and ``*_score_time``
+        entries of ``cv_results_`` are NaN.
+
+        Parameters
+        ----------
+        search : GridSearchCV or RandomizedSearchCV
+            The unfitted search.
+
+        X : array-like of shape (n_samples, n_features)
+            Training vectors.
+
+        y : array-like of shape (n_samples,), optional
+            Target values.
+
+        groups : array-like of shape (n_samples,), optional
+            Group labels of the samples, passed to the splitter.
+
+        **fit_params : dict
+            Parameters passed to the final refit of the best estimator.
+
+        Returns
+        -------
+        search : object
+            The fitted search.
+        """
+        candidates = None
+        if (isinstance(search, RandomizedSearchCV)
+            and not isinstance(search.random_state, (int, np.integer))):
+            warnings.warn(
+                "The candidates of a RandomizedSearchCV whose random_state is"
+                " not an integer change on each run, so its fold scores"
+                " cannot be resumed. It is fitted without checkpoint.")
+        elif (isinstance(search, (GridSearchCV, RandomizedSearchCV))
+              and search.return_train_score):
+            warnings.warn("The checkpoint does not record the train scores."
+                          " A search with return_train_score=True is fitted"
+                          " without checkpoint.")
+        elif isinstance(search, GridSearchCV):
+            candidates = list(ParameterGrid(search.param_grid))
+        elif isinstance(search, RandomizedSearchCV):
+            candidates = list(ParameterSampler(
+                search.param_distributions, search.n_iter,
+                random_state=search.random_state))
+
+        if (candidates is None
+            or isinstance(search.scoring, (list, tuple, set, dict))
+            or not isinstance(search.refit, bool)
+            ):
+            return search.fit(X, y, groups=groups, **fit_params)
+
+        scores = self.evaluate(
+            search.estimator, candidates, X, y, cv=search.cv,
+            groups=groups, scoring=search.scoring, n_jobs=search.n_jobs,
+            pre_dispatch=search.pre_dispatch, error_score=search.error_score)
+
+        mean_scores = scores.mean(axis=1)
+        # nan scores ranked last as in scikit-learn
+        ranks = rankdata(-np.where(np.isnan(mean_scores), -np.inf,
+                                   mean_scores), method='min').astype(int)
+        # the scores read back from the store have no timing
+        no_time = np.full(len(candidates), np.nan)
+        cv_results = {f"{stat}_{name}_time": no_time.copy()
+                      for name in ("fit", "score") for stat in ("mean", "std")}
+        cv_results["params"] = candidates
+        for name in sorted({name for params in candidates for name in params}):
+            values = np.ma.MaskedArray(np.empty(len(candidates), dtype=object),
+                                       mask=True)
+            for i, params in enumerate(candidates):
+                if name in params:
+                    values[i] = params[name]
+            cv_results[f"param_{name}"] = values
+        for fold in range(scores.shape[1]):
+            cv_results[f"split{fold}_test_score"] = scores[:, fold]
+        cv_results["mean_test_score"] = mean_scores
+        cv_results["std_test_score"] = scores.std(axis=1)
+        cv_results["rank_test_score"] = ranks
+
+        search.cv_results_ = cv_results
+        search.n_splits_ = scores.shape[1]
+        search.multimetric_ = False
+        search.scorer_ = check_scoring(search.estimator, scoring=search.scoring)
+        search.best_index_ = int(np.argmin(ranks))
+        search.best_params_ = candidates[search.best_index_]
+        search.best_score_ = mean_scores[search.best_index_]
+        if search.refit:
+            search.best_estimator_ = clone(search.estimator).set_params(
+                **search.best_params_).fit(X, y, **fit_params)
+
+        return search
+
+def _check_checkpoint(checkpoint):
+    """Return a :class:`SearchCheckpoint` from a path or an instance, or
+    ``None``."""
+    if checkpoint is None or isinstance(checkpoint, SearchCheckpoint):
+        return checkpoint
+    if isinstance(checkpoint, (str, os.PathLike)):
+        return SearchCheckpoint(checkpoint)
+    raise TypeError("checkpoint expects a path or a SearchCheckpoint instance;"
+                    f" got {type(checkpoint).__name__!r}")
+
+def _scoring_key(scoring):
+    """Stable representation of a scoring strategy across sessions."""
+    if scoring is None or isinstance(scoring, str):
+        return repr(scoring)
+    if hasattr(scoring, '__qualname__'):
+        return f"{getattr(scoring, '__module__', '')}.{scoring.__qualname__}"
+    return repr(scoring)
@@ -8,9 +8,12 @@ import random
 import numpy as np 
 
 from abc import abstractmethod
-from sklearn.model_selection import cross_val_score
+from joblib import Parallel, delayed
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import check_cv, cross_val_score
 from sklearn.model_selection._search import BaseSearchCV
-from sklearn.base import  clone
+from sklearn.base import  clone, is_classifier
+from sklearn.utils.metaestimators import _safe_split
 
 from ..tools.validator import _is_numeric_dtype 
 # from gofast.models.utils import params_combinations
@@ -57,7 +60,8 @@ class PSOBaseSearch(BaseSearchCV):
         position.
 
     n_jobs : int, default=1
-        The number of jobs to run in parallel for `cross_val_score`. -1 means 
+        The number of jobs to run in parallel. All particles times all 
+        cross-validation folds of an iteration share the same pool. -1 means 
         using all processors.
 
     verbose : int, default=0
@@ -153,6 +157,7 @@ class PSOBaseSearch(BaseSearchCV):
         """
         self.X = X.copy()
         self.y = y.copy()
+        self._score_cache = {}
         super().fit(X, y, groups=groups, **fit_params)
         return self
 
@@ -283,12 +288,39 @@ class PSOBaseSearch(BaseSearchCV):
         score : float
             The fitness score of the particle's position.
         """
-        estimator = clone(self.estimator).set_params(**particle['position'])
-        score = np.mean(cross_val_score(
-            estimator, X, y, cv=self.cv,
-            scoring=self.scoring, n_jobs=self.n_jobs)
+        return self._evaluate_particles([particle], X, y)[0]
+
+    def _evaluate_particles(self, particles, X, y):
+        """
+        Evaluate the fitness of all particles' positions at once.
+    
+        All particles times all cross-validation folds are dispatched to 
+        a single joblib pool controlled by `n_jobs` and `pre_dispatch`. 
+        Positions already scored during the search are read from the 
+        result cache and are not refitted.
+    
+        Parameters
+        ----------
+        particles : list of dicts
+            The particles to evaluate.
+    
+        X : array-like of shape (n_samples, n_features)
+            Training vectors.
+    
+        y : array-like of shape (n_samples,)
+            Target values.
+    
+        Returns
+        -------
+        scores : ndarray of shape (n_particles,)
+            The fitness score of each particle's position.
+        """
+        return _evaluate_batch(
+            self.estimator, [particle['position'] for particle in particles], 
+            X, y, cv=self.cv, scoring=self.scoring, n_jobs=self.n_jobs, 
+            pre_dispatch=self.pre_dispatch, error_score=self.error_score, 
+            cache=self._score_cache
             )
-        return score
 
     def _move_particles(self, particles, global_best):
         """
@@ -634,8 +666,8 @@ class AnnealingBaseSearch(BaseSearchCV):
         Controls the randomness of the estimator for reproducible results.
 
     n_jobs : int, default=1
-        Number of jobs to run in parallel for `cross_val_score`. -1 means using 
-        all processors.
+        Number of jobs to run in parallel over the cross-validation folds. 
+        -1 means using all processors.
 
     verbose : int, default=0
         Controls the verbosity of output during the optimization process.
@@ -815,6 +847,7 @@ class AnnealingBaseSearch(BaseSearchCV):
         parameters found during the annealing process.
         """
         self.X=X.copy() ; self.y=y.copy() 
+        self._score_cache = {}
         super().fit(X, y, groups=groups, **fit_params)
         return self
 
@@ -860,13 +893,18 @@ class AnnealingBaseSearch(BaseSearchCV):
         score : float
             The mean cross-validation score of the estimator with the given 
             hyperparameters.
+    
+        Notes
+        -----
+        The folds are fitted in parallel and the score is cached by 
+        hyperparameter set, so a revisited state is not refitted.
         """
-        estimator = clone(self.estimator).set_params(**hyperparameters)
-        score = np.mean(cross_val_score(
-            estimator, self.X, self.y, cv=self.cv, scoring=self.scoring, 
-            n_jobs= self.n_jobs)
-            )
-        return score
+        return _evaluate_batch(
+            self.estimator, [hyperparameters], self.X, self.y, cv=self.cv, 
+            scoring=self.scoring, n_jobs=self.n_jobs, 
+            pre_dispatch=self.pre_dispatch, error_score=self.error_score, 
+            cache=self._score_cache
+            )[0]
 
     def _acceptance_criterion(self, current_score, next_score, temperature):
         """
@@ -1061,9 +1099,42 @@ class GeneticBaseSearch(BaseSearchCV):
             Instance of fitted estimator.
             
         """
+        self._score_cache = {}
         super().fit(X, y, groups=groups, **fit_params)
         return self
 
+    def _evaluate_population(self, population, X, y):
+        """
+        Evaluate the fitness of the whole population in one parallel call.
+
+        Every individual times every cross-validation fold is dispatched to 
+        a single joblib pool controlled by `n_jobs` and `pre_dispatch`. 
+        Individuals already scored during the search, including duplicates 
+        within the population, are read from the result cache.
+
+        Parameters
+        ----------
+        population : list of dicts
+            The individuals to evaluate.
+
+        X : array-like of shape (n_samples, n_features)
+            Training vectors.
+
+        y : array-like of shape (n_samples,)
+            Target values.
+
+        Returns
+        -------
+        scores : ndarray of shape (n_population,)
+            The mean cross-validation score of each individual.
+        """
+        return _evaluate_batch(
+            self.estimator, population, X, y, cv=self.cv, 
+            scoring=self.scoring, n_jobs=self.n_jobs, 
+            pre_dispatch=self.pre_dispatch, error_score=self.error_score, 
+            cache=self._score_cache
+            )
+
     def _generate_population(self):
         """
         Generate the initial population of hyperparameter sets.
@@ -1287,3 +1358,144 @@ def _choose_single_numeric(values):
     return values[0] if len(values) == 1 else random.choice(values)       
         
 
+
+def _params_key(params):
+    """Build a hashable key from a hyperparameter set.
+
+    Numpy scalars are converted to their Python equivalent so that the same 
+    individual drawn with ``np.random.choice`` or ``random.choice`` maps to 
+    the same key. Unhashable values fall back to their representation.
+    """
+    key = []
+    for name in sorted(params):
+        value = params[name]
+        if isinstance(value, np.generic):
+            value = value.item()
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        key.append((name, value))
+    return tuple(key)
+
+def _fit_and_score_fold(estimator, params, X, y, train, test, scorer,
+                        error_score=np.nan):
+    """Fit a cloned estimator on one training fold and score it on the 
+    matching test fold."""
+    estimator.set_params(**params)
+    X_train, y_train = _safe_split(estimator, X, y, train)
+    X_test, y_test = _safe_split(estimator, X, y, test, train)
+    try:
+        estimator.fit(X_train, y_train)
+        return scorer(estimator, X_test, y_test)
+    except Exception:
+        if error_score == "raise":
+            raise
+        return error_score
+
+def _evaluate_batch(
+    estimator, 
+    candidates, 
+    X, 
+    y, 
+    *, 
+    cv=None, 
+    scoring=None, 
+    n_jobs=None, 
+    pre_dispatch="2*n_jobs", 
+    error_score=np.nan, 
+    cache=None
+    ):
+    """
+    Score a batch of hyperparameter sets with cross-validation in a single 
+    parallel call.
+
+    Every (candidate, fold) pair not already in `cache` is dispatched to the 
+    same joblib pool, so a whole swarm or population keeps all workers busy 
+    instead of parallelizing over the folds of one candidate only. Duplicate 
+    candidates are fitted once.
+
+    Parameters
+    ----------
+    estimator : estimator object
+        The base estimator, cloned for each fit.
+
+    candidates : list of dict
+        The hyperparameter sets to score.
+
+    X : array-like of shape (n_samples, n_features)
+        Training vectors.
+
+    y : array-like of shape (n_samples,)
+        Target values.
+
+    cv : int, cross-validation generator or iterable, optional
+        Determines the cross-validation splitting strategy.
+
+    scoring : str or callable, optional
+        Strategy used to score each test fold.
+
+    n_jobs : int, optional
+        Number of jobs to run in parallel.
+
+    pre_dispatch : int or str, default='2*n_jobs'
+        Controls the number of fits dispatched ahead to the pool.
+
+    error_score : 'raise' or numeric, default=np.nan
+        Score assigned to a fold when the fit fails.
+
+    cache : dict, optional
+        Mapping of hyperparameter keys to their mean score. It is read before 
+        dispatching and updated in place with the new scores.
+
+    Returns
+    -------
+    scores : ndarray of shape (n_candidates,)
+        The mean cross-validation score of each candidate.
+    """
+    cache = {} if cache is None else cache
+    keys = [_params_key(params) for params in candidates]
+    pending = {}
+    for key, params in zip(keys, candidates):
+        if key not in cache and key not in pending:
+            pending[key] = params
+
+    if pending:
+        cv = check_cv(cv, y, classifier=is_classifier(estimator))
+        splits = list(cv.split(X, y))
+        scorer = check_scoring(estimator, scoring=scoring)
+        parallel = Parallel(n_jobs=n_jobs, pre_dispatch=pre_dispatch)
+        fold_scores = parallel(
+            delayed(_fit_and_score_fold)(
+                clone(estimator), params, X, y, train, test, scorer, 
+                error_score)
+            for params in pending.values() for train, test in splits
+            )
+        fold_scores = np.asarray(fold_scores, dtype=float).reshape(
+            len(pending), len(splits))
+        for key, scores in zip(pending, fold_scores):
+            cache[key] = np.mean(scores)
+
+    return np.array([cache[key] for key in keys])
+
+def _evaluate_unique_candidates(evaluate_candidates, candidates, cache):
+    """
+    Send only the unseen candidates of a generation to `evaluate_candidates`.
+
+    Scores of candidates already evaluated during the search are read back 
+    from `cache`, so duplicated individuals are not refitted and do not add 
+    rows to ``cv_results_``.
+    """
+    keys = [_params_key(params) for params in candidates]
+    pending = {}
+    for key, params in zip(keys, candidates):
+        if key not in cache and key not in pending:
+            pending[key] = params
+
+    if pending:
+        out = evaluate_candidates(list(pending.values()))
+        new_scores = out["mean_test_score"][-len(pending):]
+        for key, score in zip(pending, new_scores):
+            cache[key] = score
+
+    return np.array([cache[key] for key in keys])
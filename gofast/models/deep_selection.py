@@ -2,16 +2,23 @@
 #   License: BSD-3-Clause
 #   Author: LKouadio <etanoyau@gmail.com>
 
+import time
 import numpy as np
 from math import log
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from joblib import effective_n_jobs
+from joblib.externals.loky import get_reusable_executor
 from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
 from sklearn.model_selection._validation import _fit_and_score
 from sklearn.model_selection._search import BaseSearchCV, ParameterSampler
 from sklearn.model_selection._split import check_cv
-from sklearn.utils.validation import indexable
+from sklearn.utils import check_random_state, _safe_indexing
+from sklearn.utils.metaestimators import _safe_split
+from sklearn.utils.validation import indexable, _num_samples
 from sklearn.utils.parallel import Parallel, delayed
 
-__all__=["HyperbandSearchCV"]
+__all__=["HyperbandSearchCV", "ASHASearchCV"]
 
 class HyperbandSearchCV(BaseSearchCV):
     """
@@ -470,3 +477,374 @@ class HyperbandSearchCV(BaseSearchCV):
         top_candidate_params = [candidate['params'] for candidate in top_candidates]
         
         return top_candidate_params
+
+class ASHASearchCV(BaseSearchCV):
+    """
+    Asynchronous successive halving (ASHA) search over hyperparameters of 
+    any scikit-learn estimator.
+
+    Candidates sampled from `param_distributions` start on the smallest 
+    budget (rung 0). Whenever a worker is free, the scheduler promotes the 
+    best candidate of the highest rung that has one in its top ``1/eta`` 
+    fraction not yet promoted, or starts a new candidate otherwise. 
+    Promotions therefore happen as soon as a rung fills instead of waiting 
+    for a whole bracket, and the workers of the process pool are never idle 
+    on a synchronization barrier.
+
+    The budget allocated at rung ``k`` is 
+    \\( r_k = \\min(r_{min} \\cdot \\eta^k, r_{max}) \\) and is applied either 
+    as the number of training samples of each fold or as an integer 
+    parameter of the estimator such as ``n_estimators``, ``max_iter`` or 
+    ``n_iter``.
+
+    Parameters
+    ----------
+    estimator : estimator object
+        A scikit-learn estimator. Must implement the fit method.
+    param_distributions : dict
+        Dictionary where the keys are parameters and values are distributions 
+        or lists from which to sample. Distributions must provide a `rvs` 
+        method for sampling.
+    n_candidates : int, default=None
+        Number of candidates sampled. If ``None``, ``eta ** n_rungs`` 
+        candidates are sampled so that one candidate may reach the top rung.
+    resource : str, default='n_samples'
+        The budget. ``'n_samples'`` subsamples the training folds, any other 
+        value must be an integer parameter of `estimator` that is set to the 
+        rung budget.
+    min_resource : int, default=None
+        Budget of the first rung. Defaults to ``2 * n_splits`` (times the 
+        number of classes for classifiers) samples, or to ``1`` for an 
+        estimator parameter.
+    max_resource : int, default=None
+        Budget of the last rung. Defaults to the size of the smallest 
+        training fold, or to the value of the `resource` parameter of 
+        `estimator`.
+    eta : int, default=3
+        The reduction factor: the top ``1/eta`` candidates of a rung are 
+        promoted to the next one, which has ``eta`` times more budget.
+    cv : int, cross-validation generator or an iterable, default=5
+        Determines the cross-validation splitting strategy.
+    scoring : str, callable or None, default=None
+        A single string or a callable to evaluate the predictions on the test 
+        set. Multi-metric scoring is not supported.
+    n_jobs : int, default=None
+        Number of worker processes. None means 1 unless in a 
+        joblib.parallel_backend context. -1 means using all processors.
+    refit : bool, default=True
+        Refit an estimator using the best found parameters on the whole 
+        dataset with the `max_resource` budget.
+    verbose : int, default=0
+        Controls the verbosity: the higher, the more messages.
+    random_state : int, RandomState instance or None, default=None
+        Seed of the candidates sampling and of the samples subsampling.
+    error_score : 'raise' or numeric, default=np.nan
+        Value to assign to the score if an error occurs in estimator fitting.
+
+    Attributes
+    ----------
+    best_params_ : dict
+        Parameters of the best candidate of the highest rung reached.
+    best_score_ : float
+        Mean cross-validated score of `best_params_` on that rung.
+    best_index_ : int
+        Index of the best evaluation in `cv_results_`.
+    best_estimator_ : estimator object
+        The estimator refitted with `best_params_` and `max_resource`.
+    cv_results_ : dict of numpy (masked) ndarrays
+        One entry per (candidate, rung) evaluation in completion order, with 
+        the keys ``params``, ``param_<name>``, ``candidate``, ``iter``, 
+        ``n_resources``, ``split<k>_test_score``, ``mean_test_score``, 
+        ``std_test_score``, ``rank_test_score`` and ``mean_fit_time``.
+        Evaluations are ranked by rung then by score.
+    n_resources_ : list of int
+        The budget of each rung.
+    n_candidates_ : list of int
+        The number of candidates evaluated on each rung.
+    n_splits_ : int
+        The number of cross-validation splits.
+
+    Examples
+    --------
+    >>> from sklearn.datasets import make_regression
+    >>> from gofast.estimators import BoostedRegressionTree
+    >>> from gofast.models.deep_selection import ASHASearchCV
+    >>> X, y = make_regression(n_samples=300, n_features=5, random_state=0)
+    >>> search = ASHASearchCV(
+    ...     BoostedRegressionTree(n_estimators=81), 
+    ...     {'learning_rate': [0.01, 0.05, 0.1, 0.3], 'max_depth': [2, 3, 4]},
+    ...     resource='n_estimators', min_resource=3, cv=3, n_jobs=4, 
+    ...     random_state=0)
+    >>> search.fit(X, y)
+    >>> search.n_resources_
+    [3, 9, 27, 81]
+
+    Note
+    ----
+    ASHA trades the strict bracket synchronization of successive halving for 
+    throughput: a candidate may be promoted on the evidence of a partially 
+    filled rung. See Li et al., "A System for Massively Parallel 
+    Hyperparameter Tuning", MLSys 2020.
+    """
+
+    def __init__(self, 
+        estimator, 
+        param_distributions, 
+        n_candidates=None, 
+        resource='n_samples', 
+        min_resource=None, 
+        max_resource=None, 
+        eta=3, 
+        cv=5, 
+        scoring=None, 
+        n_jobs=None, 
+        refit=True, 
+        verbose=0, 
+        random_state=None, 
+        error_score=np.nan, 
+        ):
+        super().__init__(
+            estimator=estimator, scoring=scoring, n_jobs=n_jobs, 
+            refit=refit, cv=cv, verbose=verbose, error_score=error_score, 
+            return_train_score=False
+            )
+        self.param_distributions = param_distributions
+        self.n_candidates = n_candidates
+        self.resource = resource
+        self.min_resource = min_resource
+        self.max_resource = max_resource
+        self.eta = eta
+        self.random_state = random_state
+
+    def _check_resources(self, X, y, splits):
+        """Validate the budget settings and return the rung budgets."""
+        if self.resource == 'n_samples':
+            min_resource = self.min_resource
+            if min_resource is None:
+                min_resource = 2 * len(splits)
+                if is_classifier(self.estimator):
+                    min_resource *= len(np.unique(y))
+            max_resource = self.max_resource or min(
+                len(train) for train, _ in splits)
+        else:
+            params = self.estimator.get_params()
+            if self.resource not in params:
+                raise ValueError(
+                    f"Unknown resource {self.resource!r}. Expect 'n_samples'"
+                    " or a parameter of "
+                    f"{self.estimator.__class__.__name__}.")
+            if self.resource in self.param_distributions:
+                raise ValueError(
+                    f"Resource {self.resource!r} cannot be part of the"
+                    " searched parameters.")
+            min_resource = self.min_resource or 1
+            max_resource = self.max_resource or params[self.resource]
+            
+        if self.eta < 2:
+            raise ValueError(f"eta must be an integer >= 2. Got {self.eta}.")
+        if not 0 < min_resource <= max_resource:
+            raise ValueError(
+                f"min_resource={min_resource} must be positive and lower than"
+                f" max_resource={max_resource}.")
+
+        n_rungs = int(np.floor(
+            log(max_resource / min_resource) / log(self.eta) + 1e-9))
+        return [int(min(min_resource * self.eta ** k, max_resource)) 
+                for k in range(n_rungs + 1)]
+
+    def _next_job(self, rungs, promoted, n_started, n_candidates):
+        """
+        Pick the next (candidate, rung) to evaluate.
+
+        The highest rung with a candidate in its top ``1/eta`` not promoted 
+        yet wins; otherwise a new candidate starts at the bottom rung. 
+        Returns ``None`` when nothing can be scheduled until a running 
+        evaluation completes.
+        """
+        for k in reversed(range(len(self.n_resources_) - 1)):
+            completed = sorted(rungs[k].items(), key=lambda item: (
+                -np.inf if np.isnan(item[1]) else item[1]), reverse=True)
+            for candidate, _ in completed[:len(completed) // self.eta]:
+                if candidate not in promoted[k]:
+                    promoted[k].add(candidate)
+                    return candidate, k + 1
+        if n_started < n_candidates:
+            return n_started, 0
+        return None
+
+    def fit(self, X, y=None, groups=None, **fit_params):
+        """
+        Run the asynchronous successive halving search.
+
+        Parameters
+        ----------
+        X : array-like, shape (n_samples, n_features)
+            Training vector, where n_samples is the number of samples and 
+            n_features is the number of features.
+        y : array-like, shape (n_samples,), optional
+            Target relative to X for classification or regression.
+        groups : array-like, with shape (n_samples,), optional
+            Group labels for the samples used while splitting the dataset into
+            train/test set.
+        **fit_params : dict of string -> object
+            Parameters passed to the `fit` method of the estimator. Sample 
+            aligned parameters are split with the folds.
+
+        Returns
+        -------
+        self : object
+            Instance of the fitted ASHASearchCV.
+        """
+        if isinstance(self.scoring, (list, tuple, set, dict)):
+            raise ValueError("ASHASearchCV does not support multi-metric"
+                             " scoring. Pass a single scorer.")
+        X, y, groups = indexable(X, y, groups)
+        cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        splits = list(cv.split(X, y, groups))
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+        rng = check_random_state(self.random_state)
+        if self.resource == 'n_samples':
+            # a fixed permutation so that the rung budgets nest
+            splits = [(rng.permutation(train), test) for train, test in splits]
+
+        self.n_resources_ = self._check_resources(X, y, splits)
+        n_candidates = self.n_candidates or self.eta ** (
+            len(self.n_resources_) - 1)
+        candidate_params = list(ParameterSampler(
+            self.param_distributions, n_candidates, random_state=rng))
+        n_candidates = len(candidate_params)
+
+        rungs = [dict() for _ in self.n_resources_]
+        promoted = [set() for _ in self.n_resources_]
+        records = []
+        n_started = 0
+        n_workers = effective_n_jobs(self.n_jobs)
+
+        def submit(job):
+            candidate, k = job
+            args = (self.estimator, candidate_params[candidate], X, y, splits, 
+                    scorer, self.resource, self.n_resources_[k], fit_params, 
+                    self.error_score)
+            if n_workers == 1:
+                return _ImmediateResult(_fit_and_score_budget(*args))
+            return executor.submit(_fit_and_score_budget, *args)
+
+        executor = (get_reusable_executor(max_workers=n_workers) 
+                    if n_workers > 1 else None)
+        running = {}
+        while True:
+            while len(running) < n_workers:
+                job = self._next_job(rungs, promoted, n_started, n_candidates)
+                if job is None:
+                    break
+                n_started += job[1] == 0
+                running[submit(job)] = job
+            if not running:
+                break
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                candidate, k = running.pop(future)
+                scores, fit_time = future.result()
+                rungs[k][candidate] = np.mean(scores)
+                records.append((candidate, k, scores, fit_time))
+                if self.verbose:
+                    print(f"[ASHA] candidate {candidate} rung {k} "
+                          f"(n_resources={self.n_resources_[k]}): "
+                          f"score={rungs[k][candidate]:.4f}")
+
+        self.n_candidates_ = [len(rung) for rung in rungs]
+        self.n_splits_ = len(splits)
+        self.multimetric_ = False
+        self.scorer_ = scorer
+        self.cv_results_ = self._format_results(records, candidate_params)
+
+        self.best_index_ = int(np.argmin(self.cv_results_['rank_test_score']))
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = self.cv_results_['mean_test_score'][self.best_index_]
+
+        if self.refit:
+            best_params = dict(self.best_params_)
+            if self.resource != 'n_samples':
+                best_params[self.resource] = self.n_resources_[-1]
+            self.best_estimator_ = clone(self.estimator).set_params(
+                **best_params).fit(X, y, **fit_params)
+
+        return self
+
+    def _format_results(self, records, candidate_params):
+        """Build ``cv_results_`` from the completed evaluations."""
+        candidates, iters, scores, fit_times = map(list, zip(*records))
+        scores = np.asarray(scores, dtype=float)
+        params = [candidate_params[c] for c in candidates]
+        mean_scores = scores.mean(axis=1)
+        
+        # rank by rung reached first, then by score
+        order = np.lexsort((
+            -np.where(np.isnan(mean_scores), -np.inf, mean_scores), 
+            -np.asarray(iters))
+            )
+        ranks = np.empty(len(records), dtype=int)
+        ranks[order] = np.arange(1, len(records) + 1)
+
+        results = {'params': params}
+        for name in sorted({name for p in params for name in p}):
+            values = np.ma.MaskedArray(np.empty(len(params), dtype=object),
+                                       mask=True)
+            for i, p in enumerate(params):
+                if name in p:
+                    values[i] = p[name]
+            results[f'param_{name}'] = values
+        results['candidate'] = np.asarray(candidates)
+        results['iter'] = np.asarray(iters)
+        results['n_resources'] = np.asarray(
+            [self.n_resources_[k] for k in iters])
+        for fold in range(scores.shape[1]):
+            results[f'split{fold}_test_score'] = scores[:, fold]
+        results['mean_test_score'] = mean_scores
+        results['std_test_score'] = scores.std(axis=1)
+        results['rank_test_score'] = ranks
+        results['mean_fit_time'] = np.asarray(fit_times) / scores.shape[1]
+        
+        return results
+
+class _ImmediateResult(Future):
+    """Completed future wrapping a result computed in the calling process."""
+    def __init__(self, result):
+        super().__init__()
+        self.set_result(result)
+
+def _fit_and_score_budget(
+    estimator, params, X, y, splits, scorer, resource, n_resources, 
+    fit_params, error_score
+    ):
+    """
+    Fit and score one candidate on every fold with the given budget.
+
+    Returns the list of fold scores and the total fit time.
+    """
+    if resource != 'n_samples':
+        params = {**params, resource: n_resources}
+    n_samples = _num_samples(X)
+    scores, fit_time = [], 0.
+    for train, test in splits:
+        if resource == 'n_samples':
+            train = train[:n_resources]
+        est = clone(estimator).set_params(**params)
+        X_train, y_train = _safe_split(est, X, y, train)
+        X_test, y_test = _safe_split(est, X, y, test, train)
+        fold_params = {
+            key: _safe_indexing(value, train) 
+            if hasattr(value, '__len__') and len(value) == n_samples else value
+            for key, value in fit_params.items()
+            }
+        start = time.time()
+        try:
+            est.fit(X_train, y_train, **fold_params)
+            fit_time += time.time() - start
+            scores.append(scorer(est, X_test, y_test))
+        except Exception:
+            if error_score == 'raise':
+                raise
+            fit_time += time.time() - start
+            scores.append(error_score)
+    return scores, fit_time
@@ -18,6 +18,7 @@ from .._typing import Any, Dict, List,Union, Tuple, Optional, ArrayLike
 from ..tools.coreutils import ellipsis2false , smart_format
 from ..tools.validator import get_estimator_name 
 from ..tools.box import Boxspace 
+from ._checkpoint import _check_checkpoint
 from .utils import get_optimizer_method, align_estimators_with_params
 
 __all__=["optimize_search", "optimize_search2", "parallelize_search", 
@@ -31,6 +32,7 @@ def optimize_search(
     optimizer: str = 'RSCV', 
     save_results: bool = False, 
     n_jobs: int = -1, 
+    checkpoint: Optional[str] = None, 
     **search_kwargs: Any
 ) -> Dict[str, Dict[str, Any]]:
     """
@@ -56,6 +58,12 @@ def optimize_search(
         If True, saves the results of the search to a joblib file. Default is False.
     n_jobs : int, optional
         Number of jobs to run in parallel. Default is -1 (all available processors).
+    checkpoint : str or SearchCheckpoint, optional
+        Path of a SQLite store (or a :class:`~gofast.models._checkpoint.SearchCheckpoint`) 
+        where each fold score is recorded. Re-running the same search skips 
+        the fits already recorded, so an interrupted search resumes where it 
+        stopped. Applies to grid and randomized searches; other optimizers 
+        run as usual.
     **search_kwargs : dict
         Additional keyword arguments to pass to the search constructor.
 
@@ -87,10 +95,14 @@ def optimize_search(
         raise ValueError("The keys in 'estimators' and 'param_grids' must match.")
 
     optimizer_class = get_optimizer_method(optimizer)
+    checkpoint = _check_checkpoint(checkpoint)
 
     def perform_search(estimator_name, estimator, param_grid):
         search = optimizer_class(estimator, param_grid, n_jobs=n_jobs, **search_kwargs)
-        search.fit(X, y)
+        if checkpoint is not None: 
+            search = checkpoint.fit_search(search, X, y)
+        else: 
+            search.fit(X, y)
         return (estimator_name, search.best_estimator_, search.best_params_, search.cv_results_)
 
     # Parallel execution of the search for each estimator
@@ -227,6 +239,7 @@ def optimize_hyperparams(
     n_jobs=-1, 
     savejob: bool= ..., 
     savefile: str=None, 
+    checkpoint: str=None, 
     **kws 
     ):
     """
@@ -256,6 +269,10 @@ def optimize_hyperparams(
     savefile: str, optional 
        model binary file name. If ``None``, the estimator name is 
        used instead.
+    checkpoint: str or SearchCheckpoint, optional 
+       Path of a SQLite store where each fold score is recorded. Fits 
+       already recorded are skipped, so an interrupted search resumes 
+       where it stopped. 
        
     Returns
     -------
@@ -273,7 +290,11 @@ def optimize_hyperparams(
     optimizer_class = get_optimizer_method(optimizer) 
     optimizer = optimizer_class (estimator, param_grid, cv=cv, scoring=scoring,
                                  n_jobs=n_jobs, **kws)
-    optimizer.fit(X, y)
+    checkpoint = _check_checkpoint(checkpoint)
+    if checkpoint is not None: 
+        optimizer = checkpoint.fit_search(optimizer, X, y)
+    else: 
+        optimizer.fit(X, y)
 
     # try to save file 
     if savejob: 
@@ -298,6 +319,7 @@ def parallelize_search(
     optimizer="RandomizedSearchCV", 
     n_jobs=-1, 
     pack_models: bool=...,
+    checkpoint: str=None, 
     **kws
    ):
     """
@@ -324,6 +346,10 @@ def parallelize_search(
     pack_models: bool, default=False, 
        Aggregate multiples models results and save it into a single 
        binary file. 
+    checkpoint: str or SearchCheckpoint, optional 
+       Path of a SQLite store shared by all the searches where each fold 
+       score is recorded. Re-running the same call skips the fits already 
+       recorded and resumes the searches where they stopped.
        
     Returns
     -------
@@ -366,7 +392,7 @@ def parallelize_search(
             futures.append(executor.submit(
                 optimize_hyperparams, estimator, 
                 param_grid, X, y, cv, scoring, optimizer, 
-                n_jobs, **kws))
+                n_jobs, checkpoint=checkpoint, **kws))
 
         for idx, (future, estimator)in enumerate (zip (
                 tqdm(concurrent.futures.as_completed(futures),
@@ -29,6 +29,7 @@ from ..tools.coreutils import listing_items_format, pretty_printer
 from ..tools.validator import check_X_y, check_array, check_consistent_length 
 from ..tools.validator import get_estimator_name
 
+from ._checkpoint import _check_checkpoint
 from .utils import get_scorers, dummy_evaluation
  
 _logger = gofastlog().get_gofast_logger(__name__)
@@ -69,6 +70,11 @@ class MultipleSearch:
         Whether to save the tuning results to a joblib file. Default is False.
     filename : str, optional
         The filename for saving the joblib file. Required if savejob is True.
+    checkpoint : str or SearchCheckpoint, optional
+        Path of a SQLite store where the score of each (estimator, params, 
+        fold, data) is recorded. Re-running the same search skips the fits 
+        already recorded, so an interrupted search resumes where it stopped. 
+        Bayes searches are not checkpointed.
 
     Attributes
     ----------
@@ -112,7 +118,8 @@ class MultipleSearch:
         cv=4, 
         n_iter=10, 
         savejob=False, 
-        filename=None
+        filename=None, 
+        checkpoint=None
         ):
         self.estimators = estimators
         self.param_grids = param_grids
@@ -121,6 +128,7 @@ class MultipleSearch:
         self.n_iter=n_iter
         self.savejob = savejob
         self.filename = filename
+        self.checkpoint = checkpoint
         self.best_params_ = {}
 
     def fit(self, X, y):
@@ -187,7 +195,11 @@ class MultipleSearch:
         else:
             raise ValueError(f"Invalid search method: {optimizer}")
 
-        search.fit(X, y)
+        checkpoint = _check_checkpoint(self.checkpoint)
+        if checkpoint is not None:
+            search = checkpoint.fit_search(search, X, y)
+        else:
+            search.fit(X, y)
         return {(estimator.__class__.__name__, optimizer): search.best_params_}
         
 class MultipleSearch0:
@@ -348,6 +360,9 @@ class CrossValidator:
         The number of folds for cross-validation (default is 5).
     scoring : str, optional
         The scoring strategy to evaluate the model (default is 'accuracy').
+    checkpoint : str or SearchCheckpoint, optional
+        Path of a SQLite store where each fold score is recorded. Folds 
+        already recorded for the same model and data are not refitted.
     results : Optional[Tuple[np.ndarray, float]]
         Stored results of the cross-validation, including scores and mean score.
 
@@ -374,7 +389,8 @@ class CrossValidator:
     def __init__(
             self, clf: BaseEstimator,
             cv: int = 5, 
-            scoring: str = 'accuracy'
+            scoring: str = 'accuracy', 
+            checkpoint: Optional[str] = None
             ):
         """
         Initializes the CrossValidator with a classifier and evaluation parameters.
@@ -382,6 +398,7 @@ class CrossValidator:
         self.clf = clf
         self.cv = cv
         self.scoring = scoring
+        self.checkpoint = checkpoint
 
     def fit(self, X: Union[ArrayLike, list],
             y: Optional[Union[ArrayLike, list]] = None):
@@ -405,7 +422,13 @@ class CrossValidator:
             raise ValueError("Target labels `y` must be provided for"
                              " supervised learning models.")
         
-        scores = cross_val_score(self.clf, X, y, cv=self.cv, scoring=self.scoring)
+        checkpoint = _check_checkpoint(self.checkpoint)
+        if checkpoint is not None: 
+            scores = checkpoint.cross_val_score(
+                self.clf, X, y, cv=self.cv, scoring=self.scoring)
+        else: 
+            scores = cross_val_score(self.clf, X, y, cv=self.cv, 
+                                     scoring=self.scoring)
         mean_score = scores.mean()
         self.results_ = (scores, mean_score)
 
@@ -676,7 +699,10 @@ class BaseSearch:
         'feature_importances_',
         'best_estimator_',
         'verbose',
-        'grid_kws',
+        'savejob', 
+        'filename', 
+        'checkpoint', 
+        'data_', 
         )
     def __init__(
         self,
@@ -688,6 +714,7 @@ class BaseSearch:
         savejob:bool=False, 
         filename:str=None, 
         verbose:int=0, 
+        checkpoint:str=None, 
         **grid_kws
         ): 
         
@@ -701,7 +728,9 @@ class BaseSearch:
         self.grid_kws = grid_kws 
         self._optimizer = optimizer 
         self.verbose=verbose
+        self.savejob=savejob
         self.filename=filename
+        self.checkpoint=checkpoint
 
     @property 
     def base_estimator (self): 
@@ -791,7 +820,11 @@ class BaseSearch:
             cv = self.cv,
             **self.grid_kws
             )
-        gridObj.fit(X, y)
+        checkpoint = _check_checkpoint(self.checkpoint)
+        if checkpoint is not None: 
+            gridObj = checkpoint.fit_search(gridObj, X, y)
+        else: 
+            gridObj.fit(X, y)
         
         #make_introspection(self,  gridObj)
         params = ('best_params_','best_estimator_','cv_results_')
@@ -859,6 +892,11 @@ optimizer:str, default='GridSearchCV' or '1'
 {params.core.scoring} 
 {params.core.random_state}
 
+checkpoint: str or SearchCheckpoint, optional 
+    Path of a SQLite store where each fold score is recorded. Re-running 
+    the same search skips the fits already recorded, so an interrupted 
+    search resumes where it stopped. 
+
 Examples
 -----------
 >>> from pprint import pprint 
@@ -893,6 +931,7 @@ class SearchMultiple:
         savejob:bool =False,
         filename: str=None, 
         verbose:int =0,
+        checkpoint:str=None, 
         **grid_kws, 
         ):
         self.estimators = estimators 
@@ -903,6 +942,7 @@ class SearchMultiple:
         self.savejob=savejob
         self.filename=filename 
         self.verbose=verbose 
+        self.checkpoint=checkpoint 
         self.grid_kws=grid_kws
         
     def fit(
@@ -949,6 +989,7 @@ class SearchMultiple:
                                     cv = self.cv, 
                                     optimizer=self.optimizer, 
                                     scoring=self.scoring, 
+                                    checkpoint=self.checkpoint, 
                                     **self.grid_kws
                                       )
             searchObj.fit(X, y)
@@ -1077,6 +1118,11 @@ filename: str,
 
 {params.core.verbose} 
 
+checkpoint: str or SearchCheckpoint, optional 
+    Path of a SQLite store shared by the searches of all estimators where 
+    each fold score is recorded. Re-running the same search skips the fits 
+    already recorded, so an interrupted run resumes where it stopped. 
+
 grid_kws: dict, 
     Argument passed to `grid_method` additional keywords. 
     
@@ -8,11 +8,11 @@ import itertools
 import numpy as np 
 
 from sklearn.base import  clone
-from sklearn.model_selection import cross_val_score 
 from sklearn.model_selection._search import BaseSearchCV, ParameterSampler
 
 from ._selection import PSOBaseSearch, GeneticBaseSearch  
 from ._selection import GradientBaseSearch, AnnealingBaseSearch
+from ._selection import _evaluate_batch, _evaluate_unique_candidates
 
 __all__=["SwarmSearchCV", "GradientSearchCV", "AnnealingSearchCV", 
          "GeneticSearchCV", "EvolutionarySearchCV", "SequentialSearchCV", 
@@ -117,9 +117,10 @@ class SwarmSearchCV(PSOBaseSearch):
         Controls the randomness of the algorithm.
     
     n_jobs : int, default=1
-        The number of jobs to run in parallel for `cross_val_score`. -1 means
-        using all available processors. This can speed up the fitness evaluation,
-        especially for computationally intensive models.
+        The number of jobs to run in parallel. All particles times all 
+        cross-validation folds of an iteration are dispatched to the same pool. 
+        -1 means using all available processors. This can speed up the fitness 
+        evaluation, especially for computationally intensive models.
         
     verbose : int, default=0
         Controls the verbosity of output during the optimization process.
@@ -459,10 +460,9 @@ class SwarmSearchCV(PSOBaseSearch):
         global_best_candidates = []
     
         for iteration in range(self.max_iter):
-            for particle in particles:
-                # Evaluate the current position using a separate method
-                current_score = self._evaluate_particle(particle, self.X, self.y)
-    
+            # Evaluate the whole swarm in a single parallel batch
+            scores = self._evaluate_particles(particles, self.X, self.y)
+            for particle, current_score in zip(particles, scores):
                 # Update particle's personal best
                 if particle['best_score'] < current_score:
                     particle['best_position'] = particle['position'].copy()
@@ -1809,9 +1809,9 @@ class GeneticSearchCV(GeneticBaseSearch):
                 print(f"Generation {generation + 1}/{self.n_generations}:")
             # Evaluate current generation
             candidate_params = [individual for individual in population]
-            out = evaluate_candidates(candidate_params)
-            # Extract scores and update best parameters and estimator
-            scores = out["mean_test_score"]
+            # Only unseen individuals are fitted; duplicates reuse the cache
+            scores = _evaluate_unique_candidates(
+                evaluate_candidates, candidate_params, self._score_cache)
             for idx, score in enumerate(scores):
                 if score > self.best_score_:
                     self.best_score_ = score
@@ -1857,8 +1857,11 @@ class GeneticSearchCV(GeneticBaseSearch):
         float
             Mean cross-validation score for the individual.
         """
-        estimator = clone(self.estimator).set_params(**individual)
-        return np.mean(cross_val_score(estimator, X, y, cv=self.cv, scoring=scoring))
+        return _evaluate_batch(
+            self.estimator, [individual], X, y, cv=self.cv, scoring=scoring, 
+            n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch, 
+            error_score=self.error_score, cache=self._score_cache
+            )[0]
 
     def _crossover(self, parent1, parent2):
         """
@@ -2386,9 +2389,9 @@ class EvolutionarySearchCV(GeneticBaseSearch):
     
             # Evaluate fitness
             candidate_params = [individual for individual in population]
-            out = evaluate_candidates(candidate_params)
-            # Extract scores
-            scores = out["mean_test_score"]
+            # Only unseen individuals are fitted; duplicates reuse the cache
+            scores = _evaluate_unique_candidates(
+                evaluate_candidates, candidate_params, self._score_cache)
             
             # Check if scores array is empty
             if len(scores) == 0:
@@ -2444,12 +2447,7 @@ class EvolutionarySearchCV(GeneticBaseSearch):
         fitness_score : float
             The fitness score of the individual.
         """
-        estimator = clone(self.estimator).set_params(**individual)
-        score = np.mean(cross_val_score(
-            estimator, X, y, cv=self.cv, scoring=self.scoring, 
-            n_jobs= self.n_jobs)
-            )
-        return score
+        return self._evaluate_population([individual], X, y)[0]
 
     def _initialize_population(self):
         """
@@ -2502,13 +2500,7 @@ class EvolutionarySearchCV(GeneticBaseSearch):
         fitness_scores : list
             A list containing the fitness score of each individual in the population.
         """
-        fitness_scores = []
-        for individual in population:
-            estimator = clone(self.estimator).set_params(**individual)
-            score = np.mean(cross_val_score(estimator, X, y, cv=self.cv,
-                                            scoring=self.scoring, n_jobs= self.n_jobs))
-            fitness_scores.append(score)
-        return fitness_scores
+        return list(self._evaluate_population(population, X, y))
 
     def _evolve(self, population, fitness_scores):
         """
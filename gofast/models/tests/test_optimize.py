@@ -8,7 +8,8 @@ from sklearn.datasets import load_iris
 from sklearn.svm import SVC
 from sklearn.tree import DecisionTreeClassifier
 
-from gofast.models.optimize import parallelize_search 
+from gofast.models.optimize import parallelize_search, optimize_search 
+from gofast.models._checkpoint import SearchCheckpoint
 
 X, y = load_iris(return_X_y=True)
 
@@ -20,6 +21,46 @@ def test_parallelize_estimators ( optimizer = 'RSCV', pack_models =False ):
     o=parallelize_search(estimators, param_grids, X, y, optimizer =optimizer, 
                            pack_models = pack_models )
     return o
+
+def test_optimize_search_checkpoint(tmp_path): 
+    checkpoint = SearchCheckpoint(tmp_path / "search.sqlite")
+    estimators = {'svc': SVC()}
+    param_grids = {'svc': {'C': [1, 10], 'kernel': ['linear', 'rbf']}}
+    first = optimize_search(estimators, param_grids, X, y, optimizer='GSCV', 
+                            n_jobs=1, cv=3, checkpoint=checkpoint)
+    assert len(checkpoint) == 12 
+    # resumed run reads every fold score back from the store 
+    second = optimize_search(estimators, param_grids, X, y, optimizer='GSCV', 
+                             n_jobs=1, cv=3, checkpoint=checkpoint)
+    assert checkpoint.n_misses_ == 12 and checkpoint.n_hits_ == 12
+    assert first['svc']['best_params_'] == second['svc']['best_params_']
+
+def test_checkpoint_fit_search_fallbacks(tmp_path): 
+    import numpy as np
+    import pytest
+    from sklearn.model_selection import (
+        GridSearchCV, RandomizedSearchCV, GroupKFold)
+    checkpoint = SearchCheckpoint(tmp_path / "search.sqlite")
+    grid = {'C': [1, 10]}
+    groups = np.arange(len(y)) % 5
+    # the groups reach the splitter 
+    search = checkpoint.fit_search(
+        GridSearchCV(SVC(), grid, cv=GroupKFold(5)), X, y, groups=groups)
+    expected = GridSearchCV(SVC(), grid, cv=GroupKFold(5)).fit(
+        X, y, groups=groups)
+    np.testing.assert_allclose(search.cv_results_['mean_test_score'], 
+                               expected.cv_results_['mean_test_score'])
+    assert np.isnan(search.cv_results_['mean_fit_time']).all()
+    assert len(checkpoint) == 10 
+    # train scores and unseeded random searches are not checkpointed
+    with pytest.warns(UserWarning, match="return_train_score"):
+        search = checkpoint.fit_search(GridSearchCV(
+            SVC(), grid, cv=3, return_train_score=True), X, y)
+    assert 'mean_train_score' in search.cv_results_
+    with pytest.warns(UserWarning, match="random_state"):
+        checkpoint.fit_search(RandomizedSearchCV(
+            SVC(), grid, n_iter=2, cv=3), X, y)
+    assert len(checkpoint) == 10 
     
 
 if __name__=='__main__': 
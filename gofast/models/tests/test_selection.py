@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+@author: LKouadio <etanoyau@gmail.com>
+"""
+import random
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.model_selection import cross_val_score
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+from gofast.models.selection import SwarmSearchCV, GeneticSearchCV 
+from gofast.models._selection import _evaluate_batch 
+from gofast.models.deep_selection import ASHASearchCV 
+from gofast.estimators import BoostedRegressionTree
+
+X, y = load_iris(return_X_y=True)
+
+def test_evaluate_batch(): 
+    estimator = DecisionTreeClassifier(random_state=0)
+    candidates = [{'max_depth': 2}, {'max_depth': np.int64(3)}, {'max_depth': 2}]
+    cache = {}
+    scores = _evaluate_batch(estimator, candidates, X, y, cv=3, n_jobs=2, 
+                             cache=cache)
+    expected = [np.mean(cross_val_score(
+        DecisionTreeClassifier(random_state=0, max_depth=d), X, y, cv=3))
+        for d in (2, 3, 2)]
+    np.testing.assert_allclose(scores, expected)
+    # duplicated individuals are fitted only once 
+    assert len(cache) == 2 
+
+def test_search_batch_evaluation(): 
+    np.random.seed(0); random.seed(0)
+    swarm = SwarmSearchCV(SVC(), {'C': [0.1, 10.]}, cv=3, n_particles=4, 
+                          max_iter=2, n_jobs=2).fit(X, y)
+    assert 0.1 <= swarm.best_params_['C'] <= 10.
+    
+    genetic = GeneticSearchCV(DecisionTreeClassifier(random_state=0), 
+                              {'max_depth': [1, 2, 3]}, cv=3, n_population=6, 
+                              n_generations=3).fit(X, y)
+    # each distinct individual appears once in the results 
+    assert len(genetic.cv_results_['params']) == len(genetic._score_cache)
+
+def test_asha_search(): 
+    from sklearn.datasets import make_regression 
+    Xr, yr = make_regression(n_samples=200, n_features=5, noise=5, 
+                             random_state=0)
+    search = ASHASearchCV(
+        BoostedRegressionTree(n_estimators=27), 
+        {'learning_rate': [0.01, 0.05, 0.1, 0.3], 'max_depth': [2, 3]},
+        resource='n_estimators', min_resource=3, cv=3, random_state=0
+        ).fit(Xr, yr)
+    assert search.n_resources_ == [3, 9, 27]
+    # candidates are pruned at each rung 
+    assert search.n_candidates_[0] > search.n_candidates_[-1] >= 1 
+    best = search.best_index_
+    assert search.cv_results_['iter'][best] == len(search.n_resources_) - 1
+    assert search.best_estimator_.n_estimators == 27 
+    
+    # samples as budget 
+    search = ASHASearchCV(SVC(), {'C': [0.1, 1, 10, 100]}, eta=2, cv=3, 
+                          random_state=0).fit(X, y)
+    assert search.n_resources_ == [18, 36, 72]
+    assert search.score(X, y) > 0.9 
+
+if __name__=='__main__': 
+    test_evaluate_batch()
+    test_search_batch_evaluation()
+    test_asha_search()
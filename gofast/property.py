@@ -359,6 +359,8 @@ class Config:
                  ".pkl" : pd.read_pickle, 
                  ".sas" : pd.read_sas, 
                  ".spss": pd.read_spss,
+                 ".parquet": pd.read_parquet, 
+                 ".feather": pd.read_feather, 
                  # ".orc" : pd.read_orc, 
                  }
         
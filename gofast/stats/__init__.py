@@ -1,49 +1,56 @@
 # -*- coding: utf-8 -*-
 
-from .utils import ( 
-    mean,
-    median,
-    mode,
-    var,
-    std,
-    get_range,
-    quartiles,
-    correlation,
-    corr, 
-    iqr,
-    z_scores,
-    describe,
-    skew,
-    kurtosis,
-    t_test_independent,
-    perform_linear_regression,
-    chi2_test,
-    anova_test,
-    perform_kmeans_clustering,
-    hmean, 
-    wmedian, 
-    bootstrap, 
-    kaplan_meier_analysis, 
-    gini_coeffs, 
-    mds_similarity, 
-    dca_analysis, 
-    perform_spectral_clustering, 
-    levene_test, 
-    kolmogorov_smirnov_test, 
-    cronbach_alpha, 
-    friedman_test, 
-    statistical_tests, 
-    )
+from .._lazyload import attach
 
-from .proba import (  
-    normal_pdf,
-    normal_cdf, 
-    binomial_pmf, 
-    poisson_logpmf, 
-    uniform_sampling, 
-    stochastic_volatility_model, 
-    hierarchical_linear_model, 
-    )
+# public names of the subpackage, by providing module; a module is
+# imported on the first access of one of its names
+_submod_attrs = {
+    'utils': [
+        'mean',
+        'median',
+        'mode',
+        'var',
+        'std',
+        'get_range',
+        'quartiles',
+        'correlation',
+        'corr',
+        'iqr',
+        'z_scores',
+        'describe',
+        'skew',
+        'kurtosis',
+        't_test_independent',
+        'perform_linear_regression',
+        'chi2_test',
+        'anova_test',
+        'perform_kmeans_clustering',
+        'hmean',
+        'wmedian',
+        'bootstrap',
+        'kaplan_meier_analysis',
+        'gini_coeffs',
+        'mds_similarity',
+        'dca_analysis',
+        'perform_spectral_clustering',
+        'levene_test',
+        'kolmogorov_smirnov_test',
+        'cronbach_alpha',
+        'friedman_test',
+        'statistical_tests',
+    ],
+    'proba': [
+        'normal_pdf',
+        'normal_cdf',
+        'binomial_pmf',
+        'poisson_logpmf',
+        'uniform_sampling',
+        'stochastic_volatility_model',
+        'hierarchical_linear_model',
+    ],
+}
+
+__getattr__, __dir__ = attach(__name__, submod_attrs=_submod_attrs)
 
 __all__=[ 
     "mean", 
@@ -853,12 +853,31 @@ def test_statistic_function(sample_data4):
 def test_output_type_as_frame(sample_data4):
     stats_df = bootstrap(sample_data4, n=10, as_frame=True)
     assert isinstance(stats_df, pd.DataFrame), "When 'as_frame' is True, output should be a DataFrame"
+    assert list(stats_df.columns) == ['bootstrap_stats']
+    stats_df = bootstrap(pd.DataFrame({'A': sample_data4, 'B': sample_data4}),
+                         n=10, as_frame=True, view=False)
+    assert list(stats_df.columns) == ['A', 'B']
 
 def test_input_validation():
     with pytest.raises(ValueError):
         # Assuming the function raises ValueError for invalid data types
         bootstrap(data="invalid", n=10)  
 
+def test_bootstrap_engine(sample_dataframe4):
+    from functools import partial
+    stats, (lower, upper) = bootstrap(
+        sample_dataframe4, n=500, func=np.median, view=False, 
+        return_ci=True, method='bca', random_state=0, batch_size=64)
+    assert stats.shape == (500, 2)
+    assert lower.shape == upper.shape == (2,) and np.all(lower < upper)
+    # same stream whatever the evaluation path
+    generic = bootstrap(sample_dataframe4, n=500, func=lambda x: np.median(x),
+                        view=False, random_state=0, batch_size=64, n_jobs=2)
+    np.testing.assert_allclose(stats, generic)
+    q90 = bootstrap(sample_dataframe4, n=50, columns=['A'], view=False,
+                    func=partial(np.quantile, q=0.9), random_state=0)
+    assert q90.shape == (50,)
+
 def test_kaplan_meier_with_numpy():
     durations = np.array([5, 6, 6, 2.5, 4, 4])
     event_observed = np.array([1, 0, 0, 1, 1, 1])
@@ -11,6 +11,7 @@ of data types and structures.
 """
 from __future__ import annotations 
 import numpy as np
+from joblib import Parallel, delayed
 from scipy import stats
 import pandas as pd
 import seaborn as sns 
@@ -3120,7 +3121,11 @@ def bootstrap(
     fig_size: Tuple[int, int] = (10, 6),
     random_state: Optional[int] = None,
     return_ci: bool = False,
-    ci: float = 0.95
+    ci: float = 0.95, 
+    method: str = 'percentile', 
+    vectorized: Optional[bool] = None, 
+    batch_size: Optional[int] = None, 
+    n_jobs: Optional[int] = None, 
 ) -> Union[Array1D, DataFrame, Tuple[Union[Array1D, DataFrame],
                                      Tuple[float, float]]]:
     """
@@ -3148,7 +3153,10 @@ def bootstrap(
     func : callable, optional
         The statistic to compute from the resampled data, default is np.mean.
     as_frame : bool, optional
-        If True, returns results in a pandas DataFrame. Default is False.
+        If True, returns results in a pandas DataFrame. A single bootstrapped
+        variable gives one ``'bootstrap_stats'`` column, as in the previous 
+        releases, and several variables one column each, named after the 
+        columns of `data`. Default is False.
     view : bool, optional
         If True, displays a histogram of the bootstrapped statistics. 
         Default is True.
@@ -3166,13 +3174,49 @@ def bootstrap(
         confidence interval. Default is False.
     ci : float, optional
         The confidence level for the interval. Default is 0.95.
+    method : {'percentile', 'bca'}, optional
+        Method of the confidence interval. ``'percentile'`` takes the 
+        quantiles of the bootstrap distribution while ``'bca'`` corrects 
+        them for bias and skewness (bias-corrected and accelerated interval,
+        with the acceleration estimated by jackknife). Default is 
+        'percentile'.
+    vectorized : bool, optional
+        If True, `func` is called once per block of resamples with an 
+        ``axis`` keyword, i.e. ``func(samples, axis=1)``. By default it is 
+        enabled for NumPy reductions such as ``np.mean``, ``np.median``, 
+        ``np.std`` or ``functools.partial(np.quantile, q=0.9)`` and the 
+        other callables are applied to each resampled column.
+    batch_size : int, optional
+        Number of resamples drawn per block. By default a block holds about
+        64 MB of resampled data.
+    n_jobs : int, optional
+        Number of processes the blocks are spread over when `func` is not 
+        vectorized. Default is None, i.e. the blocks run in the current 
+        process.
 
     Returns
     -------
     bootstrapped_stats : ndarray or DataFrame
-        Array or DataFrame of bootstrapped statistic values. If `return_ci` 
-        is True, also returns a tuple containing
-        the lower and upper bounds of the confidence interval.
+        Array of shape (n,) for a single column, or (n, n_columns) with one
+        column per bootstrapped variable. With `as_frame`, a DataFrame of 
+        shape (n, 1) or (n, n_columns). If `return_ci` is True, also 
+        returns a tuple containing the lower and upper bounds of the 
+        confidence interval, as arrays of length n_columns when several 
+        columns are bootstrapped.
+
+        .. versionchanged:: 0.1.0
+           The columns of a multi-column `data` are bootstrapped each on 
+           its own, so the frame has one column per variable instead of a 
+           single ``'bootstrap_stats'`` column of pooled values, and the 
+           confidence interval is also returned with `as_frame`.
+
+    Notes
+    -----
+    Resample indices are drawn as one matrix per block from a 
+    :class:`numpy.random.Generator`, and each column is bootstrapped on 
+    its own rather than pooled with the others. A seed is spawned for each
+    block, so the results for a given `random_state` do not depend on 
+    `n_jobs`.
 
     Examples
     --------
@@ -3188,40 +3232,143 @@ def bootstrap(
     >>> stats, ci = bootstrap(df, n=1000, func=np.median, columns=['A'],
                               view=True, return_ci=True, ci=0.95)
     >>> print(f"Median CI: {ci}")
-    """
-    if random_state is not None:
-        np.random.seed(random_state)
-    data = data.to_numpy().flatten()
 
-    bootstrapped_stats = [
-        func(np.random.choice(data, size=len(data), replace=True)
-             ) for _ in range(n)]
+    Each column bootstrapped on its own with BCa intervals:
+    >>> stats, (lower, upper) = bootstrap(df, n=2000, func=np.median, 
+                                          view=False, return_ci=True,
+                                          method='bca', random_state=0)
+    >>> stats.shape
+    (2000, 2)
+    """
+    method = normalize_string(
+        method, target_strs=['percentile', 'bca'], match_method='contains',
+        raise_exception=True, return_target_only=True, 
+        error_msg=f"Invalid method {method!r}. Expect 'percentile' or 'bca'."
+        )
+    columns = list(data.columns)
+    X = data.to_numpy(dtype=float)
+    n_samples, n_features = X.shape
+    if vectorized is None:
+        vectorized = _is_vectorizable_stat(func)
+
+    if batch_size is None:
+        # keep one block of resamples around 64 MB
+        batch_size = max(1, min(n, 2**23 // max(1, n_samples * n_features)))
+    bounds = list(range(0, n, batch_size)) + [n]
+    seeds = np.random.SeedSequence(random_state).spawn(len(bounds) - 1)
+    blocks = [(seed, stop - start) for seed, start, stop in zip(
+        seeds, bounds[:-1], bounds[1:])]
+
+    if vectorized or n_jobs is None or len(blocks) == 1:
+        results = [_bootstrap_block(X, func, seed, size, vectorized)
+                   for seed, size in blocks]
+    else:
+        results = Parallel(n_jobs=n_jobs)(
+            delayed(_bootstrap_block)(X, func, seed, size, vectorized)
+            for seed, size in blocks)
+    bootstrapped_stats = np.concatenate(results, axis=0)
 
     if view:
         colors, alphas = get_colors_and_alphas(
-            bootstrapped_stats, cmap, convert_to_named_color=True)
+            columns, cmap, convert_to_named_color=True)
         plt.figure(figsize=fig_size)
-        plt.hist(bootstrapped_stats, bins='auto', color=colors[0],
-                 alpha=alpha, rwidth=0.85)
+        for k, name in enumerate(columns):
+            plt.hist(bootstrapped_stats[:, k], bins='auto', color=colors[k],
+                     alpha=alpha, rwidth=0.85, 
+                     label=str(name) if n_features > 1 else None)
         plt.title('Distribution of Bootstrapped Statistics')
         plt.xlabel('Statistic Value')
         plt.ylabel('Frequency')
+        if n_features > 1:
+            plt.legend()
         plt.show()
 
     if return_ci:
-        lower_bound = np.percentile(bootstrapped_stats, (1 - ci) / 2 * 100)
-        upper_bound = np.percentile(bootstrapped_stats, (1 + ci) / 2 * 100)
-        result = (bootstrapped_stats, (lower_bound, upper_bound))
-    else:
-        result = bootstrapped_stats
+        if method == 'bca':
+            lower_q, upper_q = _bca_levels(
+                X, bootstrapped_stats, func, ci, vectorized)
+        else:
+            lower_q = np.full(n_features, (1 - ci) / 2)
+            upper_q = np.full(n_features, (1 + ci) / 2)
+        lower_bound = np.array([np.percentile(bootstrapped_stats[:, k], q * 100)
+                                for k, q in enumerate(lower_q)])
+        upper_bound = np.array([np.percentile(bootstrapped_stats[:, k], q * 100)
+                                for k, q in enumerate(upper_q)])
+        if n_features == 1:
+            lower_bound, upper_bound = lower_bound[0], upper_bound[0]
+        confidence_interval = (lower_bound, upper_bound)
 
     if as_frame:
-        return convert_and_format_data( 
-            result if not return_ci else result[0], return_df=True,
-            series_name="bootstrap_stats"
-            ) if as_frame else np.array(bootstrapped_stats) 
+        bootstrapped_stats = pd.DataFrame(
+            bootstrapped_stats, columns=columns if n_features > 1 
+            else ["bootstrap_stats"])
+    elif n_features == 1:
+        bootstrapped_stats = bootstrapped_stats[:, 0]
+
+    if return_ci:
+        return bootstrapped_stats, confidence_interval
     
-    return result
+    return bootstrapped_stats
+
+# Reductions evaluated along an axis over a whole block of resamples at once.
+_VECTORIZED_STATS = (
+    np.mean, np.median, np.std, np.var, np.min, np.max, np.sum, np.ptp,
+    np.nanmean, np.nanmedian, np.nanstd, np.nanvar, np.nanmin, np.nanmax,
+    np.quantile, np.percentile, np.nanquantile, np.nanpercentile,
+    )
+
+def _is_vectorizable_stat(func):
+    """Whether `func` is a NumPy reduction that accepts an `axis` argument,
+    either directly or through :func:`functools.partial`."""
+    func = getattr(func, 'func', func)
+    return any(func is f for f in _VECTORIZED_STATS)
+
+def _apply_stat(func, samples, vectorized):
+    """Compute `func` on resamples of shape (n_resamples, n_samples,
+    n_features) and return an array of shape (n_resamples, n_features)."""
+    if vectorized:
+        return np.asarray(func(samples, axis=1), dtype=float).reshape(
+            samples.shape[0], samples.shape[2])
+    return np.array([[func(sample[:, k]) for k in range(samples.shape[2])]
+                     for sample in samples], dtype=float)
+
+def _bootstrap_block(X, func, seed, size, vectorized):
+    """Draw `size` resamples of the rows of `X` as one index matrix and
+    compute the statistic of each column."""
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, X.shape[0], size=(size, X.shape[0]))
+    return _apply_stat(func, X[indices], vectorized)
+
+def _bca_levels(X, bootstrapped_stats, func, ci, vectorized):
+    """Bias-corrected and accelerated quantile levels of each column."""
+    n_samples = X.shape[0]
+    theta_hat = _apply_stat(func, X[None], vectorized)[0]
+    bias = np.mean(bootstrapped_stats < theta_hat, axis=0)
+    z0 = stats.norm.ppf(bias)
+
+    # leave-one-out estimates, in chunks to bound the (n, n-1) index matrix
+    jackknife = []
+    positions = np.arange(n_samples - 1)
+    chunk = max(1, 2**23 // max(1, n_samples * X.shape[1]))
+    for start in range(0, n_samples, chunk):
+        left_out = np.arange(start, min(start + chunk, n_samples))[:, None]
+        indices = positions + (positions >= left_out)
+        jackknife.append(_apply_stat(func, X[indices], vectorized))
+    jackknife = np.concatenate(jackknife, axis=0)
+    deviation = jackknife.mean(axis=0) - jackknife
+    with np.errstate(invalid='ignore', divide='ignore'):
+        acceleration = (deviation ** 3).sum(axis=0) / (
+            6 * ((deviation ** 2).sum(axis=0)) ** 1.5)
+    acceleration = np.nan_to_num(acceleration)
+
+    levels = []
+    for z_alpha in stats.norm.ppf([(1 - ci) / 2, (1 + ci) / 2]):
+        adjusted = z0 + (z0 + z_alpha) / (1 - acceleration * (z0 + z_alpha))
+        # degenerate bias (all resamples on one side) falls back to the
+        # percentile level
+        levels.append(np.where(np.isfinite(adjusted), stats.norm.cdf(adjusted),
+                               stats.norm.cdf(z_alpha)))
+    return levels
 
 @ensure_pkg(
     "lifelines","The 'lifelines' package is required for this function to run.")
@@ -5,6 +5,7 @@ Created on Wed Dec 27 15:43:09 2023
 @author: Daniel
 """
 
+import pytest
 import numpy as np
 from sklearn.datasets import load_iris
 from sklearn.model_selection import train_test_split
@@ -19,6 +20,13 @@ from gofast.estimators import (
     DecisionTreeBasedClassifier,
     HBTEnsembleClassifier,
     HBTEnsembleRegressor,
+    DecisionStumpRegressor,
+    AdalineRegressor,
+    AdalineStochasticClassifier,
+    BasePerceptron,
+    HammersteinWienerRegressor,
+    DecisionTreeBasedRegressor,
+    BoostedRegressionTree,
 )
 
 def test_simple_average_classifier():
@@ -203,6 +211,177 @@ def test_hybrid_boosted_tree_ensemble_regressor():
     assert mse >= 0.0  # Replace with the expected MSE
 
 
+def test_decision_stump_regressor():
+    # Compare the cumulative-sum split search with an exhaustive scan
+    rng = np.random.RandomState(0)
+    X = rng.randint(0, 8, size=(60, 3)).astype(float)
+    y = X[:, 1] * 2 + rng.normal(size=60)
+
+    best_error, best_split = np.inf, None
+    for feature in range(X.shape[1]):
+        for value in np.unique(X[:, feature]):
+            left = X[:, feature] <= value
+            error = np.sum((y[left] - y[left].mean()) ** 2)
+            if (~left).any():
+                error += np.sum((y[~left] - y[~left].mean()) ** 2)
+            if error < best_error:
+                best_error, best_split = error, (feature, value)
+
+    stump = DecisionStumpRegressor().fit(X, y)
+    assert (stump.split_feature, stump.split_value) == best_split
+
+    y_pred = stump.predict(X)
+    left = X[:, stump.split_feature] <= stump.split_value
+    np.testing.assert_allclose(y_pred[left], y[left].mean())
+    np.testing.assert_allclose(y_pred[~left], y[~left].mean())
+
+    # Histogram-based search stays close to the exact split on large data
+    X = rng.normal(size=(5000, 5))
+    y = np.where(X[:, 3] > 0.5, 3., -1.) + rng.normal(scale=0.1, size=5000)
+    stump = DecisionStumpRegressor(max_bins=64).fit(X, y)
+    assert stump.split_feature == 3
+    assert abs(stump.split_value - 0.5) < 0.1
+
+
+def test_adaline_mini_batch_and_partial_fit():
+    rng = np.random.RandomState(42)
+    X = rng.normal(size=(300, 3))
+    y_class = np.where(X[:, 0] - X[:, 2] > 0, 1, -1)
+    y_reg = X @ np.array([1.5, -2., 0.5]) + 1.
+
+    for batch_size in (1, 32, None):
+        clf = BasePerceptron(n_iter=20, batch_size=batch_size, random_state=0)
+        clf.fit(X, y_class)
+        assert len(clf.errors_) == 20
+        assert accuracy_score(y_class, clf.predict(X)) > 0.9
+
+        reg = AdalineRegressor(eta=0.1, n_iter=50, batch_size=batch_size,
+                               random_state=0)
+        reg.fit(X, y_reg)
+        assert mean_squared_error(y_reg, reg.predict(X)) < 1e-2
+
+    # Streaming the data by chunks
+    clf = AdalineStochasticClassifier(eta=0.01, batch_size=16, random_state=0)
+    for _ in range(10):
+        for start in range(0, len(X), 100):
+            clf.partial_fit(X[start:start + 100], y_class[start:start + 100])
+    assert len(clf.cost_) == 30
+    assert accuracy_score(y_class, clf.predict(X)) > 0.9
+
+
+def test_hammerstein_wiener_regressor_stream():
+    from sklearn.linear_model import LinearRegression
+    rng = np.random.RandomState(0)
+    X = rng.rand(80, 2)
+    y = rng.rand(80)
+
+    hw = HammersteinWienerRegressor(LinearRegression(), memory_depth=5)
+    X_lagged = hw._preprocess_data(X)
+    expected = np.array([np.tanh(X[i - 5:i]).flatten() for i in range(5, 80)])
+    np.testing.assert_allclose(X_lagged, expected)
+
+    y_pred = hw.fit(X, y).predict(X)
+    assert y_pred.shape == (75,)
+    # Scoring the samples one at a time gives the batch predictions
+    y_stream = np.concatenate(list(hw.predict_stream(X[:, None, :])))
+    np.testing.assert_allclose(y_stream, y_pred)
+    # and so does scoring uneven chunks after a reset
+    hw.reset_stream()
+    y_chunks = np.concatenate(
+        [hw.partial_predict(X[:3]), hw.partial_predict(X[3:41]),
+         hw.partial_predict(X[41:])])
+    np.testing.assert_allclose(y_chunks, y_pred)
+
+
+def test_tree_ensembles_parallel_and_warm_start():
+    iris = load_iris()
+    X, y = iris.data, iris.target
+
+    clf = DecisionTreeBasedClassifier(n_estimators=5, n_jobs=2, random_state=0)
+    clf.fit(X, y)
+    np.testing.assert_array_equal(clf.classes_, np.unique(y))
+    assert accuracy_score(y, clf.predict(X)) > 0.9
+    np.testing.assert_allclose(clf.predict_proba(X).sum(axis=1), 1.)
+
+    rng = np.random.RandomState(0)
+    X = rng.rand(200, 3)
+    y = X[:, 0] + 0.1 * rng.rand(200)
+    reg = DecisionTreeBasedRegressor(n_estimators=4, warm_start=True,
+                                     random_state=0).fit(X, y)
+    first_trees = list(reg.estimators_)
+    reg.set_params(n_estimators=6).fit(X, y)
+    assert len(reg.estimators_) == 6
+    assert reg.estimators_[:4] == first_trees
+    assert reg.predict(X).shape == (200,)
+
+
+@pytest.mark.parametrize("Ensemble", [DecisionTreeBasedClassifier,
+                                      HBTEnsembleClassifier])
+def test_classifier_warm_start_classes(Ensemble):
+    iris = load_iris()
+    X, y = iris.data, iris.target
+    clf = Ensemble(n_estimators=2, warm_start=True).fit(X, y)
+    # the new members see a subset of the classes only
+    subset = y < 2
+    clf.set_params(n_estimators=4).fit(X[subset], y[subset])
+    assert len(clf.classes_) == 3
+    assert set(clf.predict(X)) <= {0, 1, 2}
+    if hasattr(clf, 'predict_proba'):
+        proba = clf.predict_proba(X)
+        assert proba.shape == (150, 3)
+        np.testing.assert_allclose(proba.sum(axis=1), 1.)
+    with pytest.raises(ValueError, match="new labels"):
+        clf.set_params(n_estimators=5).fit(X, np.where(y == 2, 3, y))
+
+
+def test_boosted_regression_tree_early_stopping():
+    rng = np.random.RandomState(0)
+    X = rng.rand(500, 3)
+    y = np.sin(3 * X[:, 0]) + X[:, 1] + rng.normal(scale=0.1, size=500)
+
+    brt = BoostedRegressionTree(n_estimators=50, random_state=0).fit(X, y)
+    assert brt.n_estimators_ == 50
+    # the loss decreases with the boosting stages
+    assert brt.train_score_[-1] < brt.train_score_[0]
+    # reproducible with a seed
+    brt2 = BoostedRegressionTree(n_estimators=50, random_state=0).fit(X, y)
+    np.testing.assert_allclose(brt.predict(X), brt2.predict(X))
+
+    brt = BoostedRegressionTree(n_estimators=1000, learning_rate=0.3,
+                                n_iter_no_change=5, random_state=0).fit(X, y)
+    assert brt.n_estimators_ < 1000
+    assert len(brt.validation_score_) == brt.n_estimators_
+
+    stages = list(brt.staged_predict(X))
+    assert len(stages) == brt.n_estimators_
+    np.testing.assert_allclose(stages[-1], brt.predict(X))
+
+
+@pytest.mark.parametrize("loss", ["linear", "square", "pseudo_huber"])
+def test_boosted_regression_tree_losses(loss):
+    rng = np.random.RandomState(0)
+    X = rng.rand(300, 3)
+    y = 3 * X[:, 0] + rng.normal(scale=0.1, size=300)
+
+    brt = BoostedRegressionTree(n_estimators=100, loss=loss,
+                                random_state=0).fit(X, y)
+    assert np.isfinite(brt.train_score_).all()
+    assert np.all(np.diff(brt.train_score_) <= 0)
+    assert brt.train_score_[-1] < 0.01 * brt.train_score_[0]
+
+
+def test_boosted_regression_tree_exponential_loss_deprecated():
+    rng = np.random.RandomState(0)
+    X = rng.rand(100, 3)
+    y = 3 * X[:, 0]
+    with pytest.warns(FutureWarning, match="pseudo_huber"):
+        brt = BoostedRegressionTree(n_estimators=20, loss='exponential',
+                                    random_state=0).fit(X, y)
+    expected = BoostedRegressionTree(n_estimators=20, loss='pseudo_huber',
+                                     random_state=0).fit(X, y)
+    np.testing.assert_allclose(brt.predict(X), expected.predict(X))
+
+
 if __name__ == "__main__":
     test_simple_average_classifier()
     test_weighted_average_classifier()
@@ -213,4 +392,9 @@ if __name__ == "__main__":
     test_decision_tree_based_classifier()
     test_hybrid_boosted_tree_ensemble_classifier()
     test_hybrid_boosted_tree_ensemble_regressor()
+    test_decision_stump_regressor()
+    test_adaline_mini_batch_and_partial_fit()
+    test_hammerstein_wiener_regressor_stream()
+    test_tree_ensembles_parallel_and_warm_start()
+    test_boosted_regression_tree_early_stopping()
 
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Import time regression tests
+============================
+``import gofast`` and the subpackages load their modules lazily (PEP 562):
+the heavy dependencies must only be imported when a symbol needing them is
+used. The import is profiled with ``python -X importtime``.
+"""
+import os
+import sys
+import subprocess
+import pytest
+
+HEAVY_MODULES = ("matplotlib", "seaborn", "sklearn", "pandas", "scipy")
+# generous budget of the cumulative import time of gofast, in microseconds
+IMPORT_BUDGET_US = 1_000_000
+
+def _importtime(statement):
+    """
+    Run `statement` under ``-X importtime``. Return the cumulative import
+    time of the modules, in microseconds, and the names of the modules
+    loaded by the statement (some modules redirect stderr while importing,
+    so the latter are read from ``sys.modules``).
+    """
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [root, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c",
+         f"{statement}\nimport sys; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, env=env, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times, set(result.stdout.split())
+
+def _top_level(modules):
+    return {name.split(".")[0] for name in modules}
+
+def test_import_gofast_is_lazy():
+    times, modules = _importtime("import gofast")
+    assert "gofast" in times
+    assert not _top_level(modules).intersection(HEAVY_MODULES)
+    assert times["gofast"] < IMPORT_BUDGET_US, (
+        f"import gofast took {times['gofast'] / 1e6:.2f}s")
+
+@pytest.mark.parametrize("subpackage", ["plot", "stats", "tools"])
+def test_import_subpackage_is_lazy(subpackage):
+    _, modules = _importtime(f"import gofast.{subpackage}")
+    assert f"gofast.{subpackage}" in modules
+    assert not _top_level(modules).intersection(HEAVY_MODULES)
+
+def test_plotting_libraries_loaded_on_use():
+    _, modules = _importtime("from gofast.stats import mean")
+    assert "gofast.stats.utils" in modules
+    assert "gofast.plot" not in modules
+
+    _, modules = _importtime("import gofast; gofast.plot.EvalPlotter")
+    assert {"matplotlib", "gofast.plot.evaluate"}.issubset(modules)
+
+def test_lazy_attributes():
+    import gofast
+    import gofast.stats
+
+    assert "plot" in dir(gofast)
+    assert "mean" in dir(gofast.stats)
+    assert gofast.numpy is sys.modules["numpy"]
+    assert gofast.stats.mean is gofast.stats.utils.mean
+    with pytest.raises(AttributeError):
+        gofast.stats.not_a_function
+
+def test_import_with_unwritable_log_path(tmp_path):
+    # a log directory that cannot be created does not break the import, and
+    # the records of other libraries stay out of the gofast logs
+    root = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    env = dict(os.environ, LOG_PATH=str(blocker / "logs"),
+               XDG_CACHE_HOME=str(tmp_path / "cache"), PYTHONPATH=root)
+    subprocess.run([sys.executable, "-c", "import gofast"], env=env,
+                   check=True)
+    del env["LOG_PATH"]
+    subprocess.run(
+        [sys.executable, "-c", "import gofast, logging;"
+         "logging.getLogger('matplotlib.style').info('other');"
+         "logging.getLogger('gofast.base').info('gofast')"],
+        env=env, check=True)
+    logs = (tmp_path / "cache" / "gofast" / "logs" / "infos.log").read_text()
+    assert "gofast.base" in logs and "matplotlib" not in logs
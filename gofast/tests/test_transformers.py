@@ -35,6 +35,7 @@ from gofast.transformers import (
     TimeSeriesFeatureExtractor,
     CategoryFrequencyEncoder,
     DateTimeCyclicalEncoder,
+    TimeSeriesFeatureGenerator,
     LagFeatureGenerator,
     DifferencingTransformer,
     MovingAverageTransformer,
@@ -219,6 +220,35 @@ def test_lag_feature_generator():
     assert 'lag_2' in lag_features.columns
     assert 'lag_3' in lag_features.columns
 
+def test_time_series_feature_generator():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame({'id': rng.choice(['a', 'b'], 200),
+                      'value': rng.normal(size=200)})
+    X.loc[[5, 50, 120], 'value'] = np.nan
+    generator = TimeSeriesFeatureGenerator(
+        lags=2, diffs=1, windows=3, window_stats=['mean', 'std', 'max'],
+        cumsum=True, group_col='id', min_periods=2)
+    features = generator.fit_transform(X)
+    assert list(features.columns) == ['id', 'value'] + [
+        'value_lag_1', 'value_lag_2', 'value_diff_1', 'value_roll3_mean',
+        'value_roll3_std', 'value_roll3_max', 'value_cumsum']
+    groups = X.groupby('id')['value']
+    rolling = groups.rolling(3, min_periods=2)
+    expected = pd.DataFrame({
+        'value_lag_1': groups.shift(1), 'value_lag_2': groups.shift(2),
+        'value_diff_1': groups.diff(1),
+        'value_roll3_mean': rolling.mean().droplevel(0),
+        'value_roll3_std': rolling.std().droplevel(0),
+        'value_roll3_max': rolling.max().droplevel(0),
+        'value_cumsum': groups.cumsum()})
+    pd.testing.assert_frame_equal(features.iloc[:, 2:], expected.sort_index(),
+                                  check_exact=False)
+    # streaming by chunks gives the features of the whole series
+    generator.fit(X)
+    streamed = pd.concat([generator.partial_transform(X.iloc[i:i + 17])
+                          for i in range(0, 200, 17)])
+    pd.testing.assert_frame_equal(streamed, features, check_exact=False)
+
 def test_differencing_transformer():
     # Create a sample DataFrame with time series data
     X = pd.DataFrame({'value': np.cumsum(np.random.randn(100))})
@@ -276,6 +306,25 @@ def test_sequential_backward_selection():
     # Ensure that the transformed data has the expected shape
     assert X_selected.shape == (df.shape[0], 3)
 
+def test_sequential_backward_selection_cache():
+    from sklearn.neighbors import KNeighborsClassifier
+    X, y = make_classification(n_samples=200, n_features=6, n_informative=3,
+                               random_state=0)
+    sbs = SequentialBackwardSelection(KNeighborsClassifier(), k_features=3,
+                                      cv=3)
+    sbs.fit(X, y)
+    assert len(sbs.indices_) == 3 and len(sbs.scores_) == 4
+    # 1 + 6 + 5 + 4 subsets scored
+    assert len(sbs.subset_scores_) == 16
+    n_scored = len(sbs.subset_scores_)
+    # the path down to 3 features is read back, only 3 subsets are fitted
+    sbs.set_params(k_features=2).fit(X, y)
+    assert len(sbs.subset_scores_) == n_scored + 3
+    assert sbs.transform(X).shape == (200, 2)
+    pruned = SequentialBackwardSelection(
+        KNeighborsClassifier(), k_features=3, cv=3, prune_margin=0.).fit(X, y)
+    assert len(pruned.subset_scores_) <= n_scored
+
 # Test KMeansFeaturizer
 def test_kmeans_featurizer():
     # Generate a sample dataset for testing
@@ -291,6 +340,15 @@ def test_kmeans_featurizer():
     # Ensure that the transformed data has the expected shape
     assert X_kmeans.shape == (df.shape[0], 3)
 
+def test_featurize_keeps_model_params():
+    from scipy import sparse
+    from gofast.transformers import _featurize_X
+    X = np.random.default_rng(0).normal(size=(60, 4))
+    # featurizing with a fitted model leaves its parameters untouched
+    model = KMeansFeaturizer(n_clusters=3, random_state=0).fit(X)
+    X_sparse, _ = _featurize_X(X, model=model, to_sparse=True)
+    assert sparse.issparse(X_sparse) and not model.to_sparse
+
 # Test StratifiedWithCategoryAdder
 def test_stratified_with_category_adder():
     # Generate a sample dataset for testing
@@ -411,7 +469,11 @@ def test_frame_union():
     X = frame_union.fit_transform(df)
     
     # Check the shape of the transformed DataFrame
-    assert X.shape == (3, 5)  # 2 numeric columns + 3 one-hot encoded categorical columns
+    assert X.shape == (3, 3)  # 2 numeric columns + 1 ordinal encoded column
+    
+    # One-hot encode the categories instead
+    X = FrameUnion(encode_mode='OneHotEncoder').fit_transform(df)
+    assert X.shape == (3, 4)  # 2 numeric columns + 2 one-hot encoded columns
 
     # Initialize FrameUnion with custom settings (e.g., scaling)
     frame_union = FrameUnion(scale=True, encode=False)
@@ -421,7 +483,29 @@ def test_frame_union():
     
     # Check the shape of the transformed DataFrame
     assert X.shape == (3, 2)  # 2 scaled numeric columns  
-
+    np.testing.assert_allclose(X.mean(axis=0), 0., atol=1e-12)
+    # the raw categories are left out of the sparse output as well
+    X = FrameUnion(encode=False, sparse_output=True).fit_transform(df)
+    assert X.shape == (3, 2)
+
+
+def test_frame_union_sparse_chunks():
+    from scipy import sparse
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'num1': rng.normal(size=50), 'num2': rng.normal(size=50),
+                       'cat': rng.choice([f'c{i}' for i in range(20)], 50)})
+    union = FrameUnion(encode_mode='OneHotEncoder')
+    X = union.fit_transform(df)
+    # the training blocks are not kept on the fitted transformer
+    assert not hasattr(union, 'X_num_') and not hasattr(union, 'X_cat_')
+    # the one-hot block is kept sparse
+    assert sparse.issparse(X)
+    assert X.shape == (50, 2 + df['cat'].nunique()) == (50, union.n_features_out_)
+    chunked = FrameUnion(encode_mode='OneHotEncoder', chunk_size=16).fit(df)
+    assert [c.shape[0] for c in chunked.iter_transform(df)] == [16, 16, 16, 2]
+    np.testing.assert_allclose(chunked.transform(df).toarray(), X.toarray())
+    dense = FrameUnion(encode_mode='OneHotEncoder', sparse_output=False)
+    np.testing.assert_allclose(dense.fit_transform(df), X.toarray())
 
 def test_text_feature_extractor():
     # Create a sample list of text data
@@ -693,6 +777,49 @@ def test_image_batch_loader():
         # Check that each batch of images is of the specified batch size
         assert len(batch_images) == 2
 
+@pytest.mark.parametrize("options", [
+    dict(n_workers=1), dict(n_workers=2, prefetch=1),
+    dict(n_workers=2, executor='process'), dict(n_workers=2, normalize=True)])
+def test_image_batch_loader_prefetch(tmp_path, options):
+    import matplotlib.pyplot as plt
+    rng = np.random.default_rng(0)
+    images = rng.random((7, 8, 6, 3))
+    for i, image in enumerate(images):
+        plt.imsave(tmp_path / f'image{i}.png', image)
+    expected = np.array([plt.imread(tmp_path / f'image{i}.png')
+                         for i in range(7)])
+    if options.get('normalize'):
+        expected = expected / 255.0
+    for mmap_path in (None, str(tmp_path / 'batches.npy')):
+        loader = ImageBatchLoader(batch_size=3, directory=str(tmp_path / ''),
+                                  mmap_path=mmap_path, **options)
+        files = sorted(str(p) for p in tmp_path.glob('image*.png'))
+        batches = [batch.copy() for batch in loader.transform(files)]
+        assert [len(batch) for batch in batches] == [3, 3, 1]
+        np.testing.assert_allclose(np.concatenate(batches), expected)
+
+@pytest.mark.parametrize('options', [
+    dict(n_workers=1), dict(n_workers=2, prefetch=2),
+    dict(n_workers=2, prefetch=0), dict(n_workers=2, executor='process')])
+def test_image_batch_loader_keeps_previous_batch(tmp_path, options):
+    import matplotlib.pyplot as plt
+    rng = np.random.default_rng(1)
+    for i, image in enumerate(rng.random((9, 4, 5, 3))):
+        plt.imsave(tmp_path / f'image{i}.png', image)
+    files = sorted(str(p) for p in tmp_path.glob('image*.png'))
+    expected = np.array([plt.imread(file) for file in files])
+    loader = ImageBatchLoader(batch_size=2, directory=str(tmp_path),
+                              mmap_path=str(tmp_path / 'batches.npy'),
+                              **options)
+    previous = None
+    for k, batch in enumerate(loader.transform(files)):
+        # the view on the previous slot is not rewritten yet
+        if previous is not None:
+            np.testing.assert_allclose(previous, expected[2 * k - 2: 2 * k])
+        np.testing.assert_allclose(batch, expected[2 * k: 2 * k + 2])
+        previous = batch
+    assert k == 4
+
 # # Run the tests
 # if __name__ == "__main__":
 #     test_combined_attributes_adder()
@@ -6,133 +6,139 @@ utilities and additional functionalities are performed with
  :mod:`~gofast.tools.mlutils` and :mod:`~gofast.tools.coreutils` respectively. 
 """
 
-from .baseutils import (
-    audit_data, 
-    read_data,
-    sanitize, 
-    fetch_remote_data, 
-    array2hdf5, 
-    save_or_load, 
-    request_data, 
-    fancier_downloader,
-    speed_rowwise_process,
-    store_or_retrieve_data, 
-    enrich_data_spectrum, 
-    format_long_column_names, 
-    summarize_text_columns, 
-    simple_extractive_summary, 
-    handle_datasets_with_hdfstore, 
-    verify_data_integrity, 
-    handle_categorical_features, 
-    convert_date_features, 
-    scale_data, 
-    inspect_data, 
-    handle_outliers_in_data,
-    handle_missing_data, 
-    augment_data, 
-    assess_outlier_impact, 
-    transform_dates, 
-    apply_bow_vectorization, 
-    apply_tfidf_vectorization, 
-    apply_word_embeddings, 
-    boxcox_transformation, 
-    check_missing_data
-    )
-from .mathex import ( 
-    interpolate1d, 
-    interpolate2d,
-    scale_y, 
-    get_bearing, 
-    moving_average, 
-    linkage_matrix, 
-    get_distance,
-    smooth1d, 
-    smoothing, 
-    quality_control, 
-    adaptive_moving_average, 
-    savgol_filter,
-    linear_regression,
-    quadratic_regression,
-    exponential_regression,
-    logarithmic_regression,
-    sinusoidal_regression,
-    cubic_regression,
-    step_regression, 
-    standard_scaler, 
-    minmax_scaler, 
-    normalize, 
-    category_count, 
-    soft_bin_stat, 
-    binning_statistic, 
-    label_importance,
-    make_mxs, 
-    compute_effort_yield, 
-    compute_sunburst_data, 
-    infer_sankey_columns, 
-    calculate_residuals, 
-    )
-from .coreutils import ( 
-    reshape, 
-    to_numeric_dtypes, 
-    smart_label_classifier, 
-    remove_outliers,
-    normalizer, 
-    cleaner, 
-    save_job, 
-    random_selector, 
-    interpolate_grid, 
-    pair_data, 
-    random_sampling, 
-    replace_data, 
-    store_or_write_hdf5,
-    projection_validator,
-    extract_coordinates, 
-    find_features_in, 
-    features_in, 
-    split_train_test_by_id, 
-    split_train_test, 
-    parallelize_jobs,
-    denormalize, 
-    resample_data, 
-    )
+from .._lazyload import attach
 
-from .mlutils import ( 
-    evaluate_model,
-    select_features, 
-    get_global_score,  
-    get_correlated_features, 
-    codify_variables, 
-    categorize_target, 
-    resampling, 
-    bin_counting, 
-    labels_validator, 
-    rename_labels_in , 
-    soft_imputer, 
-    soft_scaler, 
-    select_feature_importances, 
-    make_pipe, 
-    build_data_preprocessor, 
-    load_model, 
-    bi_selector, 
-    get_target, 
-    extract_target,  
-    stats_from_prediction, 
-    fetch_tgz,  
-    fetch_model, 
-    load_csv, 
-    discretize_categories, 
-    stratify_categories, 
-    serialize_data, 
-    deserialize_data, 
-    soft_data_split, 
-    laplace_smoothing, 
-    laplace_smoothing_categorical, 
-    laplace_smoothing_word, 
-    handle_imbalance, 
-    smart_split, 
-    save_dataframes
-    
-    ) 
+# public names of the subpackage, by providing module; a module is
+# imported on the first access of one of its names
+_submod_attrs = {
+    'baseutils': [
+        'audit_data',
+        'read_data',
+        'sanitize',
+        'fetch_remote_data',
+        'array2hdf5',
+        'save_or_load',
+        'request_data',
+        'fancier_downloader',
+        'speed_rowwise_process',
+        'store_or_retrieve_data',
+        'enrich_data_spectrum',
+        'format_long_column_names',
+        'summarize_text_columns',
+        'simple_extractive_summary',
+        'handle_datasets_with_hdfstore',
+        'verify_data_integrity',
+        'handle_categorical_features',
+        'convert_date_features',
+        'scale_data',
+        'inspect_data',
+        'handle_outliers_in_data',
+        'handle_missing_data',
+        'augment_data',
+        'assess_outlier_impact',
+        'transform_dates',
+        'apply_bow_vectorization',
+        'apply_tfidf_vectorization',
+        'apply_word_embeddings',
+        'boxcox_transformation',
+        'check_missing_data',
+    ],
+    'mathex': [
+        'interpolate1d',
+        'interpolate2d',
+        'scale_y',
+        'get_bearing',
+        'moving_average',
+        'linkage_matrix',
+        'get_distance',
+        'smooth1d',
+        'smoothing',
+        'quality_control',
+        'adaptive_moving_average',
+        'savgol_filter',
+        'linear_regression',
+        'quadratic_regression',
+        'exponential_regression',
+        'logarithmic_regression',
+        'sinusoidal_regression',
+        'cubic_regression',
+        'step_regression',
+        'standard_scaler',
+        'minmax_scaler',
+        'normalize',
+        'category_count',
+        'soft_bin_stat',
+        'binning_statistic',
+        'label_importance',
+        'make_mxs',
+        'compute_effort_yield',
+        'compute_sunburst_data',
+        'infer_sankey_columns',
+        'calculate_residuals',
+    ],
+    'coreutils': [
+        'reshape',
+        'to_numeric_dtypes',
+        'smart_label_classifier',
+        'remove_outliers',
+        'normalizer',
+        'cleaner',
+        'save_job',
+        'random_selector',
+        'interpolate_grid',
+        'pair_data',
+        'random_sampling',
+        'replace_data',
+        'store_or_write_hdf5',
+        'projection_validator',
+        'extract_coordinates',
+        'find_features_in',
+        'features_in',
+        'split_train_test_by_id',
+        'split_train_test',
+        'parallelize_jobs',
+        'denormalize',
+        'resample_data',
+    ],
+    'mlutils': [
+        'evaluate_model',
+        'select_features',
+        'get_global_score',
+        'get_correlated_features',
+        'codify_variables',
+        'categorize_target',
+        'resampling',
+        'bin_counting',
+        'labels_validator',
+        'rename_labels_in',
+        'soft_imputer',
+        'soft_scaler',
+        'select_feature_importances',
+        'make_pipe',
+        'build_data_preprocessor',
+        'load_model',
+        'bi_selector',
+        'get_target',
+        'extract_target',
+        'stats_from_prediction',
+        'fetch_tgz',
+        'fetch_model',
+        'load_csv',
+        'discretize_categories',
+        'stratify_categories',
+        'serialize_data',
+        'deserialize_data',
+        'soft_data_split',
+        'laplace_smoothing',
+        'laplace_smoothing_categorical',
+        'laplace_smoothing_word',
+        'handle_imbalance',
+        'smart_split',
+        'save_dataframes',
+    ],
+}
+
+__getattr__, __dir__ = attach(__name__, submod_attrs=_submod_attrs)
 __all__=[
     'audit_data', 
     'inspect_data', 
@@ -7,6 +7,7 @@ import re
 import h5py
 import copy
 import time
+import inspect
 import shutil 
 import pathlib
 import warnings 
@@ -14,7 +15,8 @@ import threading
 import subprocess
 from scipy import stats
 from six.moves import urllib 
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
+from joblib.disk import memstr_to_bytes
 import numpy as np 
 import pandas as pd 
 import matplotlib.pyplot as plt 
@@ -607,6 +609,10 @@ def read_data (
     columns: List[str]=None,
     npz_objkey: str= None, 
     verbose: bool= ..., 
+    usecols: List[str|int]=None, 
+    dtype: Any=None, 
+    chunksize: int=None, 
+    filters: Any=None, 
     **read_kws
  ) -> DataFrame: 
     """ Assert and read specific files and url allowed by the package
@@ -649,13 +655,39 @@ def read_data (
     verbose: bool, default=0 
        Outputs message for user guide. 
        
+    usecols: list of str or int, optional 
+       Columns to read. The projection is handed to the parser whenever it 
+       supports it (CSV, fixed-width, Excel, Parquet, Feather and Arrow 
+       files) so the other columns are never parsed; otherwise the columns 
+       are selected after reading. 
+       
+    dtype: type name or dict of column -> type, optional 
+       Data types pinned at parse time. Pinned columns keep their type 
+       through the sanitization, which otherwise casts to numeric any 
+       column it can. 
+       
+    chunksize: int, optional 
+       If set, return an iterator of data frames of at most `chunksize` 
+       rows instead of a single frame. Files are streamed by the parser when
+       it can (CSV, fixed-width, JSON lines, SAS, Parquet, Feather and 
+       Arrow); other formats are read whole then sliced. Sanitization is 
+       applied one chunk at a time and does not drop the full NaN columns, 
+       so that every chunk has the same columns. 
+       
+    filters: list of tuple or pyarrow.dataset.Expression, optional 
+       Row filters of Parquet, Feather and Arrow files, e.g. 
+       ``[('depth', '>', 100)]``, a list of such lists for a disjunction, or 
+       a pyarrow expression. With Parquet files, the row groups whose 
+       statistics exclude the filters are skipped without being read. 
+       
     read_kws: dict, 
        Additional keywords arguments passed to pandas readable file keywords. 
         
     Returns 
     -------
-    f: :class:`pandas.DataFrame` 
-        A dataframe with head contents by default.  
+    f: :class:`pandas.DataFrame` or iterator of :class:`pandas.DataFrame`
+        A dataframe with head contents by default, or an iterator of 
+        dataframes if `chunksize` is set.  
         
     See Also 
     ---------
@@ -665,20 +697,36 @@ def read_data (
        Load uncompressed or compressed numpy `.npy` and `.npz` formats. 
     gofast.tools.baseutils.save_or_load: 
         Save or load numpy arrays.
-       
+        
+    Examples 
+    ---------
+    >>> from gofast.tools.baseutils import read_data 
+    >>> for chunk in read_data ('boreholes.csv', chunksize=100_000, 
+    ...                         usecols=['hole_id', 'depth', 'rho'], 
+    ...                         dtype={'hole_id': 'category'}, 
+    ...                         sanitize=True): 
+    ...     process (chunk)
+    >>> deep = read_data ('boreholes.parquet', usecols=['depth', 'rho'], 
+    ...                   filters=[('depth', '>', 100)])
     """
-    def min_sanitizer ( d, /):
-        """ Apply a minimum sanitization to the data `d`."""
-        return to_numeric_dtypes(
-            d, sanitize_columns= True, 
-            drop_nan_columns= True, 
-            reset_index=reset_index, 
-            verbose = verbose , 
-            fill_pattern='_', 
-            drop_index = True
-            )
     sanitize, reset_index, verbose = ellipsis2false (
         sanitize, reset_index, verbose )
+    if chunksize is not None and int(chunksize) < 1: 
+        raise ValueError(f"chunksize must be a positive integer. Got {chunksize}")
+    
+    def min_sanitizer ( d, /, start=0, drop_nan_columns=True):
+        """ Apply a minimum sanitization to the data `d`."""
+        return _sanitize_frame(
+            d, dtype=dtype, reset_index=reset_index, start=start, 
+            drop_nan_columns=drop_nan_columns, verbose=verbose 
+            )
+    
+    def postprocess (d, /): 
+        """ Sanitize the frame or each chunk of the iterator."""
+        if chunksize is None: 
+            return min_sanitizer (d) if sanitize else d  
+        return _iter_chunks(d, min_sanitizer if sanitize else None) 
+    
     if ( isinstance ( f, str ) 
             and str(os.path.splitext(f)[1]).lower()in (
                 '.txt', '.npy', '.npz')
@@ -701,29 +749,167 @@ def read_data (
         f = pd.DataFrame(f, columns=columns )
         
     if isinstance (f, pd.DataFrame): 
-        if sanitize: 
-            f = min_sanitizer (f)
-        return  f 
+        f = _select_columns (f, usecols, dtype)
+        if chunksize is not None: 
+            f = _slice_frame (f, chunksize)
+        return postprocess (f)
     
     cpObj= Config().parsers 
     f= _check_readable_file(f)
     _, ex = os.path.splitext(f) 
-    if ex.lower() not in tuple (cpObj.keys()):
+    ex = ex.lower() 
+    if ex in _COLUMNAR_FORMATS: 
+        f = _read_columnar(f, _COLUMNAR_FORMATS[ex], usecols=usecols, 
+                           dtype=dtype, filters=filters, chunksize=chunksize, 
+                           **read_kws)
+        return postprocess (f)
+    
+    if ex not in tuple (cpObj.keys()):
         raise TypeError(f"Can only parse the {smart_format(cpObj.keys(), 'or')} files"
                         )
+    if filters is not None: 
+        warnings.warn("filters apply to Parquet, Feather and Arrow files"
+                      f" only. Ignored for {ex!r} files.")
+    # hand the projection, the types and the chunking to the parser 
+    # when it supports them.
+    parser = cpObj[ex]
+    parser_params = inspect.signature(parser).parameters 
+    pushed = {}
+    if usecols is not None and 'usecols' in parser_params: 
+        pushed['usecols'] = usecols 
+    if dtype is not None and 'dtype' in parser_params: 
+        pushed['dtype'] = dtype 
+    if chunksize is not None and 'chunksize' in parser_params and not ( 
+            ex =='.json' and not read_kws.get('lines')): 
+        pushed['chunksize'] = chunksize 
     try : 
-        f = cpObj[ex](f, **read_kws)
+        f = parser(f, **pushed, **read_kws)
     except FileNotFoundError:
         raise FileNotFoundError (
             f"No such file in directory: {os.path.basename (f)!r}")
     except BaseException as e : 
         raise FileHandlingError (
             f"Cannot parse the file : {os.path.basename (f)!r}. "+  str(e))
-    if sanitize: 
-        f = min_sanitizer (f)
         
-    return f 
+    if 'chunksize' in pushed: 
+        if 'usecols' not in pushed or 'dtype' not in pushed: 
+            f = _map_chunks(f, _select_columns, 
+                            None if 'usecols' in pushed else usecols, 
+                            None if 'dtype' in pushed else dtype ) 
+        return postprocess (f)
+    
+    f = _select_columns(f, None if 'usecols' in pushed else usecols, 
+                        None if 'dtype' in pushed else dtype)
+    if chunksize is not None: 
+        f = _slice_frame (f, chunksize)
+        
+    return postprocess (f)
+
+# Formats read through `pyarrow.dataset`. 
+_COLUMNAR_FORMATS = {'.parquet': 'parquet', '.feather': 'feather', 
+                     '.arrow': 'ipc', '.ipc': 'ipc'}
+
+@ensure_pkg("pyarrow", " Reading Parquet, Feather or Arrow files expects"
+            " 'pyarrow' to be installed.")
+def _read_columnar (
+        f, fmt, /, usecols=None, dtype=None, filters=None, chunksize=None, 
+        **kws 
+    ): 
+    """ Read a Parquet, Feather or Arrow file with the column projection 
+    and the row filters pushed down to pyarrow. Return a frame, or an 
+    iterator of frames if `chunksize` is set."""
+    import pyarrow.dataset as ds 
+    import pyarrow.parquet as pq 
     
+    dataset = ds.dataset(f, format=fmt)
+    if filters is not None and not isinstance(filters, ds.Expression): 
+        filters = pq.filters_to_expression(filters)
+    if usecols is not None: 
+        # positions are resolved against the file schema 
+        names = dataset.schema.names 
+        usecols = [names[c] if isinstance(c, (int, np.integer)) else c 
+                   for c in is_iterable(usecols, exclude_string=True, 
+                                        transform=True)]
+    if chunksize is None: 
+        table = dataset.to_table(columns=usecols, filter=filters)
+        return _select_columns(table.to_pandas(**kws), None, dtype)
+    
+    batches = dataset.to_batches(
+        columns=usecols, filter=filters, batch_size=int(chunksize))
+    return (_select_columns(batch.to_pandas(**kws), None, dtype) 
+            for batch in batches if batch.num_rows)
+
+def _select_columns (d, usecols=None, dtype=None): 
+    """ Project the frame `d` on `usecols` (names or positions) and cast 
+    it to `dtype`."""
+    if usecols is not None: 
+        usecols = is_iterable(usecols, exclude_string=True, transform=True)
+        if all(isinstance(c, (int, np.integer)) for c in usecols): 
+            d = d.iloc[:, list(usecols)]
+        else: 
+            d = d[list(usecols)]
+    if dtype is not None: 
+        d = d.astype(dtype if not isinstance(dtype, dict) else {
+            k: v for k, v in dtype.items() if k in d.columns})
+    return d 
+
+def _slice_frame (d, chunksize): 
+    """ Yield the frame `d` by slices of `chunksize` rows."""
+    for start in range(0, len(d), int(chunksize)): 
+        yield d.iloc[start: start + int(chunksize)]
+
+def _map_chunks (chunks, func, *args): 
+    """ Apply `func` to each chunk of the iterator."""
+    for chunk in chunks: 
+        yield func(chunk, *args)
+
+def _iter_chunks (chunks, sanitizer=None): 
+    """ Yield the chunks, sanitized one at a time if a sanitizer is given. 
+    The reader is closed when the iteration stops."""
+    n_rows = 0 
+    try: 
+        for chunk in chunks: 
+            if sanitizer is not None: 
+                chunk = sanitizer(chunk, start=n_rows, drop_nan_columns=False)
+            n_rows += len(chunk)
+            yield chunk 
+    finally: 
+        if hasattr(chunks, 'close'): 
+            chunks.close() 
+
+def _sanitize_frame (
+        d, /, dtype=None, reset_index=False, start=0, drop_nan_columns=True, 
+        verbose=False
+    ): 
+    """ Minimum sanitization of the frame `d`: sanitize the column names, 
+    cast to numeric what can be, drop the full NaN rows and, if 
+    `drop_nan_columns`, the full NaN columns. The columns with a pinned 
+    `dtype` keep their values and type. With `reset_index`, the index 
+    restarts at `start`."""
+    if dtype is None: 
+        pinned = [] 
+    elif isinstance(dtype, dict): 
+        pinned = [i for i, c in enumerate(d.columns) if c in dtype]
+    else: 
+        pinned = list(range(d.shape[1]))
+        
+    out = to_numeric_dtypes(
+        d, sanitize_columns= True, 
+        drop_nan_columns= False, 
+        verbose = verbose , 
+        fill_pattern='_', 
+        )
+    # no row is dropped yet, keep the index of the file rows 
+    out.index = d.index 
+    for i in pinned: 
+        out.isetitem(i, d.iloc[:, i])
+    if drop_nan_columns: 
+        out = out.dropna(axis=1, how='all')
+    out = out.dropna(axis=0, how='all')
+    if reset_index: 
+        out.index = pd.RangeIndex(start, start + len(out))
+    return out 
+
 def _check_readable_file (f): 
     """ Return file name from path objects """
     msg =(f"Expects a Path-like object or URL. Please, check your"
@@ -1599,12 +1785,20 @@ def scrape_web_data(
 def speed_rowwise_process(
     data, /, 
     func, 
-    n_jobs=-1
+    n_jobs=-1, 
+    vectorized=False, 
+    chunks_per_job=4, 
+    max_nbytes='1M'
     ):
     """
     Processes a large dataset by applying a complex function to each row. 
     
-    Function utilizes parallel processing to optimize for speed.
+    Function utilizes parallel processing to optimize for speed. The frame 
+    is split into ``n_jobs * chunks_per_job`` contiguous row blocks and each 
+    block is sent once to a worker, so the scheduling overhead is paid per 
+    block rather than per row. Numeric columns are shipped as a single 
+    array that joblib memory-maps to the workers when larger than 
+    `max_nbytes`; the workers slice their block from it without copy.
 
     Parameters
     ----------
@@ -1615,11 +1809,25 @@ def speed_rowwise_process(
     func : function
         A complex function to apply to each row of the dataset. 
         This function should take a row of the DataFrame as 
-        input and return a processed row.
+        input and return a processed row. Rows are passed as namedtuples 
+        as yielded by ``DataFrame.itertuples(index=False)``. If `vectorized` 
+        is ``True``, `func` receives a whole block as a DataFrame instead and 
+        should return a DataFrame, Series or array with one entry per row.
 
     n_jobs : int, optional
         The number of jobs to run in parallel. -1 means using 
         all processors. Default is -1.
+        
+    vectorized : bool, default=False
+        Whether `func` operates on a block of rows at once.
+        
+    chunks_per_job : int, default=4
+        Number of row blocks per job. More blocks balance the load of 
+        uneven rows at the cost of more tasks.
+        
+    max_nbytes : int or str, default='1M'
+        Threshold above which the numeric array is memory-mapped to the 
+        workers. ``None`` disables memory mapping.
 
     Returns
     -------
@@ -1630,23 +1838,102 @@ def speed_rowwise_process(
     -------
     >>> def complex_calculation(row):
     >>>     # Example of a complex row-wise calculation
-    >>>     return row * 2  # This is a simple placeholder for demonstration.
+    >>>     return [value * 2 for value in row] # simple placeholder.
     >>>
     >>> large_data = pd.DataFrame(np.random.rand(10000, 10))
     >>> processed_data = speed_rowwise_process(large_data, complex_calculation)
+    >>> # same result, applying the function to whole blocks 
+    >>> processed_data = speed_rowwise_process(
+    ...    large_data, lambda block: block * 2, vectorized=True)
 
     """
-    # Function to apply `func` to each row in parallel
-    def process_row(row):
-        return func(row)
-
-    # Using Joblib's Parallel and delayed to apply the function in parallel
-    results = Parallel(n_jobs=n_jobs)(delayed(process_row)(row) 
-                                      for row in data.itertuples(index=False))
+    if not isinstance(data, pd.DataFrame):
+        data = pd.DataFrame(data)
+    if chunks_per_job < 1:
+        raise ValueError(
+            f"chunks_per_job must be a positive integer. Got {chunks_per_job}.")
+        
+    n_workers = effective_n_jobs(n_jobs)
+    n_blocks = max(1, min(len(data), n_workers * chunks_per_job))
+    bounds = np.linspace(0, len(data), n_blocks + 1).astype(int)
+
+    # one array per numeric dtype so that the column dtypes are kept. The 
+    # columns are tracked by position, so duplicated labels are kept too, 
+    # and extension dtypes (e.g. 'Int64') travel with the other columns.
+    dtypes = list(data.dtypes)
+    numeric_dtypes = list(dict.fromkeys(
+        dtype for dtype in dtypes if isinstance(dtype, np.dtype) 
+        and np.issubdtype(dtype, np.number)))
+    numeric = [
+        (positions, data.iloc[:, positions].to_numpy())
+        for positions in (
+            [i for i, d in enumerate(dtypes) if d == dtype] 
+            for dtype in numeric_dtypes)
+        ]
+    other_positions = [i for i, d in enumerate(dtypes) 
+                       if d not in numeric_dtypes]
+    others = data.iloc[:, other_positions].set_axis(
+        other_positions, axis=1) if other_positions else None
+    
+    parallel = n_workers > 1 and n_blocks > 1 
+    if isinstance(max_nbytes, str): 
+        max_nbytes = memstr_to_bytes(max_nbytes)
+    
+    def _block_arrays(start, stop): 
+        # an array memory-mapped by joblib is shared by all the tasks and 
+        # sliced in the workers; any other array would be pickled with 
+        # each task, so only its rows are sent
+        return [
+            (positions, values, slice(start, stop)) if not parallel or (
+                max_nbytes is not None and values.nbytes > max_nbytes) 
+            else (positions, values[start:stop], slice(None))
+            for positions, values in numeric
+            ]
+    
+    tasks = (
+        delayed(_process_row_block)(
+            func, _block_arrays(start, stop), 
+            others.iloc[start:stop] if others is not None else None, 
+            data.columns, data.index[start:stop], vectorized
+            )
+        for start, stop in zip(bounds[:-1], bounds[1:])
+        )
+    if not parallel:
+        results = [f(*args, **kwargs) for f, args, kwargs in tasks]
+    else:
+        results = Parallel(n_jobs=n_jobs, max_nbytes=max_nbytes)(tasks)
 
     # Converting results back to DataFrame
-    processed_data = pd.DataFrame(results, columns=data.columns)
-    return processed_data
+    if not vectorized:
+        rows = [row for block in results for row in block]
+        return pd.DataFrame(rows, columns=data.columns, index=data.index)
+    
+    if all(isinstance(r, (pd.DataFrame, pd.Series)) for r in results):
+        return pd.concat(results)
+    processed_data = np.concatenate([np.asarray(r) for r in results])
+    columns = (data.columns if processed_data.ndim == 2 
+               and processed_data.shape[1] == data.shape[1] else None)
+    return pd.DataFrame(processed_data, columns=columns, index=data.index)
+
+def _process_row_block(func, numeric, others, columns, index, vectorized):
+    """Rebuild a row block in the worker and apply `func`. 
+    
+    `numeric` holds the column positions, the array and the rows of the 
+    block in that array of each numeric dtype; `others` the remaining 
+    columns labelled by position.
+    """
+    frames = [pd.DataFrame(values[rows], columns=positions, 
+                           index=index, copy=False) 
+              for positions, values, rows in numeric]
+    if others is not None: 
+        frames.append(others)
+    block = frames[0] if len(frames) == 1 else pd.concat(frames, axis=1)
+    # restore the column order by position, then the original labels
+    block = block.iloc[:, np.argsort(block.columns.to_numpy(), kind='stable')]
+    block.columns = columns 
+    if vectorized:
+        return func(block)
+    return [func(row) for row in block.itertuples(index=False)]
     
 def run_shell_command(command, progress_bar_duration=30, pkg=None):
     """
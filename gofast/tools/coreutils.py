@@ -2365,10 +2365,41 @@ def find_close_position (refarr, arr):
         the reference array. It should have a greater length than the
         array `arr`.  
     :return: generator of index of the closest position in  `refarr`.  
+    
+    For a finite 1D `refarr`, the positions are found at once by binary 
+    search in the sorted `refarr`. Ties are resolved as with ``np.argmin``, 
+    in favor of the first position, and the NaN or infinite items of `arr` 
+    get the same position as with ``np.argmin``. 
     """
-    for item in arr : 
-        ix = np.argmin (np.abs (refarr - item)) 
-        yield ix 
+    refarr = np.asarray (refarr )
+    arr = np.asarray (arr )
+    if ( 
+            refarr.ndim !=1 or arr.ndim !=1 or len(refarr) ==0 
+            or not np.issubdtype(refarr.dtype, np.number) 
+            or not np.issubdtype(arr.dtype, np.number) 
+            or not np.isfinite (refarr).all() 
+            ): 
+        return ( np.argmin (np.abs (refarr - item)) for item in arr )
+    
+    # a stable sort keeps the first position of the duplicated values first
+    order = np.argsort (refarr, kind ='stable')
+    sorted_ref = refarr [order ]
+    right = np.clip (np.searchsorted (sorted_ref, arr ), 0, len(refarr) -1)
+    # first occurrence of the value below the item 
+    left = np.searchsorted (
+        sorted_ref, sorted_ref[np.maximum(right -1, 0)], side ='left')
+    right = np.searchsorted (sorted_ref, sorted_ref[right], side ='left')
+    d_left = np.abs (sorted_ref[left] - arr )
+    d_right = np.abs (sorted_ref[right] - arr )
+    pick_left = (d_left < d_right) | ((d_left == d_right) & (
+        order[left] < order[right]))
+    
+    positions = np.where (pick_left, order[left], order[right])
+    # the distances to NaN or infinite items are all NaN or infinite 
+    for i in np.flatnonzero (~np.isfinite (arr)): 
+        positions[i] = np.argmin (np.abs (refarr - arr[i]))
+    
+    return iter (positions.tolist())
     
 
 def fillNaN(arr, method ='ff'): 
@@ -2549,6 +2580,12 @@ def _fit_ll(ediObjs, distance='cartes', by = 'index'):
         distance='harves'
     else: distance='cartes'
     
+    # compute distance using cartesian or harversine, for all sites at once
+    lats = np.array ([ obj.lat for obj in ediObjs], dtype =float )
+    lons = np.array ([ obj.lon for obj in ediObjs], dtype =float )
+    distances = _compute_haversine_d (
+        ref_lat, ref_lon, lats, lons ) if distance =='harves' else np.sqrt (
+            ( obj_init.lon - lons)**2 + (obj_init.lat - lats)**2)
     # create stations list.
     stations = [ 
         {"name": os.path.basename(obj.edifile), 
@@ -2556,11 +2593,7 @@ def _fit_ll(ediObjs, distance='cartes', by = 'index'):
          "latitude": obj.lat, 
          "obj": obj, 
          "dataid": obj.dataid,  
-         # compute distance using cartesian or harversine 
-         "distance": _compute_haversine_d (
-            ref_lat, ref_lon, obj.lat, obj.lon
-            ) if distance =='harves' else np.sqrt (
-                ( obj_init.lon -obj.lon)**2 + (obj_init.lat -obj.lat)**2), 
+         "distance": distances[ii], 
          # check wether there is a position number in the data.
          "index": re.search ('\d+', str(os.path.basename(obj.edifile)),
                             flags=re.IGNORECASE).group() if bool(
@@ -2595,29 +2628,14 @@ def _fit_ll(ediObjs, distance='cartes', by = 'index'):
 
 def _compute_haversine_d(lat1, lon1, lat2, lon2): 
     """ Sort coordinates using Haversine distance calculus. 
-    An isolated part of :func:`gofast.tools.funcutils._fit_by_ll"""
-    # get reference_lat and reference lon 
-    # get one obj randomnly and compute distance 
-    # obj_init = np.random.choice (ediObjs) 
-    import math 
-    # Define a function to calculate the distance 
-    # between two points in kilometers
-    # def distance(lat1, lon1, lat2, lon2):
-        # Convert degrees to radians
-    lat1 = math.radians(lat1)
-    lon1 = math.radians(lon1)
-    lat2 = math.radians(lat2)
-    lon2 = math.radians(lon2)
-
-    # Apply the haversine formula
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = math.sin(dlat / 2)**2 + math.cos(lat1) * math.cos(
-        lat2) * math.sin(dlon / 2)**2
-    c = 2 * math.asin(math.sqrt(a))
-    r = 6371 # Earth's radius in kilometers
-    
-    return c * r
+    An isolated part of :func:`gofast.tools.funcutils._fit_by_ll`. 
+    
+    The coordinates may be arrays; the distances in kilometers are then 
+    computed at once (see :func:`gofast.geo.geodesic.haversine`). 
+    """
+    from ..geo.geodesic import haversine 
+    
+    return haversine(lat1, lon1, lat2, lon2)
     
 
 def make_ids(arr, prefix =None, how ='py', skip=False): 
@@ -13,15 +13,20 @@ Features:
     - High-order Functions
     - Utility Functions
 """
+import os
 import sys 
 import time
+import hashlib
 import functools
+import contextlib
 import inspect
 import logging
 import warnings
 import subprocess
 import threading
+from collections import OrderedDict
  
+import joblib
 import numpy as np
 import pandas as pd
 
@@ -222,13 +227,24 @@ def _check_comp_arg_types(func, *args, **kwargs):
                 f"Argument {name} must be of type {expected_type.__name__},"
                 f" got {type(value).__name__}")
 
-def memoize(func=None, *, cache_limit=None, eviction_policy='LRU', thread_safe=False):
+def memoize(
+    func=None, *, 
+    cache_limit=None, 
+    eviction_policy='LRU', 
+    thread_safe=False, 
+    ttl=None, 
+    max_bytes=None, 
+    spill_dir=None
+    ):
     """
     A hybrid decorator for memoizing a function with options for cache size limit, 
-    eviction policy, and thread safety.
+    eviction policy, expiration, memory budget and thread safety.
     
     Functions caches results of function calls, optimizing performance for 
-    expensive operations when called with repeated arguments.
+    expensive operations when called with repeated arguments. Lookups, 
+    insertions and evictions are O(1). NumPy arrays, pandas DataFrames and 
+    Series as well as other unhashable arguments are keyed by a hash of 
+    their content, so feature pipelines taking arrays can be memoized.
 
     Parameters
     ----------
@@ -242,11 +258,25 @@ def memoize(func=None, *, cache_limit=None, eviction_policy='LRU', thread_safe=F
         are 'LRU' (Least Recently Used, default) and 'FIFO' (First In, First Out).
     thread_safe : bool, optional
         If True, makes the memoization thread-safe using a lock. Defaults to False.
+        The lock guards the cache only; the function itself runs outside of 
+        it so concurrent calls with different arguments are not serialized.
+    ttl : float, optional
+        Time to live of a cached result in seconds. Expired results are 
+        recomputed. If None (default), results never expire.
+    max_bytes : int, optional
+        Upper bound of the estimated memory held by the cached results. 
+        Entries are evicted following `eviction_policy` until the cache fits.
+    spill_dir : str, optional
+        Directory where evicted results are written with joblib instead of 
+        being dropped. A later miss on an evicted key reloads the result from 
+        disk. Expired results are not spilled.
 
     Returns
     -------
     callable
-        The memoized function.
+        The memoized function. It exposes ``cache_info()``, returning the 
+        hit, miss, eviction, expiration and disk hit counts with the current 
+        size of the cache, and ``cache_clear()``.
 
     Examples
     --------
@@ -260,55 +290,206 @@ def memoize(func=None, *, cache_limit=None, eviction_policy='LRU', thread_safe=F
 
     >>> print(fibonacci(10))
     55
+    >>> fibonacci.cache_info()['hits']
+    8
     """
+    if eviction_policy not in ('LRU', 'FIFO'):
+        raise ValueError(
+            "Unsupported eviction policy. Expected 'LRU' or 'FIFO'.")
+        
     def decorator(func):
-        memo = {}
-        cache_keys = []
-        lock = threading.Lock() if thread_safe else None
+        cache = _MemoCache(
+            cache_limit=cache_limit, 
+            eviction_policy=eviction_policy, 
+            ttl=ttl, 
+            max_bytes=max_bytes, 
+            spill_dir=spill_dir, 
+            lock=threading.Lock() if thread_safe else None
+            )
 
         @functools.wraps(func)
         def memoized(*args, **kwargs):
-            key = args + tuple(kwargs.items())
-            with lock:
-                if key in memo:
-                    if eviction_policy == 'LRU':
-                        # Move the key to the end to mark it as recently used
-                        cache_keys.append(cache_keys.pop(cache_keys.index(key)))
-                    return memo[key]
-                if cache_limit is not None and len(cache_keys) >= cache_limit:
-                    oldest_key = _apply_eviction_policy(
-                        eviction_policy, cache_keys)
-                    memo.pop(oldest_key, None)
-                result = func(*args, **kwargs)
-                memo[key] = result
-                cache_keys.append(key)
+            key = _make_cache_key(args, kwargs)
+            found, result = cache.get(key)
+            if found:
                 return result
+            result = func(*args, **kwargs)
+            cache.put(key, result)
+            return result
 
-        if lock is None:
-            return memoized
-        else:
-            # Use lock only if thread safety is enabled
-            def wrapper(*args, **kwargs):
-                with lock:
-                    return memoized(*args, **kwargs)
-            return wrapper
+        memoized.cache_info = cache.info
+        memoized.cache_clear = cache.clear
+        return memoized
 
     if func is None:
         return decorator
     else:
         return decorator(func)
 
-def _apply_eviction_policy(eviction_policy, cache_keys):
-    """ Added support for customizable eviction policies (LRU and FIFO). 
-    The helper function  manages which cache entry to evict based on the
-    selected policy."""
-    if eviction_policy == 'LRU':
-        return cache_keys.pop(0)  # Remove the least recently used item
-    elif eviction_policy == 'FIFO':
-        return cache_keys.pop(0)  # Remove the first inserted item
-    else:
-        raise ValueError(
-            "Unsupported eviction policy. Expected 'LRU' or 'FIFO'.")
+class _MemoCache:
+    """
+    OrderedDict cache backend of :func:`memoize`.
+
+    The order of the dict is the eviction order: LRU moves an entry to the 
+    end on each hit, FIFO keeps the insertion order. Each entry stores the 
+    result with its insertion time and estimated size.
+    """
+    def __init__(
+        self, 
+        cache_limit=None, 
+        eviction_policy='LRU', 
+        ttl=None, 
+        max_bytes=None, 
+        spill_dir=None, 
+        lock=None
+        ):
+        self.cache_limit = cache_limit
+        self.eviction_policy = eviction_policy
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self._lock = lock if lock is not None else contextlib.nullcontext()
+        self._data = OrderedDict()
+        self._nbytes = 0
+        self._stats = dict(hits=0, misses=0, evictions=0, expirations=0, 
+                           disk_hits=0)
+
+    def get(self, key):
+        """Return ``(True, result)`` on a hit and ``(False, None)`` otherwise."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                result, stamp, _ = entry
+                if self.ttl is not None and time.monotonic() - stamp > self.ttl:
+                    self._remove(key)
+                    self._stats['expirations'] += 1
+                else:
+                    if self.eviction_policy == 'LRU':
+                        self._data.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return True, result
+            
+        if self.spill_dir is not None:
+            found, result = self._load(key)
+            if found:
+                with self._lock:
+                    self._stats['hits'] += 1
+                    self._stats['disk_hits'] += 1
+                self.put(key, result)
+                return True, result
+            
+        with self._lock:
+            self._stats['misses'] += 1
+        return False, None
+
+    def put(self, key, result):
+        """Store `result` under `key` and evict entries over the limits."""
+        nbytes = _estimate_nbytes(result)
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (result, time.monotonic(), nbytes)
+            self._nbytes += nbytes
+            evicted = []
+            while self._data and (
+                (self.cache_limit is not None 
+                 and len(self._data) > self.cache_limit)
+                or (self.max_bytes is not None 
+                    and self._nbytes > self.max_bytes)
+                ):
+                old_key, (old_result, stamp, _) = next(iter(self._data.items()))
+                self._remove(old_key)
+                self._stats['evictions'] += 1
+                if self.ttl is None or time.monotonic() - stamp <= self.ttl:
+                    evicted.append((old_key, old_result))
+                    
+        if self.spill_dir is not None:
+            for old_key, old_result in evicted:
+                self._dump(old_key, old_result)
+
+    def _remove(self, key):
+        _, _, nbytes = self._data.pop(key)
+        self._nbytes -= nbytes
+
+    def _spill_path(self, key):
+        return os.path.join(
+            self.spill_dir, 
+            hashlib.sha1(repr(key).encode()).hexdigest() + '.joblib'
+            )
+
+    def _dump(self, key, result):
+        os.makedirs(self.spill_dir, exist_ok=True)
+        joblib.dump(result, self._spill_path(key))
+
+    def _load(self, key):
+        path = self._spill_path(key)
+        if not os.path.isfile(path):
+            return False, None
+        try:
+            result = joblib.load(path)
+        except Exception:
+            return False, None
+        os.remove(path)
+        return True, result
+
+    def info(self):
+        """Return the cache statistics."""
+        with self._lock:
+            return dict(self._stats, currsize=len(self._data), 
+                        nbytes=self._nbytes, maxsize=self.cache_limit)
+
+    def clear(self):
+        """Drop every cached result and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            for name in self._stats:
+                self._stats[name] = 0
+
+def _make_cache_key(args, kwargs):
+    """Build a hashable key from call arguments, hashing the content of 
+    arrays, frames and other unhashable objects."""
+    return (tuple(_hashable_arg(arg) for arg in args), 
+            tuple((name, _hashable_arg(value)) 
+                  for name, value in sorted(kwargs.items())))
+
+def _hashable_arg(arg):
+    """Return `arg` if hashable, a content digest otherwise."""
+    if isinstance(arg, np.ndarray):
+        if arg.dtype.hasobject:
+            digest = joblib.hash(arg)
+        else:
+            digest = hashlib.blake2b(
+                np.ascontiguousarray(arg).view(np.uint8), 
+                digest_size=16).hexdigest()
+        return ('ndarray', arg.shape, arg.dtype.str, digest)
+    if isinstance(arg, (pd.DataFrame, pd.Series)):
+        try:
+            values = pd.util.hash_pandas_object(arg, index=True).values
+        except TypeError:
+            return (type(arg).__name__, joblib.hash(arg))
+        columns = (tuple(map(str, arg.columns)) + tuple(map(str, arg.dtypes)) 
+                   if isinstance(arg, pd.DataFrame) else (arg.name, str(arg.dtype)))
+        return (type(arg).__name__, arg.shape, columns, 
+                hashlib.blake2b(values, digest_size=16).hexdigest())
+    try:
+        hash(arg)
+    except TypeError:
+        return (type(arg).__name__, joblib.hash(arg))
+    return arg
+
+def _estimate_nbytes(obj):
+    """Rough memory footprint of a cached result."""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(np.sum(obj.memory_usage(deep=True)))
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(_estimate_nbytes(o) for o in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            _estimate_nbytes(k) + _estimate_nbytes(v) for k, v in obj.items())
+    return sys.getsizeof(obj)
 
 def merge_dicts(
     *dicts: Dict[Any, Any], deep_merge: bool = False,
@@ -1257,6 +1438,7 @@ def make_data_dynamic(
     reset_index: bool = False, 
     dynamize: bool=True, 
     force_df: bool=False, 
+    fast_path: bool=True, 
 ) -> Callable:
     """
     A decorator for preprocessing data before passing it to a function, 
@@ -1299,8 +1481,14 @@ def make_data_dynamic(
        representation. This option allows for flexibility in handling the 
        output format, catering to different preferences or requirements 
        for subsequent data processing steps. Default is False.
-
-       
+    fast_path: bool, default=True 
+       If True, ndarrays and DataFrames whose dtypes are all boolean, 
+       integer or float skip the generic conversion (frame copy, blank 
+       string replacement and per-column casting). Their values are cast 
+       to float64 only when needed, so float64 inputs are passed as views. 
+       Columns and rows made of NaN only are still dropped. The result is 
+       the same as the generic conversion. Whether a column schema 
+       qualifies is cached.
 
     Examples
     --------
@@ -1325,9 +1513,15 @@ def make_data_dynamic(
             if not args:
                 raise ValueError("Function requires at least one argument.")
             
-            data = _check_and_convert_input(args[0])
+            data = _fast_numeric_frame(args[0]) if fast_path else None
+            dtype_filter = expected_type 
+            if data is None: 
+                data = _check_and_convert_input(args[0])
+            elif expected_type == 'numeric': 
+                # already numeric, selecting the numeric dtypes is a no-op
+                dtype_filter = 'both'
             data = _preprocess_data(
-                data, capture_columns, expected_type, drop_na, na_thresh,
+                data, capture_columns, dtype_filter, drop_na, na_thresh,
                 na_meth, reset_index, **kwargs)
             # Infer dataframe to series for single columns.
             data= to_pandas(data, convert_single_column= force_df)
@@ -1378,6 +1572,49 @@ def _check_and_convert_input(input_data):
         raise ValueError("First argument must be a pd.DataFrame, dict,"
                          " np.ndarray, or an iterable object.")
         
+def _fast_numeric_frame(input_data):
+    """
+    Wrap already-numeric input into a float64 DataFrame without the generic 
+    conversion of :func:`_check_and_convert_input`.
+
+    Mirrors its result: values are cast to float64 (a view when they 
+    already are) and the columns then rows made of NaN only are dropped. 
+    Returns ``None`` when the input does not qualify.
+    """
+    if isinstance(input_data, np.ndarray):
+        if input_data.ndim not in (1, 2):
+            return None
+        is_numeric, has_float = _numeric_schema((input_data.dtype,))
+        index = columns = None 
+    elif isinstance(input_data, pd.DataFrame) and input_data.shape[1]:
+        is_numeric, has_float = _numeric_schema(tuple(input_data.dtypes))
+        index, columns = input_data.index, input_data.columns
+    else:
+        return None
+    if not is_numeric:
+        return None
+
+    values = np.asarray(input_data).astype(np.float64, copy=False)
+    data = pd.DataFrame(values, index=index, columns=columns, copy=False)
+    if has_float:
+        nan_mask = np.isnan(values.reshape(len(values), -1))
+        if nan_mask.any():
+            keep_columns = ~nan_mask.all(axis=0)
+            keep_rows = ~nan_mask[:, keep_columns].all(axis=1)
+            data = data.loc[keep_rows, keep_columns]
+    return data
+
+@functools.lru_cache(maxsize=256)
+def _numeric_schema(dtypes):
+    """
+    Tell whether all the dtypes of a column schema are plain NumPy boolean, 
+    integer or float dtypes, and whether any of them can hold NaN.
+    """
+    is_numeric = all(isinstance(dtype, np.dtype) and dtype.kind in 'biuf' 
+                     for dtype in dtypes)
+    return is_numeric, is_numeric and any(
+        dtype.kind == 'f' for dtype in dtypes)
+
 def _add_dynamic_method(func):
     """
     Dynamically adds a given function as a method to pandas DataFrame and
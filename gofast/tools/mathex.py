@@ -8,6 +8,7 @@ from __future__ import annotations
 import copy 
 import inspect 
 import warnings 
+import functools 
 
 import numpy as np
 import pandas as pd 
@@ -3715,16 +3716,20 @@ def _kind_of_model(degree, x, y) :
     w= init_weights(x=x, y=y)
     return x, w  # Return the matrix x and the weights vector w 
     
-def adaptive_moving_average(data, /, window_size_factor=0.1):
+def adaptive_moving_average(data, /, window_size_factor=0.1, axis=0):
     """ Adaptative moving average as  smoothing technique. 
  
     Parameters 
     -----------
     data: Arraylike 
-       Noise data for smoothing 
+       Noise data for smoothing. Every trace of a N-dimensional array 
+       along `axis` is smoothed at once. 
        
     window_size_factor: float, default=0.1 
       Parameter to control the adaptiveness of the moving average.
+      
+    axis: int, default=0 
+      Axis along which the moving average is computed. 
        
     Return 
     --------
@@ -3755,15 +3760,23 @@ def adaptive_moving_average(data, /, window_size_factor=0.1):
     >>> plt.grid(True)
     >>> plt.show()
     """
-    result = np.zeros_like(data)
-    window_size = int(window_size_factor * len(data))
-    
-    for i in range(len(data)):
-        start = max(0, i - window_size)
-        end = min(len(data), i + window_size + 1)
-        result[i] = np.mean(data[start:end])
-    
-    return result
+    data = np.asarray(data)
+    if data.ndim ==0 or data.shape[axis] ==0: 
+        return data.astype (np.result_type(data.dtype, float))
+    x = np.moveaxis(data, axis, -1)
+    n = x.shape[-1]
+    window_size = int(window_size_factor * n)
+    # mean over [i - w, i + w] from the differences of the cumulative sum 
+    csum = np.zeros(x.shape[:-1] + (n + 1,), dtype=np.result_type(
+        x.dtype, float))
+    np.cumsum(x, axis=-1, out=csum[..., 1:])
+    index = np.arange(n)
+    start = np.maximum(index - window_size, 0)
+    end = np.minimum(index + window_size + 1, n)
+    result = np.subtract(csum[..., end], csum[..., start])
+    result /= end - start 
+    
+    return np.moveaxis(result, -1, axis)
 
 def torres_verdin_filter(
     arr, /,  
@@ -3781,6 +3794,8 @@ def torres_verdin_filter(
     arr: Arraylike 1d 
       List or array-like of data points.  If two-dimensional array 
       is passed, `axis` must be specified to apply the filter onto. 
+      All the traces of a N-dimensional array along `axis` (e.g. the 
+      soundings of a grid) are filtered at once. 
        
     weight_factor: float, default=.1
       Base smoothing factor for window size which gets adjusted by a factor 
@@ -3798,10 +3813,17 @@ def torres_verdin_filter(
       
     axis: int, default=0 
       Axis along which to apply the AMA filter.
+      
     Return 
     -------
     ama: Adaptive moving average
     
+    Notes 
+    ------
+    The recursion ``ama[i] = (1 - w[i]) * ama[i-1] + w[i] * arr[i]`` is 
+    solved by a kernel compiled with numba when it is installed, and by 
+    a vectorized cumulative formulation otherwise. 
+    
     References 
     ------------
     .. [1] Torres-Verdin and Bostick, 1992,  Principles of spatial surface 
@@ -3831,43 +3853,130 @@ def torres_verdin_filter(
     arr = is_iterable( arr, exclude_string =True, transform =True ) 
     axis, logify= ellipsis2false(axis, logify, default_value =( None , False))
     
-    def _filtering_1d_array( ar, wf, b ): 
-        if len(ar) < 2:
-            return ar
-        ama = [ar[0]]  # Initialize the adaptive moving average array
-        for i in range(1, len(ar)):
-            change = abs(ar[i] - ar[i-1])
-            w = wf * (1 + beta * change)
-            w = min(w, 1)  # Ensure weight stays between 0 and 1
-            ama_value = w * ar[i] + (1 - w) * ama[-1]
-            ama.append(ama_value)
-            
-        return np.array(ama)
-    
     arr =np.array (arr )
     #+++++++++++++++++++
     if logify:
         arr = np.log10 ( arr )
-    if arr.ndim >=2: 
-        if axis is None:
-            warnings.warn (f"Array dimension is {arr.ndim}. Axis must be"
-                           " specified. Otherwise axis=0 is used .")
-            axis =0
-        if axis ==0: 
-            arr = arr._T 
-        for ii in range( len(arr )) : 
-            arr [ii] = _filtering_1d_array (
-                arr [ii ], wf = weight_factor, b = beta ) 
-        # then transpose again 
-        if axis ==0: 
-            arr = arr._T 
-    else: 
-        arr = _filtering_1d_array ( arr, wf = weight_factor, b=beta  )
-        
+    if arr.ndim >=2 and axis is None: 
+        warnings.warn (f"Array dimension is {arr.ndim}. Axis must be"
+                       " specified. Otherwise axis=0 is used .")
+        axis =0
+    elif arr.ndim < 2: 
+        axis = -1 
+    if arr.ndim ==0 or arr.shape[axis] < 2:
+        return np.power (10, arr ) if logify else arr 
+    
+    # the traces along `axis` are the rows of a 2D array 
+    x = np.moveaxis(arr, axis, -1)
+    shape = x.shape 
+    x = np.ascontiguousarray(x.reshape(-1, shape[-1]), dtype=float)
+    # ama[i] = (1 - w[i]) * ama[i-1] + w[i] * x[i] with ama[0] = x[0] and 
+    # a weight increasing with the rate of change, at most 1
+    w = np.empty_like(x)
+    np.subtract(x[:, 1:], x[:, :-1], out=w[:, 1:])
+    np.abs(w, out=w)
+    w *= beta 
+    w += 1 
+    w *= weight_factor 
+    np.minimum(w, 1, out=w)
+    w[:, 0] = 1 
+    ama = _first_order_recurrence(1 - w, w * x, out=x)
+    
+    arr = np.moveaxis(ama.reshape(shape), -1, axis)
     if logify: arr = np.power (10, arr )
     
     return arr 
 
+# Block length of the cumulative formulation of the recurrences: the
+# factors are bounded below by _RECURRENCE_MIN_FACTOR so that their
+# products over a block stay above 1e-278.
+_RECURRENCE_BLOCK = 16
+_RECURRENCE_MIN_FACTOR = np.exp(-640 / _RECURRENCE_BLOCK)
+
+def _first_order_recurrence(a, b, out=None):
+    """
+    Solve ``y[:, i] = a[:, i] * y[:, i-1] + b[:, i]`` with ``y[:, 0] = b[:, 0]``
+    for every row of the 2D arrays `a` and `b` at once.
+    
+    The compiled kernel is used when numba is installed. Otherwise, the 
+    rows are split in blocks of ``_RECURRENCE_BLOCK`` samples solved 
+    together with cumulative products and sums; the values carried from 
+    one block to the next follow the same recurrence, solved recursively 
+    over the blocks. 
+    
+    Parameters 
+    -----------
+    a, b: ndarray of shape (n_traces, n_samples) 
+       Factors and terms of the recurrence. `a` must be non-negative. 
+    out: ndarray of shape (n_traces, n_samples), optional 
+       Preallocated output, which may be `a` or `b`. 
+       
+    Returns 
+    --------
+    out: ndarray of shape (n_traces, n_samples) 
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if out is None: 
+        out = np.empty(b.shape, dtype=float)
+    kernel = _recurrence_kernel()
+    if kernel is not None: 
+        kernel(np.ascontiguousarray(a), np.ascontiguousarray(b), out)
+        return out 
+    
+    m, n = b.shape 
+    size = _RECURRENCE_BLOCK 
+    n_blocks = -(-n // size)
+    # pad to whole blocks, the padding is after the samples so it does 
+    # not change them
+    log_a = np.zeros((m, n_blocks * size))
+    terms = np.zeros((m, n_blocks * size))
+    np.log(np.maximum(a, _RECURRENCE_MIN_FACTOR), out=log_a[:, :n])
+    terms[:, :n] = b 
+    log_a = log_a.reshape(m * n_blocks, size)
+    terms = terms.reshape(m * n_blocks, size)
+    
+    # zero-carry solution of each block:
+    # y[i] = P[i] * sum_{k <= i} b[k] / P[k], with P the cumulative product
+    np.cumsum(log_a, axis=1, out=log_a)
+    prod = np.exp(log_a, out=log_a)
+    terms /= prod 
+    np.cumsum(terms, axis=1, out=terms)
+    terms *= prod 
+    if n_blocks > 1: 
+        # the last value of a block is carried to the next one with the 
+        # block product as factor
+        ends = _first_order_recurrence(
+            prod[:, -1].reshape(m, n_blocks),
+            terms[:, -1].reshape(m, n_blocks))
+        carry = np.zeros((m, n_blocks))
+        carry[:, 1:] = ends[:, :-1]
+        prod *= carry.reshape(-1, 1)
+        terms += prod 
+    out[...] = terms.reshape(m, n_blocks * size)[:, :n]
+    
+    return out 
+
+@functools.lru_cache(maxsize=1)
+def _recurrence_kernel():
+    """Compile the loop of :func:`_first_order_recurrence` with numba, if 
+    installed."""
+    try: 
+        import numba 
+    except ImportError: 
+        return None 
+    
+    @numba.njit(cache=True, nogil=True)
+    def kernel(a, b, out): # pragma: no cover
+        for t in range(b.shape[0]):
+            y = b[t, 0]
+            out[t, 0] = y 
+            for i in range(1, b.shape[1]):
+                y = a[t, i] * y + b[t, i]
+                out[t, i] = y 
+                
+    return kernel 
+
 def binning_statistic(
     data, categorical_column, 
     value_column, 
@@ -45,6 +45,7 @@ from gofast.tools.baseutils  import apply_bow_vectorization
 from gofast.tools.baseutils  import apply_word_embeddings  
 from gofast.tools.baseutils  import boxcox_transformation  
 from gofast.tools.baseutils  import check_missing_data  
+from gofast.tools.baseutils  import speed_rowwise_process  
 
 
 DOWNLOAD_FILE='https://raw.githubusercontent.com/WEgeophysics/gofast/main/gofast/datasets/data/iris.csv'
@@ -132,6 +133,23 @@ class TestReadData(unittest.TestCase):
         self.assertFalse(df.empty)
         mock_read_csv.assert_called_once_with(file)
 
+    def test_read_data_streaming(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, 'logs.csv')
+            pd.DataFrame({'hole id': ['A', 'A', None, 'B', 'B'],
+                          'depth': [1, 2, None, 3, 4],
+                          'code': ['001', '002', None, '003', '004']}
+                         ).to_csv(file, index=False)
+            chunks = list(read_data(file, chunksize=2, usecols=['hole id', 'code'],
+                                    dtype={'code': str}, sanitize=True, 
+                                    reset_index=True))
+        self.assertEqual([len(c) for c in chunks], [2, 1, 1])
+        frame = pd.concat(chunks)
+        self.assertEqual(list(frame.columns), ['hole_id', 'code'])
+        # pinned column not cast to numeric, index contiguous over chunks
+        self.assertEqual(frame['code'].dropna().tolist(), ['001', '002', '003', '004'])
+        self.assertEqual(frame.index.tolist(), list(range(4)))
+
 # Note: This test assumes h5py is installed and a temporary file can be written and read
 class TestArray2HDF5(unittest.TestCase):
     def test_array2hdf5_store_and_load(self):
@@ -474,6 +492,32 @@ def test_check_missing_data():
     assert missing_stats.loc['A', 'Count'] == 1
     assert missing_stats.loc['B', 'Count'] == 1
 
+def test_speed_rowwise_process():
+    df = pd.DataFrame({'x': [1., 2., 3., 4.], 'name': list('abcd'), 
+                       'n': [1, 2, 3, 4]}, index=[10, 11, 12, 13])
+    out = speed_rowwise_process(
+        df, lambda row: (row.x * 2, row.name.upper(), row.n), n_jobs=2)
+    assert out['x'].tolist() == [2., 4., 6., 8.]
+    assert out['name'].tolist() == list('ABCD')
+    assert out['n'].dtype == df['n'].dtype and out.index.equals(df.index)
+    
+    numeric = pd.DataFrame(np.random.rand(50, 3))
+    out = speed_rowwise_process(numeric, lambda block: block * 2, 
+                                vectorized=True, n_jobs=2)
+    np.testing.assert_allclose(out.values, numeric.values * 2)
+
+    # duplicated labels and extension dtypes, memory-mapped or sliced blocks
+    df = pd.DataFrame({'x': np.arange(40.), 'i': pd.array(range(40), 'Int64'),
+                       'c': list('ab') * 20, 'n': np.arange(40)})
+    df.columns = ['x', 'x', 'c', 'n']
+    for max_nbytes in ('1M', 1):
+        out = speed_rowwise_process(df, lambda block: block, vectorized=True,
+                                    n_jobs=2, max_nbytes=max_nbytes)
+        pd.testing.assert_frame_equal(out, df)
+    out = speed_rowwise_process(df, lambda row: row, n_jobs=2)
+    assert out.columns.equals(df.columns)
+    assert out.iloc[:, 1].tolist() == list(range(40))
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -46,6 +46,33 @@ def test_memoize():
     
     assert fibonacci(10) == 55
 
+def test_memoize_cache_engine(tmp_path):
+    calls = []
+    @memoize(cache_limit=2, thread_safe=True, spill_dir=str(tmp_path))
+    def n_rows(data, scale=1):
+        calls.append(1)
+        return len(data) * scale
+    
+    arr = np.arange(10.)
+    df = pd.DataFrame({'x': [1, 2], 'y': ['a', 'b']})
+    # arrays and frames are keyed by content 
+    assert n_rows(arr) == n_rows(arr.copy()) == 10
+    assert n_rows(df) == n_rows(df.copy()) == 2
+    assert len(calls) == 2
+    n_rows(arr, scale=2) # evicts the array entry to disk
+    assert n_rows(arr) == 10 
+    info = n_rows.cache_info()
+    assert len(calls) == 3 and info['disk_hits'] == 1 
+    assert info['currsize'] == 2 and info['evictions'] >= 1 
+    
+    @memoize(ttl=0.01)
+    def identity(x):
+        calls.append(1)
+        return x
+    calls.clear()
+    identity(1); time.sleep(0.05); identity(1)
+    assert len(calls) == 2 and identity.cache_info()['expirations'] == 1
+
 def test_preserve_input_type_custom_convert():
     def custom_convert(result, original_type, original_columns):
         if original_type is pd.DataFrame:
@@ -150,6 +177,24 @@ def test_make_data_dynamic_reset_index():
     result = process_reset_index(df)
     assert result.index.equals(pd.RangeIndex(start=0, stop=3, step=1)), "Index was not reset"
 
+def test_make_data_dynamic_fast_path():
+    def identity(data):
+        return data
+    fast = make_data_dynamic(dynamize=False)(identity)
+    slow = make_data_dynamic(dynamize=False, fast_path=False)(identity)
+    
+    arr = np.random.rand(6, 3)
+    arr[1] = np.nan 
+    arr[:, 2] = np.nan
+    for data in (arr, np.arange(6), pd.DataFrame(
+            {'A': [1, 2, 3], 'B': [1.5, np.nan, 2.]}, index=['x', 'y', 'z'])):
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(fast(data)), pd.DataFrame(slow(data)), 
+            check_column_type=False, check_index_type=False)
+    # float64 input is passed as a view 
+    arr = np.random.rand(5, 2)
+    assert np.shares_memory(fast(arr).values, arr)
+
 def test_make_data_dynamic_with_custom_logic():
     mock_preprocess = Mock(return_value=pd.DataFrame({'A': [1, 2, 3]}))
     df = pd.DataFrame({'A': [1, 2, 3], 'B': ['x', 'y', 'z']})
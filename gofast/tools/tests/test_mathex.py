@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+mathex tests
+============
+"""
+import pytest
+import numpy as np
+from unittest.mock import patch
+from gofast.tools import mathex
+from gofast.tools.mathex import torres_verdin_filter, adaptive_moving_average
+from gofast.tools.mathex import _first_order_recurrence
+
+def _torres_verdin_loop(ar, wf=.1, beta=1.):
+    ama = [ar[0]]
+    for i in range(1, len(ar)):
+        w = min(wf * (1 + beta * abs(ar[i] - ar[i-1])), 1)
+        ama.append(w * ar[i] + (1 - w) * ama[-1])
+    return np.array(ama)
+
+def _recurrence_loop(a, b):
+    y = np.empty_like(b)
+    for t in range(b.shape[0]):
+        y[t, 0] = b[t, 0]
+        for i in range(1, b.shape[1]):
+            y[t, i] = a[t, i] * y[t, i-1] + b[t, i]
+    return y
+
+@pytest.mark.parametrize("n_samples", [2, 16, 17, 300, 5000])
+def test_first_order_recurrence(n_samples):
+    rng = np.random.default_rng(0)
+    a = rng.random((3, n_samples))
+    # factors cancelling or keeping the carried value
+    a[:, ::7] = 0
+    a[:, 3::11] = 1
+    b = rng.normal(size=(3, n_samples))
+    expected = _recurrence_loop(a, b)
+    out = np.empty_like(b)
+    with patch.object(mathex, "_recurrence_kernel", return_value=None):
+        result = _first_order_recurrence(a, b, out=out)
+    assert result is out
+    np.testing.assert_allclose(result, expected, rtol=1e-10, atol=1e-12)
+
+def test_torres_verdin_filter():
+    rng = np.random.default_rng(1)
+    x = rng.normal(size=500) * 3
+    np.testing.assert_allclose(
+        torres_verdin_filter(x), _torres_verdin_loop(x), rtol=1e-10)
+    np.testing.assert_allclose(
+        torres_verdin_filter(x, weight_factor=.6, beta=5.),
+        _torres_verdin_loop(x, .6, 5.), rtol=1e-10)
+
+    # every trace of a grid is filtered along the axis at once
+    grid = rng.random((4, 5, 60)) * 100
+    filtered = torres_verdin_filter(grid, axis=1, logify=True)
+    assert filtered.shape == grid.shape
+    np.testing.assert_allclose(
+        filtered[2, :, 7],
+        10 ** _torres_verdin_loop(np.log10(grid[2, :, 7])), rtol=1e-10)
+    np.testing.assert_allclose(
+        torres_verdin_filter(grid[0], axis=0),
+        torres_verdin_filter(grid[0].T, axis=1).T)
+
+def test_adaptive_moving_average():
+    data = np.arange(1, 12)
+    np.testing.assert_allclose(
+        adaptive_moving_average(data, 0.2),
+        [2, 2.5, 3, 4, 5, 6, 7, 8, 9, 9.5, 10])
+    grid = np.random.default_rng(2).normal(size=(30, 40))
+    smoothed = adaptive_moving_average(grid, axis=1)
+    np.testing.assert_allclose(
+        smoothed[4], adaptive_moving_average(grid[4]))
+    np.testing.assert_allclose(
+        adaptive_moving_average(grid.T, axis=0), smoothed.T)
+
+if __name__=='__main__':
+    pytest.main ([__file__])
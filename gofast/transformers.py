@@ -10,13 +10,15 @@ from __future__ import division, annotations
 import os
 # import inspect
 import itertools 
+from collections import deque
 import warnings 
 import numpy as np 
 import pandas as pd 
 from scipy import sparse
 import matplotlib.pyplot as plt  
 # from pandas.api.types import is_integer_dtype
-from sklearn.base import BaseEstimator,TransformerMixin 
+from joblib import Parallel, delayed, hash as joblib_hash
+from sklearn.base import BaseEstimator,TransformerMixin, clone, is_classifier
 from sklearn.cluster import KMeans 
 from sklearn.decomposition import PCA
 from sklearn.preprocessing import StandardScaler,MinMaxScaler, OrdinalEncoder
@@ -28,6 +30,7 @@ from sklearn.impute import SimpleImputer
 from sklearn.metrics import recall_score, precision_score
 from sklearn.metrics import accuracy_score,  roc_auc_score
 from sklearn.model_selection import train_test_split, StratifiedShuffleSplit
+from sklearn.model_selection import check_cv
 try : 
     from skimage.transform import resize
     from skimage.color import rgb2gray
@@ -43,6 +46,7 @@ from ._typing import _F
 from .exceptions import EstimatorError, NotFittedError 
 from .tools.coreutils import  parse_attrs, assert_ratio, validate_feature
 from .tools.coreutils import  ellipsis2false, to_numeric_dtypes, is_iterable
+from .tools.coreutils import  smart_format
 from .tools.mlutils import discretize_categories, stratify_categories 
 from .tools._dependency import import_optional_dependency 
 from .tools.validator import  get_estimator_name, check_X_y, is_frame
@@ -85,6 +89,7 @@ __all__= ['SequentialBackwardSelection',
           'TimeSeriesFeatureExtractor',
           'CategoryFrequencyEncoder', 
           'DateTimeCyclicalEncoder', 
+          'TimeSeriesFeatureGenerator', 
           'LagFeatureGenerator', 
           'DifferencingTransformer', 
           'MovingAverageTransformer', 
@@ -151,6 +156,18 @@ class SequentialBackwardSelection(BaseEstimator, TransformerMixin):
     random_state : int, RandomState instance, or None, default=None
         Controls the shuffling applied to the data before the split.
         An integer value ensures reproducible results across multiple function calls.
+    cv : int, cross-validation generator or iterable, optional
+        If given, each subset is scored by its mean score over the folds of
+        `cv` (see :func:`sklearn.model_selection.check_cv`) instead of on a 
+        single hold-out split of `test_size`.
+    n_jobs : int, optional
+        Number of jobs used to fit the candidate subsets of a step (and their
+        folds) in parallel. ``-1`` uses all processors.
+    prune_margin : float, optional
+        With `cv`, the candidates of a step are scored fold by fold and a 
+        candidate is dropped as soon as its mean score so far is below the 
+        best one by more than `prune_margin`, saving its remaining folds. 
+        ``None`` scores every candidate on every fold.
     
     References
     ----------
@@ -192,6 +209,12 @@ class SequentialBackwardSelection(BaseEstimator, TransformerMixin):
         an idea of how well the model can perform after the feature selection 
         process.
 
+    subset_scores_ : dict
+        Score of every subset fully evaluated, keyed by the tuple of its 
+        feature indices. Refitting on the same data, estimator, scoring and 
+        splits (e.g. with a smaller `k_features`) reuses these scores 
+        instead of refitting the subsets.
+
     Examples
     --------
     >>> from sklearn.neighbors import KNeighborsClassifier
@@ -218,13 +241,19 @@ class SequentialBackwardSelection(BaseEstimator, TransformerMixin):
         k_features=1, 
         scoring='accuracy', 
         test_size=0.25, 
-        random_state=42
+        random_state=42, 
+        cv=None, 
+        n_jobs=None, 
+        prune_margin=None, 
         ):
         self.estimator = estimator
         self.k_features = k_features
         self.scoring = scoring
         self.test_size = test_size
         self.random_state = random_state
+        self.cv = cv 
+        self.n_jobs = n_jobs 
+        self.prune_margin = prune_margin 
 
     def fit(self, X, y):
         """
@@ -261,22 +290,36 @@ class SequentialBackwardSelection(BaseEstimator, TransformerMixin):
         if hasattr(X, 'columns'):
             self.feature_names_in_ = list(X.columns)
             X = X.values
-        
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=self.test_size, random_state=self.random_state)
-
-        self.indices_ = tuple(range(X_train.shape[1]))
+        y = np.asarray(y)
+        
+        if self.cv is None: 
+            # single hold-out split, as the index of a one-fold cv
+            splits = [tuple(train_test_split(
+                np.arange(len(X)), test_size=self.test_size, 
+                random_state=self.random_state))]
+        else: 
+            cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+            splits = list(cv.split(X, y))
+        
+        # scores are reused across fits only when nothing else changed
+        cache_key = joblib_hash((X, y, splits, clone(self.estimator), 
+                                 self.scorer_name_))
+        if getattr(self, '_cache_key', None) != cache_key: 
+            self.subset_scores_ = {}
+            self._cache_key = cache_key 
+        parallel = Parallel(n_jobs=self.n_jobs)
+
+        self.indices_ = tuple(range(X.shape[1]))
         self.subsets_ = [self.indices_]
-        self.scores_ = [self._compute_score(X_train, X_test, y_train, y_test, self.indices_)]
+        self.scores_ = list(self._score_subsets(
+            parallel, X, y, splits, [self.indices_]))
 
         while len(self.indices_) > self.k_features:
-            scores, subsets = [], []
-            for subset in itertools.combinations(self.indices_, r=len(self.indices_)-1):
-                score = self._compute_score(X_train, X_test, y_train, y_test, subset)
-                scores.append(score)
-                subsets.append(subset)
-
-            best_score_index = np.argmax(scores)
+            subsets = list(itertools.combinations(
+                self.indices_, r=len(self.indices_)-1))
+            scores = self._score_subsets(parallel, X, y, splits, subsets)
+            # pruned candidates are NaN
+            best_score_index = int(np.nanargmax(scores))
             self.indices_ = subsets[best_score_index]
             self.subsets_.append(self.indices_)
             self.scores_.append(scores[best_score_index])
@@ -306,36 +349,67 @@ class SequentialBackwardSelection(BaseEstimator, TransformerMixin):
                                  " fitted yet. Fit estimator by calling the "
                                  "'fit' method with appropriate  arguments.")
         
-        return X[:, self.indices_]
+        if hasattr(X, 'iloc'):
+            return X.iloc[:, list(self.indices_)]
+        return np.asarray(X)[:, self.indices_]
 
-    def _compute_score(self, X_train, X_test, y_train, y_test, indices):
+    def _score_subsets(self, parallel, X, y, splits, subsets):
         """
-        Compute the score of a subset of features.
+        Compute the scores of candidate feature subsets.
 
-        Internally used to evaluate the performance of the model on a given
-        subset of features.
+        The (subset, fold) fits missing from :attr:`subset_scores_` are 
+        dispatched to the joblib pool together. With `prune_margin`, the 
+        folds are run one at a time and the candidates falling behind the 
+        best one are not fitted on the next folds.
 
         Parameters
         ----------
-        X_train : array-like of shape (n_samples, n_features)
-            The training input samples.
-        X_test : array-like of shape (n_samples, n_features)
-            The testing input samples.
-        y_train : array-like of shape (n_samples,)
-            The training target values.
-        y_test : array-like of shape (n_samples,)
-            The testing target values.
-        indices : array-like of shape (n_features,)
-            The indices of the features to be used.
+        parallel : joblib.Parallel
+            The pool running the fits.
+        X : ndarray of shape (n_samples, n_features)
+            The input samples.
+        y : ndarray of shape (n_samples,)
+            The target values.
+        splits : list of tuple
+            The (train, test) indices of each fold.
+        subsets : list of tuple
+            The feature indices of each candidate.
 
         Returns
         -------
-        score : float
-            The score of the estimator on the provided feature subset.
-        """
-        self.estimator.fit(X_train[:, indices], y_train)
-        y_pred = self.estimator.predict(X_test[:, indices])
-        return self._scorers[self.scoring](y_test, y_pred)
+        scores : list of float
+            The score of each subset, NaN for the pruned ones.
+        """
+        cache = self.subset_scores_
+        alive = [subset for subset in subsets if subset not in cache]
+        if self.prune_margin is None or len(splits) == 1:
+            rounds = [splits]
+        else: 
+            rounds = [[split] for split in splits]
+            
+        totals = dict.fromkeys(alive, 0.)
+        for n_done, folds in enumerate(rounds, start=1):
+            if not alive: 
+                break 
+            fold_scores = parallel(
+                delayed(_fit_and_score_subset)(
+                    self.estimator, X, y, train, test, subset, self.scorer_)
+                for subset in alive for train, test in folds
+                )
+            fold_scores = np.asarray(fold_scores, dtype=float).reshape(
+                len(alive), len(folds))
+            for subset, scores in zip(alive, fold_scores):
+                totals[subset] += scores.sum()
+            if len(rounds) > 1 and n_done < len(rounds):
+                means = {subset: totals[subset] / n_done for subset in alive}
+                best = max(list(means.values()) + [
+                    cache[subset] for subset in subsets if subset in cache])
+                alive = [subset for subset in alive 
+                         if means[subset] >= best - self.prune_margin]
+                
+        for subset in alive: 
+            cache[subset] = totals[subset] / len(splits)
+        return [cache.get(subset, np.nan) for subset in subsets]
 
     def _validate_params(self, X):
         """
@@ -363,14 +437,16 @@ class SequentialBackwardSelection(BaseEstimator, TransformerMixin):
         if self.k_features > X.shape[1]:
             raise ValueError(f"k_features must be <= number of features in X ({X.shape[1]}).")
 
-        if callable(self.scoring) or hasattr(self.scoring, '__call__'):
-            self.scoring = self.scoring.__name__.replace('_score', '')
+        scoring = self.scoring 
+        if callable(scoring) or hasattr(scoring, '__call__'):
+            scoring = scoring.__name__.replace('_score', '')
         
-        if self.scoring not in self._scorers:
+        if scoring not in self._scorers:
             valid_scorers = ", ".join(self._scorers.keys())
             raise ValueError(f"Invalid scoring method. Valid options are: {valid_scorers}")
 
-        self.scoring = self._scorers[self.scoring]
+        self.scorer_name_ = scoring 
+        self.scorer_ = self._scorers[scoring]
 
     def __repr__(self):
         """
@@ -390,6 +466,13 @@ class SequentialBackwardSelection(BaseEstimator, TransformerMixin):
         params_str = ", ".join(f"{key}={value!r}" for key, value in params.items())
         return f"{class_name}({params_str})"
 
+def _fit_and_score_subset(estimator, X, y, train, test, subset, scorer):
+    """Fit a clone of `estimator` on the `subset` columns of the training 
+    fold and score its predictions on the test fold."""
+    subset = list(subset)
+    estimator = clone(estimator).fit(X[np.ix_(train, subset)], y[train])
+    return scorer(y[test], estimator.predict(X[np.ix_(test, subset)]))
+
 class KMeansFeaturizer(BaseEstimator, TransformerMixin):
     """Transforms numeric data into k-means cluster memberships.
      
@@ -659,23 +742,28 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
         >>> featurizer.fit(X)
         >>> X_transformed = featurizer.transform(X)
         """
+        return self._transform(X, to_sparse=self.to_sparse)
+    
+    def _transform(self, X, to_sparse=False): 
+        """Append the cluster IDs, as a CSR matrix when `to_sparse`."""
         # Check if the model is fitted
         check_is_fitted(self, 'km_model_')
         
         # Validate input
         X = check_array(X, accept_sparse=True)
-        # Convert X to a sparse matrix if it's not already
-        if not sparse.issparse(X) and self.to_sparse:
-            X = sparse.csr_matrix(X)
         # Predict the closest cluster for each sample
         clusters = self.km_model_.predict(X)
-        if self.to_sparse: 
+        if to_sparse or sparse.issparse(X): 
+            # a sparse input is never densified
             clusters_sparse = sparse.csr_matrix(clusters.reshape(-1, 1))
             # Concatenate the original data with the cluster labels
-            X_transformed = sparse.hstack((X, clusters_sparse))
-        else:
-            X_transformed= np.hstack((X, clusters [:, np.newaxis] ))
-
+            return sparse.hstack((X, clusters_sparse), format='csr')
+        
+        # fill a single output array rather than stacking copies
+        X_transformed = np.empty((X.shape[0], X.shape[1] + 1), 
+                                 dtype=np.result_type(X.dtype, clusters.dtype))
+        X_transformed[:, :-1] = X 
+        X_transformed[:, -1] = clusters 
         return X_transformed
     
         def __repr__(self):
@@ -1779,7 +1867,9 @@ class FrameUnion(BaseEstimator, TransformerMixin):
 
     encode : bool, default=True
         If True, encodes categorical features using either OrdinalEncoder or
-        OneHotEncoder, depending on `encode_mode`.
+        OneHotEncoder, depending on `encode_mode`. If False, the raw 
+        categorical features cannot be stacked with the numerical ones and 
+        are left out of the output.
 
     param_search : bool, default='auto'
         If True, automatically determines numerical and categorical features
@@ -1794,6 +1884,16 @@ class FrameUnion(BaseEstimator, TransformerMixin):
     encode_mode : str, default='OrdinalEncoder'
         The mode of data encoding. It can be 'OrdinalEncoder' or 'OneHotEncoder'.
 
+    sparse_output : bool or 'auto', default='auto'
+        Whether the output is a CSR matrix. ``'auto'`` returns a sparse 
+        matrix when the categorical block is sparse (one-hot encoding), so 
+        the one-hot columns are never densified. 
+
+    chunk_size : int, optional
+        Number of rows transformed at once. The output is assembled chunk 
+        by chunk, so only one chunk of the intermediate blocks is held in 
+        memory. See also :meth:`iter_transform`.
+
     Attributes:
     -----------
     num_attributes_ : list
@@ -1805,9 +1905,8 @@ class FrameUnion(BaseEstimator, TransformerMixin):
     attributes_ : list
         List of all attributes found in the data (numerical + categorical).
 
-    X_ : array-like of shape (n_samples, n_features)
-        The transformed array with combined numerical and encoded 
-        categorical features.
+    n_features_out_ : int
+        Number of output columns.
 
     Examples:
     ---------
@@ -1829,7 +1928,9 @@ class FrameUnion(BaseEstimator, TransformerMixin):
         param_search ='auto', 
         strategy ='median', 
         scale_mode ='StandardScaler', 
-        encode_mode ='OrdinalEncoder'
+        encode_mode ='OrdinalEncoder', 
+        sparse_output='auto', 
+        chunk_size=None, 
         ): 
         self._logging = gofastlog().get_gofast_logger(self.__class__.__name__)
         
@@ -1842,18 +1943,16 @@ class FrameUnion(BaseEstimator, TransformerMixin):
         self.encode = encode 
         self.scale_mode = scale_mode
         self.encode_mode = encode_mode
-        
-        self.X_=None 
-        self.X_num_= None 
-        self.X_cat_ =None
-        self.num_attributes_=None
-        self.cat_attributes_=None 
-        self.attributes_=None 
+        self.sparse_output = sparse_output 
+        self.chunk_size = chunk_size 
         
     def fit(self, X, y=None):
         """
         Fit the `FrameUnion` transformer to the input data `X`.
 
+        The numerical and categorical columns are selected, then the 
+        imputer, the scaler and the encoder are fitted on them.
+
         Parameters:
         -----------
         X : {array-like, sparse matrix} of shape (n_samples, n_features)
@@ -1868,6 +1967,48 @@ class FrameUnion(BaseEstimator, TransformerMixin):
         self : object
             Returns self.
         """
+        scale_mode, encode_mode = self.scale_mode.lower(), self.encode_mode.lower()
+        numObj = DataFrameSelector(columns= self.num_attributes, 
+                                   select_type='num')
+        catObj =DataFrameSelector(columns= self.cat_attributes, 
+                                  select_type='cat')
+        # the training blocks are not kept on the fitted object 
+        X_num = numObj.fit_transform(X)
+        X_cat = catObj.fit_transform(X)
+        self.num_attributes_ = list(numObj.columns)
+        self.cat_attributes_ = list(catObj.columns)
+        self.attributes_ = self.num_attributes_ + self.cat_attributes_ 
+        
+        steps = []
+        if self.imput_data and self.num_attributes_: 
+            steps.append(SimpleImputer(missing_values=np.nan, 
+                                       strategy=self.strategy))
+        if self.scale and self.num_attributes_:
+            steps.append(MinMaxScaler() if scale_mode.find('min') >= 0 
+                         else StandardScaler())
+        for step in steps: 
+            X_num = step.fit_transform(X_num)
+        self.num_steps_ = steps 
+        
+        self.encoder_ = None 
+        if self.encode and self.cat_attributes_: 
+            if encode_mode.find('hot') >= 0: 
+                self.encoder_ = OneHotEncoder(sparse_output=True, 
+                                              handle_unknown='ignore')
+            else: 
+                self.encoder_ = OrdinalEncoder()
+            self.encoder_.fit(X_cat)
+            
+        if self.encoder_ is None: 
+            n_cat = 0 
+        elif isinstance(self.encoder_, OneHotEncoder): 
+            n_cat = sum(len(c) for c in self.encoder_.categories_) 
+        else: 
+            n_cat = len(self.cat_attributes_)
+        self.n_features_out_ = len(self.num_attributes_) + n_cat 
+        self.sparse_output_ = (isinstance(self.encoder_, OneHotEncoder) 
+                               if self.sparse_output == 'auto' 
+                               else bool(self.sparse_output))
         return self
     
     def transform(self, X): 
@@ -1885,78 +2026,64 @@ class FrameUnion(BaseEstimator, TransformerMixin):
         --------
         X : {array-like, sparse matrix} of shape (n_samples, n_features)
             Transformed array, where `n_samples` is the number of samples,
-            and `n_features` is the number of features.
+            and `n_features` is the number of features. A CSR matrix when 
+            `sparse_output_` is True.
+        """
+        chunks = self.iter_transform(X, chunk_size=self.chunk_size)
+        if self.sparse_output_:
+            return sparse.vstack(list(chunks), format='csr')
+        Xt = np.empty((len(X), self.n_features_out_))
+        start = 0 
+        for chunk in chunks: 
+            Xt[start: start + chunk.shape[0]] = chunk 
+            start += chunk.shape[0]
+        return Xt 
+    
+    def iter_transform(self, X, chunk_size=None):
         """
-        
-        if self.scale_mode.lower().find('stand')>=0: 
-            self.scale_mode = 'StandardScaler'
-        elif self.scale_mode.lower().find('min')>=0: 
-            self.scale_mode = 'MinMaxScaler'
-        if self.encode_mode.lower().find('ordinal')>=0: 
-            self.encode_mode = 'OrdinalEncoder'
-            
-        elif self.encode_mode.lower().find('hot') >=0: 
-            self.encode_mode = 'OneHotEncoder'
-            
-        numObj = DataFrameSelector(attribute_names= self.num_attributes, 
-                                         select_type='num')
-        catObj =DataFrameSelector(attribute_names= self.cat_attributes, 
-                                         select_type='cat')
-        num_arrayObj = numObj.fit_transform(X)
-        cat_arrayObj = catObj.fit_transform(X)
-        self.num_attributes_ = numObj.attribute_names 
-        self.cat_attributes_ = catObj.attribute_names 
-        
-        self.attributes_ = self.num_attributes_ + self.cat_attributes_ 
-        
-        self.X_num_= num_arrayObj.copy()
-        self.X_cat_ =cat_arrayObj.copy()
-        self.X_ = np.c_[self.X_num_, self.X_cat_]
-        
-        if self.imput_data : 
-            from sklearn.impute import SimpleImputer
-            imputer_obj = SimpleImputer(missing_values=np.nan, 
-                                        strategy=self.strategy)
-            num_arrayObj =imputer_obj.fit_transform(num_arrayObj)
-            
-        if self.scale :
-            if self.scale_mode == 'StandardScaler': 
-                scaler = StandardScaler()
-            if self.scale_mode =='MinMaxScaler':
-                scaler = MinMaxScaler()
-        
-            num_arrayObj = scaler.fit_transform(num_arrayObj)
-            
-        if self.encode : 
-            if self.encode_mode =='OrdinalEncoder': 
-                encoder = OrdinalEncoder()
-            elif self.encode_mode =='OneHotEncoder':
-                encoder = OneHotEncoder(sparse_output=True)
-            cat_arrayObj= encoder.fit_transform(cat_arrayObj )
-            # sparse matrix of type class <'numpy.float64'>' stored 
-            # element in compressed sparses raw format . To convert the sense 
-            # matrix to numpy array , we need to just call 'to_array()'.
-            warnings.warn(f'Sparse matrix `{cat_arrayObj.shape!r}` is converted'
-                          ' in dense Numpy array.', UserWarning)
-            # cat_arrayObj= cat_arrayObj.toarray()
-        try: 
-            X= np.c_[num_arrayObj,cat_arrayObj]
-            
-        except ValueError: 
-            # For consistency use the np.concatenate rather than np.c_
-            X= np.concatenate((num_arrayObj,cat_arrayObj), axis =1)
-        
-        if self.encode_mode =='OneHotEncoder':
-            warnings.warn('Use `OneHotEncoder` to encode categorial features'
-                          ' generates a Sparse matrix. X is henceforth '
-                          ' composed of sparse matrix. The new dimension is'
-                          ' {0} rather than {1}.'.format(X.shape,
-                             self.X_.shape), UserWarning)
-            self._logging.info('X become a spared matrix. The new shape is'
-                               '{X.shape!r} against the orignal '
-                               '{self.X_shape!r}')
-            
-        return X
+        Transform `X` by chunks of rows.
+
+        Each chunk is imputed, scaled and encoded, then its numerical and 
+        categorical blocks are joined, so downstream estimators supporting 
+        ``partial_fit`` can consume tables whose encoded form does not fit 
+        in memory.
+
+        Parameters:
+        -----------
+        X : DataFrame of shape (n_samples, n_features)
+            The data to transform.
+
+        chunk_size : int, optional
+            Number of rows per chunk. Defaults to `chunk_size`, or the whole
+            frame.
+
+        Yields:
+        -------
+        Xt : {ndarray, csr_matrix} of shape (n_chunk_samples, n_features_out_)
+            The transformed rows.
+        """
+        check_is_fitted(self, 'n_features_out_')
+        chunk_size = int(chunk_size or self.chunk_size or max(len(X), 1))
+        for start in range(0, len(X), chunk_size):
+            rows = X.iloc[start: start + chunk_size]
+            X_num = rows[self.num_attributes_].to_numpy()
+            for step in self.num_steps_: 
+                X_num = step.transform(X_num)
+            if self.encoder_ is not None: 
+                X_cat = self.encoder_.transform(
+                    rows[self.cat_attributes_].to_numpy())
+            else: 
+                # the raw categories are dropped when they are not encoded 
+                X_cat = np.empty((len(rows), 0))
+            if self.sparse_output_: 
+                yield sparse.hstack((sparse.csr_matrix(X_num), 
+                                     sparse.csr_matrix(X_cat)), format='csr')
+                continue 
+            out = np.empty((len(rows), self.n_features_out_))
+            n_num = X_num.shape[1]
+            out[:, :n_num] = X_num 
+            out[:, n_num:] = X_cat.toarray() if sparse.issparse(X_cat) else X_cat
+            yield out 
         
 class FeaturizeX(BaseEstimator, TransformerMixin ): 
     """
@@ -2124,7 +2251,7 @@ class FeaturizeX(BaseEstimator, TransformerMixin ):
             ) =  _featurize_X(
                 X, 
                 y =y, 
-                n_cluster = self.n_clusters, 
+                n_clusters = self.n_clusters, 
                 target_scale=self.target_scale, 
                 random_state= self.random_state,
                 n_components = self.n_components, 
@@ -2284,7 +2411,7 @@ def _featurize_X (
         if callable ( model ): 
             model = model (n_clusters=n_clusters, 
             target_scale=target_scale, 
-            random_state = random_state)
+            random_state = random_state).fit(X, y)
     else: 
         model = KMeansFeaturizer(
             n_clusters=n_clusters, 
@@ -2292,22 +2419,17 @@ def _featurize_X (
             random_state = random_state, 
             ).fit(X,y)
         
-        ### Use the k-means featurizer to generate cluster features
-        # transf_cluster = model.transform(X)
-        # Xkmf= np.concatenate (
-        #    (X, transf_cluster), axis =1 )
-        Xkmf = model.transform(X)
-        ### Form new input features with cluster features
-        # training_with_cluster
-
+    # the featurizer builds the sparse output itself, so the dense 
+    # matrix with the cluster column is never materialized 
+    Xkmf = model._transform(X, to_sparse=to_sparse)
     if to_sparse: 
         Xkmf= sparse_func(Xkmf )
 
     kmf_data.append(Xkmf)
     kmf_data.append(y) 
     if split_X_y: 
-        test_with_cluster= model.transform(test_data)
-        if sparse: 
+        test_with_cluster= model._transform(test_data, to_sparse=to_sparse)
+        if to_sparse: 
             test_with_cluster= sparse_func(test_with_cluster)
  
         kmf_data.insert(1,test_with_cluster )
@@ -3799,6 +3921,387 @@ class DateTimeCyclicalEncoder(BaseEstimator, TransformerMixin):
         return X_transformed
 
 
+class TimeSeriesFeatureGenerator(BaseEstimator, TransformerMixin):
+    """
+    Build lag, difference, rolling-window and cumulative-sum features of 
+    time series in a single pass.
+
+    All the requested features are written into one preallocated block 
+    instead of being appended to the frame column by column, and each 
+    series (one per value of `group_col`) is kept apart from the others. 
+    The transformer is stateless for :meth:`transform`; 
+    :meth:`partial_transform` keeps the tail of each series between calls 
+    so that a stream of chunks is featurized exactly as the concatenated 
+    series would be.
+
+    Parameters
+    ----------
+    lags : int or list of int, optional
+        Lag periods. ``lags=3`` stands for the lags 1, 2 and 3.
+
+    diffs : int or list of int, optional
+        Periods of the differences ``x[t] - x[t - p]``.
+
+    windows : int or list of int, optional
+        Sizes of the trailing rolling windows.
+
+    window_stats : str or list of str, default='mean'
+        Statistics computed over each window, among ``'mean'``, ``'sum'``,
+        ``'std'``, ``'min'`` and ``'max'``.
+
+    cumsum : bool, default=False
+        Whether to add the cumulative sum of each series.
+
+    columns : str or list of str, optional
+        Columns to featurize. Defaults to the numeric columns other than 
+        `group_col`.
+
+    group_col : str, optional
+        Column holding the series identifier. Rows of a series need not be
+        contiguous but must be in time order.
+
+    min_periods : int, optional
+        Minimum number of non-missing values in a window. Defaults to the 
+        window size, as :meth:`pandas.DataFrame.rolling`.
+
+    keep_original : bool, default=True
+        Whether the input columns are returned along with the features.
+
+    dtype : {'float64', 'float32'}, default='float64'
+        Data type of the feature block. Computations are done in float64.
+
+    Attributes
+    ----------
+    feature_names_out_ : list of str
+        Names of the generated features, e.g. ``'value_lag_1'``, 
+        ``'value_diff_1'``, ``'value_roll3_mean'`` or ``'value_cumsum'``.
+
+    state_ : dict
+        Tail of each series kept by :meth:`partial_transform`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> from gofast.transformers import TimeSeriesFeatureGenerator
+    >>> X = pd.DataFrame({'sensor': np.repeat(['a', 'b'], 50),
+    ...                   'value': np.random.randn(100)})
+    >>> gen = TimeSeriesFeatureGenerator(lags=2, windows=[3, 7],
+    ...                                  window_stats=['mean', 'max'],
+    ...                                  group_col='sensor')
+    >>> gen.fit_transform(X).shape
+    (100, 8)
+    >>> chunks = [gen.partial_transform(X.iloc[i:i + 10])
+    ...           for i in range(0, 100, 10)]
+    >>> np.allclose(pd.concat(chunks).iloc[:, 2:], gen.transform(X).iloc[:, 2:],
+    ...             equal_nan=True)
+    True
+    """
+    _window_stats = ('mean', 'sum', 'std', 'min', 'max')
+
+    def __init__(
+        self, 
+        lags=None, 
+        diffs=None, 
+        windows=None, 
+        window_stats='mean', 
+        cumsum=False, 
+        columns=None, 
+        group_col=None, 
+        min_periods=None, 
+        keep_original=True, 
+        dtype='float64', 
+        ):
+        self.lags=lags 
+        self.diffs=diffs 
+        self.windows=windows 
+        self.window_stats=window_stats 
+        self.cumsum=cumsum 
+        self.columns=columns 
+        self.group_col=group_col 
+        self.min_periods=min_periods
+        self.keep_original=keep_original 
+        self.dtype=dtype 
+        
+    def fit(self, X, y=None):
+        """
+        Validate the parameters and reset the streaming state.
+
+        Parameters
+        ----------
+        X : DataFrame, shape (n_samples, n_features)
+            Training data. Only its columns are inspected.
+        
+        y : array-like, shape (n_samples,)
+            Target values. Not used in this transformer.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+        """
+        X = _ts_frame(X, 'tsfg')
+        self.lags_ = _periods(self.lags, 'lags', expand=True)
+        self.diffs_ = _periods(self.diffs, 'diffs')
+        self.windows_ = _periods(self.windows, 'windows')
+        stats = ([self.window_stats] if isinstance(self.window_stats, str) 
+                 else list(self.window_stats or []))
+        unknown = set(stats) - set(self._window_stats)
+        if unknown:
+            raise ValueError(f"Unknown window statistic(s) {sorted(unknown)}."
+                             f" Expect {smart_format(self._window_stats, 'or')}.")
+        self.window_stats_ = stats
+        if np.dtype(self.dtype) not in (np.float32, np.float64):
+            raise ValueError(f"dtype expects 'float32' or 'float64'; got"
+                             f" {self.dtype!r}.")
+        
+        if self.columns is None:
+            self.columns_ = [c for c in X.select_dtypes(np.number).columns 
+                             if c != self.group_col]
+        else:
+            self.columns_ = ([self.columns] if isinstance(self.columns, str) 
+                             else list(self.columns))
+            validate_feature(X, self.columns_)
+        if self.group_col is not None: 
+            validate_feature(X, [self.group_col])
+            
+        names = []
+        for col in self.columns_: 
+            names += [f"{col}_lag_{k}" for k in self.lags_]
+            names += [f"{col}_diff_{p}" for p in self.diffs_]
+            names += [f"{col}_roll{w}_{s}" for w in self.windows_ 
+                      for s in self.window_stats_]
+            if self.cumsum: 
+                names.append(f"{col}_cumsum")
+        self.feature_names_out_ = names 
+        # rows of history a new row may look back to
+        self.n_tail_ = max(self.lags_ + self.diffs_ 
+                           + [w - 1 for w in self.windows_] + [0])
+        self.state_ = {}
+        return self
+    
+    def transform(self, X, y=None):
+        """
+        Generate the features of complete series.
+
+        Parameters
+        ----------
+        X : DataFrame, shape (n_samples, n_features)
+            Input data, in time order within each series.
+        
+        y : array-like, shape (n_samples,)
+            Target values. Not used in this transformer.
+
+        Returns
+        -------
+        X_features : DataFrame
+            The input columns (if `keep_original`) followed by the features,
+            with the index of `X`.
+        """
+        check_is_fitted(self, 'feature_names_out_')
+        return self._generate(_ts_frame(X, 'tsfg'), state=None)
+    
+    def partial_transform(self, X, y=None):
+        """
+        Generate the features of the next chunk of a stream of series.
+
+        The values needed from the previous chunks (the last rows and the 
+        running sum of each series) are taken from and written back to 
+        :attr:`state_`, so chunk boundaries leave no gaps in the features. 
+        The transformer is fitted on the first chunk if needed; call 
+        :meth:`fit` to start a new stream.
+
+        Parameters
+        ----------
+        X : DataFrame, shape (n_samples, n_features)
+            The next rows of the stream.
+        
+        y : array-like, shape (n_samples,)
+            Target values. Not used in this transformer.
+
+        Returns
+        -------
+        X_features : DataFrame
+            The features of the rows of `X`.
+        """
+        X = _ts_frame(X, 'tsfg')
+        if not hasattr(self, 'state_'):
+            self.fit(X)
+        return self._generate(X, state=self.state_)
+    
+    def get_feature_names_out(self, input_features=None):
+        """Names of the generated features."""
+        check_is_fitted(self, 'feature_names_out_')
+        return np.asarray(self.feature_names_out_, dtype=object)
+    
+    def _generate(self, X, state):
+        """Compute the feature block of `X`, updating `state` if given."""
+        n_samples, n_cols = len(X), len(self.columns_)
+        values = X[self.columns_].to_numpy(dtype=np.float64)
+        if self.group_col is None: 
+            codes = np.zeros(n_samples, dtype=np.intp)
+            keys = [None]
+        else: 
+            codes, keys = pd.factorize(X[self.group_col], use_na_sentinel=False)
+        n_groups, P = len(keys), self.n_tail_ 
+        
+        # lay each series out after P rows of history (its tail in `state`
+        # or NaN), so that looking back never crosses into another series.
+        counts = np.bincount(codes, minlength=n_groups)
+        seg_starts = np.concatenate(([0], np.cumsum(counts + P)[:-1]))
+        # column-major, as pandas stores the blocks of a frame
+        ext = np.full((n_samples + n_groups * P, n_cols), np.nan, order='F')
+        if n_groups == 1: 
+            ext[P:] = values 
+            def take(array, shift):
+                # rows at `pos - shift`, as a slice for a single series
+                return array[P - shift: P - shift + n_samples]
+        else: 
+            order = np.argsort(codes, kind='stable')
+            rank = np.empty(n_samples, dtype=np.intp)
+            rank[order] = np.arange(n_samples) - np.repeat(
+                np.cumsum(counts) - counts, counts)
+            pos = seg_starts[codes] + P + rank 
+            ext[pos] = values 
+            def take(array, shift):
+                return array[pos - shift]
+        carry = np.zeros((n_groups, n_cols))
+        if state is not None:
+            for g, key in enumerate(keys):
+                if key in state:
+                    tail, carry[g] = state[key]
+                    ext[seg_starts[g]: seg_starts[g] + P] = tail 
+
+        block = np.empty((len(self.feature_names_out_), n_samples), 
+                         dtype=self.dtype)
+        per_col = len(self.feature_names_out_) // max(n_cols, 1)
+        features = []
+        for k in self.lags_: 
+            features.append(take(ext, k))
+        for p in self.diffs_:
+            features.append(values - take(ext, p))
+        if self.windows_: 
+            features.extend(self._rolling(ext, take))
+        if self.cumsum: 
+            features.append(self._cumsum(ext, take, seg_starts, codes, carry,
+                                         values))
+        for j, feature in enumerate(features): 
+            # features are laid out column by column
+            block[j::per_col] = feature.T
+            
+        if state is not None:
+            np.add.at(carry, codes, np.nan_to_num(values))
+            for g, key in enumerate(keys):
+                stop = seg_starts[g] + P + counts[g]
+                state[key] = (ext[stop - P: stop].copy(), carry[g])
+                
+        out = pd.DataFrame(block.T, columns=self.feature_names_out_, 
+                           index=X.index)
+        if self.keep_original:
+            out = pd.concat([X, out], axis=1)
+        return out 
+    
+    def _rolling(self, ext, take):
+        """Trailing window statistics from running sums of the history."""
+        valid = ~np.isnan(ext)
+        # center the values to limit cancellation in the running sums
+        n_valid = valid.sum(axis=0)
+        center = np.where(valid, ext, 0.).sum(axis=0) / np.maximum(n_valid, 1)
+        filled = np.where(valid, ext - center, 0.)
+        zero = np.zeros((1, ext.shape[1]))
+        csum = np.concatenate((zero, np.cumsum(filled, axis=0)))
+        csq = np.concatenate((zero, np.cumsum(filled ** 2, axis=0)))
+        ccount = np.concatenate((zero, np.cumsum(valid, axis=0)))
+        
+        features = []
+        for w in self.windows_: 
+            # the running sums start with a zero row: the window of the 
+            # row at `pos` spans [pos + 1 - w, pos + 1) of them 
+            count = take(ccount, -1) - take(ccount, w - 1)
+            total = take(csum, -1) - take(csum, w - 1)
+            min_periods = w if self.min_periods is None else min(
+                self.min_periods, w)
+            undefined = count < max(min_periods, 1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                for stat in self.window_stats_:
+                    if stat == 'sum':
+                        result = total + count * center 
+                    elif stat == 'mean':
+                        result = total / count + center 
+                    elif stat == 'std':
+                        var = (take(csq, -1) - take(csq, w - 1) 
+                               - total ** 2 / count) / (count - 1)
+                        result = np.sqrt(np.clip(var, 0, None))
+                        result[count < 2] = np.nan 
+                    else: 
+                        result = take(_rolling_extreme(
+                            ext, w, np.fmin if stat == 'min' else np.fmax), 0)
+                    result[undefined] = np.nan 
+                    features.append(result)
+        return features 
+    
+    def _cumsum(self, ext, take, seg_starts, codes, carry, values):
+        """Running sum of each series, skipping missing values."""
+        csum = np.concatenate((np.zeros((1, ext.shape[1])), 
+                               np.cumsum(np.nan_to_num(ext), axis=0)))
+        # restart at each series and add the sum of the previous chunks
+        base = csum[seg_starts + self.n_tail_] - carry 
+        result = take(csum, -1) - base[codes]
+        result[np.isnan(values)] = np.nan 
+        return result 
+
+def _rolling_extreme(values, window, ufunc):
+    """Trailing rolling minimum or maximum (`ufunc` is ``np.fmin`` or 
+    ``np.fmax``, which skip NaN) over the rows of `values`.
+
+    The extremes over windows of doubling spans are combined, so the cost 
+    is O(n log(window)) whole-array operations instead of one pass per 
+    window offset. Rows with fewer than `window` predecessors get the 
+    extreme of the available ones.
+    """
+    result, span = values, 1
+    while 2 * span <= window:
+        doubled = result.copy()
+        ufunc(result[span:], result[:-span], out=doubled[span:])
+        result, span = doubled, 2 * span
+    if span < window:
+        # two overlapping windows of `span` rows cover `window` rows
+        shift = window - span
+        combined = result.copy()
+        ufunc(result[shift:], result[:-shift], out=combined[shift:])
+        result = combined
+    return result
+
+def _periods(periods, name, expand=False):
+    """Sorted positive periods from an int or a list of ints."""
+    if periods is None:
+        return []
+    if isinstance(periods, (int, np.integer)): 
+        periods = list(range(1, periods + 1)) if expand else [periods]
+    periods = [int(p) for p in periods]
+    if any(p < 1 for p in periods):
+        raise ValueError(f"{name} expects positive integers; got {periods}.")
+    return periods
+
+def _ts_features(X, input_name, **params):
+    """Features of :class:`TimeSeriesFeatureGenerator` computed for a
+    single setting, named after the input columns."""
+    X = _ts_frame(X, input_name)
+    engine = TimeSeriesFeatureGenerator(keep_original=False, **params).fit(X)
+    X_transformed = engine.transform(X)
+    X_transformed.columns = engine.columns_
+    return X_transformed
+
+def _ts_frame(X, input_name):
+    """Return `X` as a frame, leaving frames untouched."""
+    if isinstance(X, pd.DataFrame): 
+        return X 
+    if isinstance(X, pd.Series):
+        return X.to_frame()
+    return build_data_if(X, to_frame=True, force=True, raise_warning='mute',
+                         input_name=input_name)
+
+
 class LagFeatureGenerator(BaseEstimator, TransformerMixin):
     """
     Generate lag features for time series data to help capture 
@@ -3849,7 +4352,7 @@ class LagFeatureGenerator(BaseEstimator, TransformerMixin):
             features.
 
         """
-        self.lags = lags if isinstance(lags, list) else [lags]
+        self.lags = lags
         
     def fit(self, X, y=None):
         """
@@ -3889,11 +4392,13 @@ class LagFeatureGenerator(BaseEstimator, TransformerMixin):
             DataFrame with lag features added to capture temporal dependencies.
 
         """
-        X = build_data_if (X, to_frame =True, raise_warning='silence', 
-                           force=True, input_name='lf' )
-        X_transformed = X.copy()
-        for lag in self.lags:
-            X_transformed[f'lag_{lag}'] = X_transformed.shift(lag)
+        X = _ts_frame(X, 'lf')
+        engine = TimeSeriesFeatureGenerator(lags=self.lags).fit(X)
+        X_transformed = engine.transform(X)
+        if len(engine.columns_) == 1:
+            # a single series keeps the short 'lag_<k>' names
+            X_transformed.columns = list(X.columns) + [
+                f'lag_{k}' for k in engine.lags_]
         return X_transformed
 
 
@@ -3984,9 +4489,7 @@ class DifferencingTransformer(BaseEstimator, TransformerMixin):
             DataFrame with differenced data to make it stationary.
 
         """
-        X = build_data_if (X, to_frame =True, input_name ='dt', force=True, 
-                           raise_warning='mute')
-        return X.diff(periods=self.periods)
+        return _ts_features(X, 'dt', diffs=self.periods)
 
 
 
@@ -4077,9 +4580,8 @@ class MovingAverageTransformer(BaseEstimator, TransformerMixin):
             DataFrame with the moving average of each column.
 
         """
-        X = build_data_if(X, to_frame =True, imput_name ='mav', force=True, 
-                          raise_warning='silence')
-        return X.rolling(window=self.window).mean()
+        return _ts_features(X, 'mav', windows=self.window, 
+                            window_stats='mean')
 
 
 
@@ -4156,9 +4658,7 @@ class CumulativeSumTransformer(BaseEstimator, TransformerMixin):
             DataFrame with the cumulative sum of each column.
 
         """
-        X = build_data_if(X, to_frame =True, imput_name ='cs', force=True, 
-                          raise_warning='silence')
-        return X.cumsum()
+        return _ts_features(X, 'cs', cumsum=True)
 
 class SeasonalDecomposeTransformer(BaseEstimator, TransformerMixin):
     """
@@ -5327,6 +5827,10 @@ class ImageBatchLoader(BaseEstimator, TransformerMixin):
     Load images in batches from a directory, useful when
     dealing with large datasets.
 
+    The images are decoded by a pool of threads or processes while the 
+    previous batches are consumed: up to `prefetch` batches are in flight, 
+    so reading and decoding overlap with the processing of the caller.
+
     Parameters
     ----------
     batch_size : int
@@ -5335,9 +5839,39 @@ class ImageBatchLoader(BaseEstimator, TransformerMixin):
     directory : str
         Path to the directory containing images.
 
+    n_workers : int, optional
+        Number of workers decoding the images. Defaults to the number of 
+        processors, ``1`` decodes in the calling thread without a pool.
+
+    executor : {'thread', 'process'}, default='thread'
+        Kind of pool. The decoders of matplotlib and scikit-image release 
+        the GIL for most of their work, so threads are usually enough; 
+        processes suit the pure Python decoders.
+
+    prefetch : int, default=2
+        Number of batches submitted ahead of the one being consumed.
+
+    output_size : tuple of int, optional
+        If given, each image is resized with :class:`ImageResizer` as soon 
+        as it is decoded, so the batches can be stacked whatever the size 
+        of the source images.
+
+    normalize : bool, default=False
+        Whether to scale the pixels to [0, 1] with :class:`ImageNormalizer`.
+
+    mmap_path : str, optional
+        Path of a ``.npy`` file holding ``prefetch + 2`` batch slots. The 
+        workers write the decoded images straight into the memory-mapped 
+        slots and the yielded batches are views of them, so no batch is 
+        copied or sent back from the workers. A yielded batch stays valid 
+        while the next one is consumed: its slot is only rewritten once the 
+        batch after that is requested. Copy a batch that must live longer.
+
     Examples
     --------
-    >>> loader = ImageBatchLoader(batch_size=32, directory='path/to/images')
+    >>> loader = ImageBatchLoader(batch_size=32, directory='path/to/images',
+    ...                           n_workers=8, output_size=(224, 224), 
+    ...                           normalize=True)
     >>> for batch in loader.transform():
     >>>     process(batch)
 
@@ -5364,9 +5898,25 @@ class ImageBatchLoader(BaseEstimator, TransformerMixin):
 
     """
     
-    def __init__(self, batch_size, directory):
+    def __init__(
+        self, 
+        batch_size, 
+        directory, 
+        n_workers=None, 
+        executor='thread', 
+        prefetch=2, 
+        output_size=None, 
+        normalize=False, 
+        mmap_path=None, 
+        ):
         self.batch_size = batch_size
         self.directory = directory
+        self.n_workers = n_workers 
+        self.executor = executor 
+        self.prefetch = prefetch 
+        self.output_size = output_size 
+        self.normalize = normalize 
+        self.mmap_path = mmap_path 
         
     def fit(self, X, y=None):
         """
@@ -5394,8 +5944,9 @@ class ImageBatchLoader(BaseEstimator, TransformerMixin):
 
         Parameters
         ----------
-        X : None, optional
-            Ignored. This parameter is not used.
+        X : list of str, optional
+            Paths of the images to load, in place of the files of 
+            `directory`.
 
         y : None, optional
             Ignored. This parameter is not used.
@@ -5413,12 +5964,91 @@ class ImageBatchLoader(BaseEstimator, TransformerMixin):
         read using the 'plt.imread' function from the 'matplotlib' library.
 
         """
-        image_files = [os.path.join(self.directory, fname) 
-                       for fname in sorted(os.listdir(self.directory))]
-        for i in range(0, len(image_files), self.batch_size):
-            batch_files = image_files[i:i + self.batch_size]
-            batch_images = [plt.imread(file) for file in batch_files]
-            yield np.array(batch_images)
+        if self.executor not in ('thread', 'process'):
+            raise ValueError("executor expects 'thread' or 'process'; got"
+                             f" {self.executor!r}.")
+        if self.output_size is not None: 
+            import_optional_dependency('skimage', extra=EMSG)
+        if X is not None: 
+            image_files = [str(file) for file in X]
+        else: 
+            image_files = [os.path.join(self.directory, fname) 
+                           for fname in sorted(os.listdir(self.directory))
+                           if os.path.isfile(os.path.join(self.directory, fname))]
+        if not image_files: 
+            return 
+        batches = [image_files[i:i + self.batch_size] 
+                   for i in range(0, len(image_files), self.batch_size)]
+        prefetch = max(int(self.prefetch), 0)
+        # the batches in flight, the batch being consumed and the previous 
+        # one each own a slot 
+        n_slots = prefetch + 2 
+        
+        buffer = out = None 
+        if self.mmap_path is not None: 
+            # the first image gives the shape of the slots
+            first = _decode_image(image_files[0], self.output_size, 
+                                  self.normalize)
+            buffer = np.lib.format.open_memmap(
+                self.mmap_path, mode='w+', dtype=first.dtype, 
+                shape=(n_slots, self.batch_size) + first.shape)
+            # processes reopen the file, threads share the mapping
+            out = self.mmap_path if self.executor == 'process' else buffer 
+            
+        n_workers = self.n_workers or os.cpu_count() or 1 
+        if n_workers == 1: 
+            for slot, files in enumerate(batches):
+                yield self._collect(
+                    [_decode_image(file, self.output_size, self.normalize, 
+                                   out, slot % n_slots, i) 
+                     for i, file in enumerate(files)], buffer, slot % n_slots)
+            return 
+        
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+        Executor = (ThreadPoolExecutor if self.executor == 'thread' 
+                    else ProcessPoolExecutor)
+        pool = Executor(max_workers=n_workers)
+        pending = deque()
+        try: 
+            for slot, files in enumerate(batches):
+                pending.append([pool.submit(
+                    _decode_image, file, self.output_size, self.normalize, 
+                    out, slot % n_slots, i) 
+                    for i, file in enumerate(files)])
+                if len(pending) > prefetch: 
+                    yield self._collect(
+                        [f.result() for f in pending.popleft()], buffer, 
+                        (slot - prefetch) % n_slots)
+            first_slot = len(batches) - len(pending)
+            for k, futures in enumerate(list(pending)):
+                pending.popleft()
+                yield self._collect([f.result() for f in futures], buffer, 
+                                    (first_slot + k) % n_slots)
+        finally: 
+            # stop decoding when the consumer leaves early
+            pool.shutdown(wait=True, cancel_futures=True)
+            
+    def _collect(self, images, buffer, slot):
+        """Stack the decoded images of a batch, or return its slot."""
+        if buffer is None: 
+            return np.array(images)
+        return buffer[slot, :len(images)]
+
+def _decode_image(file, output_size=None, normalize=False, out=None, 
+                  slot=None, index=None):
+    """Read, resize and normalize an image. When `out` (a memory-mapped 
+    array or the path of one) is given, the image is written to 
+    ``out[slot, index]`` and None is returned."""
+    image = plt.imread(file)
+    if output_size is not None: 
+        image = ImageResizer(output_size).transform(image)
+    if normalize: 
+        image = ImageNormalizer().transform(image)
+    if out is None: 
+        return image 
+    if isinstance(out, str): 
+        out = np.load(out, mmap_mode='r+')
+    out[slot, index] = image 
 
 
 
@@ -42,7 +42,7 @@ KEYWORDS = "machine learning, algorithm, processing"
 PACKAGE_DATA = {
     'gofast': [
         'tools/_openmp_helpers.pxd',
-        'geo/espg.npy',
+        'geo/epsg_*.npy',
         'etc/*',
         '_gflog.yml',
         'gflogfiles/*.txt',